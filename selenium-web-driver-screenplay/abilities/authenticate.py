@@ -0,0 +1,10 @@
+from abilities.call_the_api import CallTheApi
+
+class Authenticate(CallTheApi):
+
+    @staticmethod
+    def granted(api=None):
+        return Authenticate(api)
+
+    def log_in(self, email: str, password: str):
+        return self.request("POST", "/auth/login", json={"email": email, "password": password})
@@ -0,0 +1,74 @@
+from screenpy import Forgettable
+from screenpy_selenium.abilities import BrowseTheWeb
+from selenium.common.exceptions import StaleElementReferenceException
+
+
+class CacheElements(Forgettable):
+    """Reuse WebElement handles per locator until they go stale.
+
+    Each handle is stored with the URL it was found on and a different
+    `current_url` counts as a miss, so navigations that skip `clear()`
+    (screenpy's `Open`, a click on a router link) do not reuse old handles.
+    An element that went stale anyway (Angular re-rendered it) is looked up
+    again and the operation retried once.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._elements = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    @staticmethod
+    def using(driver) -> "CacheElements":
+        return CacheElements(driver)
+
+    def find(self, locator):
+        key = tuple(locator)
+        url = self.driver.current_url
+        cached = self._elements.get(key)
+        if cached is not None and cached[0] == url:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        element = self.driver.find_element(*key)
+        self._elements[key] = (url, element)
+        return element
+
+    def remember(self, locator, element):
+        """Store a handle found elsewhere (e.g. by an explicit wait)."""
+        self._elements[tuple(locator)] = (self.driver.current_url, element)
+
+    def use(self, locator, operation):
+        """Return `operation(element)`, re-resolving the element once if it is stale."""
+        try:
+            return operation(self.find(locator))
+        except StaleElementReferenceException:
+            self.stale += 1
+            self._elements.pop(tuple(locator), None)
+            return operation(self.find(locator))
+
+    def clear(self):
+        self._elements.clear()
+
+    def forget(self):
+        self.clear()
+
+    def __repr__(self):
+        return f"<Ability: CacheElements hits={self.hits} misses={self.misses} stale={self.stale}>"
+
+
+def with_element(actor, locator, operation):
+    """Run `operation` on the element at `locator`, through the actor's cache if it has one."""
+    if actor.has_ability_to(CacheElements):
+        return actor.ability_to(CacheElements).use(locator, operation)
+    browser = actor.ability_to(BrowseTheWeb).browser
+    return operation(browser.find_element(*tuple(locator)))
+
+
+def forget_cached_elements(actor):
+    """Drop cached handles after a navigation (the old document's elements are gone)."""
+    if actor.has_ability_to(CacheElements):
+        actor.ability_to(CacheElements).clear()
@@ -0,0 +1,32 @@
+from screenpy import Forgettable
+from screenpy.exceptions import UnableToPerform
+
+
+class CallTheApi(Forgettable):
+    """Base for abilities that can also drive the NestJS endpoints directly.
+
+    `api` is any client with `request(method, path, endpoint=..., **kwargs)`:
+    the synchronous `harness.api_client.StickifyApi` or the asyncio client in
+    `load/` (its calls return coroutines to await). Without a client the
+    ability only marks what the actor may do through the UI.
+    """
+
+    def __init__(self, api=None):
+        self.api = api
+
+    @staticmethod
+    def using(api) -> "CallTheApi":
+        return CallTheApi(api)
+
+    def request(self, method: str, path: str, endpoint: str = None, **kwargs):
+        """Send a request; `endpoint` is the route template used to group latencies."""
+        if self.api is None:
+            raise UnableToPerform(f"{self!r} no tiene cliente HTTP (actor solo de navegador)")
+        return self.api.request(method, path, endpoint=endpoint or f"{method} {path}", **kwargs)
+
+    def forget(self):
+        # El cliente pertenece a quien lo creó (fixture, generador de carga...)
+        pass
+
+    def __repr__(self):
+        return f"<Ability: {type(self).__name__}>"
@@ -1,13 +1,37 @@
-from screenpy import Forgettable
+from abilities.call_the_api import CallTheApi
 
-class FollowUsers(Forgettable):
+class FollowUsers(CallTheApi):
 
     @staticmethod
-    def granted():
-        return FollowUsers()
+    def granted(api=None):
+        return FollowUsers(api)
 
-    def forget(self):
-        pass
+    def follow(self, user_id: str, target_email: str, follow: bool = True):
+        return self.request(
+            "PUT",
+            f"/users/{user_id}/follow",
+            endpoint="PUT /users/:id/follow",
+            json={"targetEmail": target_email, "follow": follow},
+        )
 
-    def __repr__(self):
-        return "<Ability: FollowUsers>"
+    def is_following(self, user_id: str, target_email: str):
+        """{"following": bool} from a single lookup of the follow edge."""
+        return self.request(
+            "GET", f"/users/{user_id}/following/{target_email}", endpoint="GET /users/:id/following/:email"
+        )
+
+    def followers(self, user_id: str, limit: int = None, cursor: str = None):
+        """One page of the users that follow `user_id`: {"items", "nextCursor"}, newest first."""
+        return self.request(
+            "GET", f"/users/{user_id}/followers", endpoint="GET /users/:id/followers", params=_page(limit, cursor)
+        )
+
+    def following(self, user_id: str, limit: int = None, cursor: str = None):
+        """One page of the users `user_id` follows: {"items", "nextCursor"}, newest first."""
+        return self.request(
+            "GET", f"/users/{user_id}/following", endpoint="GET /users/:id/following", params=_page(limit, cursor)
+        )
+
+
+def _page(limit, cursor) -> dict:
+    return {key: value for key, value in (("limit", limit), ("cursor", cursor)) if value is not None}
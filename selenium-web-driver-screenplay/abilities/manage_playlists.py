@@ -1,13 +1,16 @@
-from screenpy import Forgettable
+from abilities.call_the_api import CallTheApi
 
-class ManagePlaylists(Forgettable):
+class ManagePlaylists(CallTheApi):
 
     @staticmethod
-    def granted():
-        return ManagePlaylists()
+    def granted(api=None):
+        return ManagePlaylists(api)
 
-    def forget(self):
-        pass
+    def playlists(self):
+        return self.request("GET", "/playlists")
 
-    def __repr__(self):
-        return "<Ability: ManagePlaylists>"
+    def of_user(self, user_email: str):
+        return self.request("GET", f"/playlists/user/{user_email}", endpoint="GET /playlists/user/:userId")
+
+    def create(self, playlist: dict):
+        return self.request("POST", "/playlists", json=playlist)
@@ -0,0 +1,96 @@
+import json
+import time
+from collections import deque
+
+from screenpy import Forgettable
+
+
+# Conexiones de larga duración que nunca "terminan"
+IGNORED_RESOURCE_TYPES = {"EventSource", "WebSocket"}
+# Una petición sin respuesta tras este tiempo se da por perdida (pestaña cerrada, etc.)
+MAX_REQUEST_AGE_SECONDS = 60
+# Últimos eventos Network que se conservan para el FlightRecorder (HAR al fallar una prueba)
+EVENT_HISTORY = 2000
+RECORDED_EVENTS = {
+    "Network.requestWillBeSent", "Network.responseReceived", "Network.loadingFinished", "Network.loadingFailed",
+}
+
+
+class MonitorNetwork(Forgettable):
+    """Track in-flight requests from the Chrome DevTools Protocol Network events.
+
+    Chrome records the events in its "performance" log (enabled with the
+    goog:loggingPrefs capability); every poll drains that log and updates the
+    set of requests that have started but not finished or failed.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.in_flight = {}
+        self.finished = 0
+        self.failed = 0
+        # Para ResourceBlocker: bytes de lo descargado y lo que Chrome bloqueó
+        self.sizes = {}
+        self.blocked = []
+        self.events = deque(maxlen=EVENT_HISTORY)
+        self.last_activity = time.monotonic()
+        # Descarta lo que dejó la prueba anterior en un navegador reutilizado
+        self._drain()
+
+    @staticmethod
+    def using(driver) -> "MonitorNetwork":
+        return MonitorNetwork(driver)
+
+    def poll(self) -> int:
+        """Process pending DevTools events and return the number of requests in flight."""
+        now = time.monotonic()
+        for message in self._drain():
+            method = message.get("method")
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+            if method in RECORDED_EVENTS:
+                self.events.append(message)
+
+            if method == "Network.requestWillBeSent":
+                if params.get("type") in IGNORED_RESOURCE_TYPES:
+                    continue
+                self.in_flight[request_id] = (params["request"]["url"], now, params.get("type"))
+                self.last_activity = now
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                request = self.in_flight.pop(request_id, None)
+                if request is not None:
+                    self.last_activity = now
+                    url, _, resource_type = request
+                    if method == "Network.loadingFinished":
+                        self.finished += 1
+                        self.sizes[url] = (resource_type, params.get("encodedDataLength", 0))
+                    else:
+                        self.failed += 1
+                        if params.get("blockedReason"):
+                            self.blocked.append((url, resource_type))
+
+        for request_id, (_, started, _) in list(self.in_flight.items()):
+            if now - started > MAX_REQUEST_AGE_SECONDS:
+                del self.in_flight[request_id]
+        return len(self.in_flight)
+
+    def pending_requests(self) -> int:
+        return self.poll()
+
+    def pending_urls(self) -> list:
+        self.poll()
+        return [url for url, _, _ in self.in_flight.values()]
+
+    def quiet_for_ms(self) -> float:
+        """Milliseconds since the last request started or finished."""
+        return (time.monotonic() - self.last_activity) * 1000
+
+    def _drain(self) -> list:
+        return [json.loads(entry["message"])["message"] for entry in self.driver.get_log("performance")]
+
+    def forget(self):
+        # El navegador pertenece a BrowseTheWeb (o al pool): aquí solo se olvida el estado
+        self.in_flight.clear()
+
+    def __repr__(self):
+        return "<Ability: MonitorNetwork>"
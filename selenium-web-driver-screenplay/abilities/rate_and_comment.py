@@ -1,13 +1,36 @@
-from screenpy import Forgettable
+import time
 
-class RateAndComment(Forgettable):
+from abilities.call_the_api import CallTheApi
+
+class RateAndComment(CallTheApi):
 
     @staticmethod
-    def granted():
-        return RateAndComment()
+    def granted(api=None):
+        return RateAndComment(api)
+
+    def rate(self, username: str, track_id: int, rating: float):
+        """Rate a song; like the app, ratings are keyed by the user's username."""
+        return self.request("POST", "/ratings", json={"userId": username, "trackId": track_id, "rating": rating})
+
+    def rate_many(self, ratings):
+        """Upsert many ratings in one request; `ratings` is [{"userId", "trackId", "rating"}, ...]."""
+        return self.request("POST", "/ratings/batch", json={"ratings": list(ratings)})
+
+    def average(self, track_id: int):
+        return self.request("GET", "/ratings/average", params={"trackId": track_id})
+
+    def averages(self, track_ids):
+        """Averages of many tracks in one request: [{"trackId", "average", "count"}, ...]."""
+        return self.request(
+            "GET", "/ratings/averages", params={"trackIds": ",".join(str(track_id) for track_id in track_ids)}
+        )
 
-    def forget(self):
-        pass
+    def comment(self, username: str, track_id: int, text: str):
+        return self.request(
+            "POST",
+            "/comments",
+            json={"user": username, "trackId": track_id, "text": text, "date": int(time.time() * 1000)},
+        )
 
-    def __repr__(self):
-        return "<Ability: RateAndComment>"
+    def comments(self):
+        return self.request("GET", "/comments")
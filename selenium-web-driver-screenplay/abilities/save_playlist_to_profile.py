@@ -1,13 +1,15 @@
-from screenpy import Forgettable
+from abilities.call_the_api import CallTheApi
 
-class SavePlaylistToProfile(Forgettable):
+class SavePlaylistToProfile(CallTheApi):
 
     @staticmethod
-    def granted():
-        return SavePlaylistToProfile()
+    def granted(api=None):
+        return SavePlaylistToProfile(api)
 
-    def forget(self):
-        pass
+    def save(self, user_email: str, playlist_id: str):
+        return self.request("POST", "/user-saved-playlists", json={"userId": user_email, "playlistId": playlist_id})
 
-    def __repr__(self):
-        return "<Ability: SavePlaylistToProfile>"
+    def saved(self, user_email: str):
+        return self.request(
+            "GET", f"/user-saved-playlists/user/{user_email}/full", endpoint="GET /user-saved-playlists/user/:userId/full"
+        )
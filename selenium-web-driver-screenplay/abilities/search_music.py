@@ -1,13 +1,20 @@
-from screenpy import Forgettable
+from abilities.call_the_api import CallTheApi
 
-class SearchMusic(Forgettable):
+class SearchMusic(CallTheApi):
 
     @staticmethod
-    def granted():
-        return SearchMusic()
+    def granted(api=None):
+        return SearchMusic(api)
 
-    def forget(self):
-        pass
+    def songs(self):
+        return self.request("GET", "/songs")
 
-    def __repr__(self):
-        return "<Ability: SearchMusic>"
+    def songs_page(self, limit: int = 50, cursor: str = None, q: str = None, artists=(), genres=(), year=None):
+        """One keyset page of GET /songs: {"items": [...], "nextCursor": ... or None}."""
+        params = [("limit", str(limit))]
+        params += [(name, str(value)) for name, value in (("cursor", cursor), ("q", q), ("year", year)) if value]
+        params += [("artist", artist) for artist in artists] + [("genre", genre) for genre in genres]
+        return self.request("GET", "/songs", endpoint="GET /songs?page", params=params)
+
+    def song(self, track_id: int):
+        return self.request("GET", f"/songs/{track_id}", endpoint="GET /songs/:trackId")
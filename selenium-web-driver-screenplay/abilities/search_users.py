@@ -1,13 +1,13 @@
-from screenpy import Forgettable
+from abilities.call_the_api import CallTheApi
 
-class SearchUsers(Forgettable):
+class SearchUsers(CallTheApi):
 
     @staticmethod
-    def granted():
-        return SearchUsers()
+    def granted(api=None):
+        return SearchUsers(api)
 
-    def forget(self):
-        pass
+    def users(self):
+        return self.request("GET", "/users")
 
-    def __repr__(self):
-        return "<Ability: SearchUsers>"
+    def by_email(self, email: str):
+        return self.request("GET", f"/users/by-email/{email}", endpoint="GET /users/by-email/:email")
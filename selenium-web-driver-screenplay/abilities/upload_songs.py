@@ -1,13 +1,10 @@
-from screenpy import Forgettable
+from abilities.call_the_api import CallTheApi
 
-class UploadSongs(Forgettable):
+class UploadSongs(CallTheApi):
 
     @staticmethod
-    def granted():
-        return UploadSongs()
+    def granted(api=None):
+        return UploadSongs(api)
 
-    def forget(self):
-        pass
-
-    def __repr__(self):
-        return "<Ability: UploadSongs>"
+    def upload(self, song: dict):
+        return self.request("POST", "/songs", json=song)
@@ -1,19 +1,19 @@
-from screenpy import Action
-from screenpy_selenium.abilities import BrowseTheWeb
-from selenium.webdriver.common.by import By
+from screenpy import Actor
+from screenpy.pacing import beat
 
-from screenpy_selenium.actions import Visit, Click
+from abilities.cache_elements import with_element
 
 
-class EnterText(Action):
+class EnterText:
 
     def __init__(self, text: str, locator: tuple):
         self.text = text
         self.locator = locator
 
-    def perform_as(self, actor):
-        browser = actor.ability_to(BrowseTheWeb)
-        element = browser.driver.find_element(*self.locator)
-        element.clear()
-        element.send_keys(self.text)
+    @beat("{} escribe '{text}' en {locator}")
+    def perform_as(self, actor: Actor) -> None:
+        def enter(element):
+            element.clear()
+            element.send_keys(self.text)
 
+        with_element(actor, self.locator, enter)
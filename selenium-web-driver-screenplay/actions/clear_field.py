@@ -1,12 +1,13 @@
-from screenpy import Action
-from screenpy_selenium.abilities import BrowseTheWeb
+from screenpy import Actor
+from screenpy.pacing import beat
 
-class ClearField(Action):
+from abilities.cache_elements import with_element
+
+class ClearField:
 
     def __init__(self, locator: tuple):
         self.locator = locator
 
-    def perform_as(self, actor):
-        browser = actor.ability_to(BrowseTheWeb)
-        element = browser.driver.find_element(*self.locator)
-        element.clear()
+    @beat("{} limpia el campo {locator}")
+    def perform_as(self, actor: Actor) -> None:
+        with_element(actor, self.locator, lambda element: element.clear())
@@ -0,0 +1,28 @@
+from screenpy import Actor
+from screenpy.pacing import beat
+from screenpy_selenium.actions import Click
+
+from actions.forget_session import ForgetSession
+
+
+class ClickAndForgetSession:
+    """Click a button that changes the current session (logout, premium, follow) and mark the cached one dirty.
+
+    The account is read from localStorage before the click, since logging out
+    removes it.
+    """
+
+    def __init__(self, target):
+        self.target = target
+
+    @staticmethod
+    def on(target) -> "ClickAndForgetSession":
+        return ClickAndForgetSession(target)
+
+    @beat("{} hace clic en {target} y descarta la sesión guardada")
+    def perform_as(self, the_actor: Actor) -> None:
+        email = ForgetSession.current_email(the_actor)
+        the_actor.attempts_to(Click.on(self.target), ForgetSession(email))
+
+    def __repr__(self):
+        return f"ClickAndForgetSession({self.target})"
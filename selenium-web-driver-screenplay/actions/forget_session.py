@@ -0,0 +1,42 @@
+from screenpy import Actor
+from screenpy.pacing import beat
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from actions.log_in_via_api import CURRENT_USER_KEY
+from harness.session_cache import SESSION_CACHE
+
+
+class ForgetSession:
+    """Mark a cached session as dirty (logout, premium toggle, follow changes...)."""
+
+    def __init__(self, email: str = None, cache=SESSION_CACHE):
+        self.email = email
+        self.cache = cache
+
+    @staticmethod
+    def of(account) -> "ForgetSession":
+        return ForgetSession(account.email)
+
+    @staticmethod
+    def of_the_current_user() -> "ForgetSession":
+        """Use the account stored by the front end in localStorage ('currentUser')."""
+        return ForgetSession()
+
+    @beat("{} descarta la sesión guardada")
+    def perform_as(self, the_actor: Actor) -> None:
+        email = self.email or self.current_email(the_actor)
+        if email:
+            self.cache.mark_dirty(email)
+
+    @staticmethod
+    def current_email(the_actor: Actor):
+        """Email of the user the front end keeps in localStorage (None after logout)."""
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        return browser.execute_script(
+            "const user = window.localStorage.getItem(arguments[0]);"
+            "return user ? JSON.parse(user).email : null;",
+            CURRENT_USER_KEY,
+        )
+
+    def __repr__(self):
+        return f"ForgetSession({self.email or 'current user'})"
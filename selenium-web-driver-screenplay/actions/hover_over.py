@@ -1,13 +1,16 @@
-from screenpy import Action
+from screenpy import Actor
+from screenpy.pacing import beat
 from screenpy_selenium.abilities import BrowseTheWeb
 from selenium.webdriver import ActionChains
 
-class HoverOver(Action):
+from abilities.cache_elements import with_element
+
+class HoverOver:
 
     def __init__(self, locator: tuple):
         self.locator = locator
 
-    def perform_as(self, actor):
-        browser = actor.ability_to(BrowseTheWeb)
-        element = browser.driver.find_element(*self.locator)
-        ActionChains(browser.driver).move_to_element(element).perform()
+    @beat("{} pasa el cursor sobre {locator}")
+    def perform_as(self, actor: Actor) -> None:
+        browser = actor.ability_to(BrowseTheWeb).browser
+        with_element(actor, self.locator, lambda element: ActionChains(browser).move_to_element(element).perform())
@@ -0,0 +1,75 @@
+import json
+import os
+
+from screenpy import Actor
+from screenpy.pacing import beat
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from abilities.cache_elements import forget_cached_elements
+from harness.api_client import default_api
+from harness.session_cache import SESSION_CACHE, StoredSession
+
+
+APP_URL = os.getenv("STICKIFY_APP_URL", "http://localhost:4200")
+
+# Mismas claves que usa AuthService en el front (stickify-front/src/app/services/auth.service.ts)
+TOKEN_KEY = "authToken"
+CURRENT_USER_KEY = "currentUser"
+
+# Recurso estático y liviano del origen de la app (stickify-front/public/robots.txt):
+# permite escribir en su localStorage sin arrancar Angular. No puede ser una imagen:
+# --block-resources las bloquea y la navegación acabaría en la página de error de Chrome.
+ORIGIN_STUB_PATH = "/robots.txt"
+
+
+class LogInViaApi:
+    """Log in through POST /auth/login and inject the JWT instead of using the form.
+
+    The resulting storage state is kept in the session cache, so later actors
+    of the same account restore it without calling the backend again.
+    """
+
+    def __init__(self, email: str, password: str, route: str = "/home", api=None, cache=SESSION_CACHE):
+        self.email = email
+        self.password = password
+        self.route = route
+        self.api = api or default_api()
+        self.cache = cache
+
+    @staticmethod
+    def as_(account) -> "LogInViaApi":
+        return LogInViaApi(account.email, account.password)
+
+    def and_open(self, route: str) -> "LogInViaApi":
+        self.route = route
+        return self
+
+    @beat("{} inicia sesión por API como {email} y abre {route}")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        forget_cached_elements(the_actor)
+        browser.get(f"{APP_URL}{ORIGIN_STUB_PATH}")
+
+        session = self.cache.get(self.email)
+        if session is None:
+            session = self._log_in(browser)
+            self.cache.put(self.email, session)
+            self.cache.logins += 1
+        else:
+            session.restore_into(browser)
+            self.cache.restores += 1
+
+        browser.get(f"{APP_URL}{self.route}")
+
+    def _log_in(self, browser) -> StoredSession:
+        response = self.api.login(self.email, self.password)
+        browser.execute_script(
+            "localStorage.setItem(arguments[0], arguments[1]);"
+            "localStorage.setItem(arguments[2], arguments[3]);",
+            TOKEN_KEY, response["token"],
+            CURRENT_USER_KEY, json.dumps(response["user"]),
+        )
+        return StoredSession.capture(browser, response["token"])
+
+    def __repr__(self):
+        return f"LogInViaApi({self.email}, {self.route})"
@@ -2,6 +2,8 @@ from screenpy import Actor
 from screenpy.pacing import beat
 from screenpy_selenium.actions import Visit
 
+from abilities.cache_elements import forget_cached_elements
+
 
 class OpenPage:
 
@@ -10,4 +12,5 @@ class OpenPage:
 
     @beat("{} abre la página {self.url}")
     def perform_as(self, the_actor: Actor) -> None:
+        forget_cached_elements(the_actor)
         the_actor.attempts_to(Visit.the_url(self.url))
@@ -1,15 +1,15 @@
 from selenium.webdriver.support.ui import Select
-from screenpy import Action
-from screenpy_selenium.abilities import BrowseTheWeb
+from screenpy import Actor
+from screenpy.pacing import beat
 
-class SelectFromDropdown(Action):
+from abilities.cache_elements import with_element
+
+class SelectFromDropdown:
 
     def __init__(self, locator: tuple, option_text: str):
         self.locator = locator
         self.option_text = option_text
 
-    def perform_as(self, actor):
-        browser = actor.ability_to(BrowseTheWeb)
-        element = browser.driver.find_element(*self.locator)
-        select = Select(element)
-        select.select_by_visible_text(self.option_text)
+    @beat("{} selecciona '{option_text}' en {locator}")
+    def perform_as(self, actor: Actor) -> None:
+        with_element(actor, self.locator, lambda element: Select(element).select_by_visible_text(self.option_text))
@@ -0,0 +1,34 @@
+from screenpy import Actor
+from screenpy.pacing import aside, beat
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from harness.polling import poll_with_backoff
+
+
+# Sin testabilities (build de producción) basta con que el documento esté cargado
+ANGULAR_STABLE_SCRIPT = """
+if (document.readyState !== 'complete') { return false; }
+if (!window.getAllAngularTestabilities) { return true; }
+return window.getAllAngularTestabilities().every(testability => testability.isStable());
+"""
+
+
+class WaitForAngularStable:
+    """Wait until Angular reports no pending macrotasks (zone.js testability)."""
+
+    def __init__(self, timeout: float = 15):
+        self.timeout = timeout
+        self.waited = None
+
+    @beat("{} espera a que Angular esté estable")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        self.waited = poll_with_backoff(
+            lambda: browser.execute_script(ANGULAR_STABLE_SCRIPT),
+            self.timeout,
+            "Angular estable",
+        )
+        aside(f"Angular estable tras {self.waited * 1000:.0f} ms")
+
+    def __repr__(self):
+        return f"WaitForAngularStable(timeout={self.timeout})"
@@ -1,16 +1,22 @@
-from screenpy import Action
+from screenpy import Actor
+from screenpy.pacing import beat
 from screenpy_selenium.abilities import BrowseTheWeb
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-class WaitForElement(Action):
+from abilities.cache_elements import CacheElements
+
+class WaitForElement:
 
     def __init__(self, locator: tuple, timeout: int = 10):
         self.locator = locator
         self.timeout = timeout
 
-    def perform_as(self, actor):
-        browser = actor.ability_to(BrowseTheWeb)
-        WebDriverWait(browser.driver, self.timeout).until(
-            EC.visibility_of_element_located(self.locator)
+    @beat("{} espera a que {locator} sea visible")
+    def perform_as(self, actor: Actor) -> None:
+        browser = actor.ability_to(BrowseTheWeb).browser
+        element = WebDriverWait(browser, self.timeout).until(
+            EC.visibility_of_element_located(tuple(self.locator))
         )
+        if actor.has_ability_to(CacheElements):
+            actor.ability_to(CacheElements).remember(self.locator, element)
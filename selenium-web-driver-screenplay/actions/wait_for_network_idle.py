@@ -0,0 +1,48 @@
+from screenpy import Actor
+from screenpy.pacing import aside, beat
+from screenpy_selenium.abilities import BrowseTheWeb
+from selenium.common.exceptions import TimeoutException
+
+from abilities.monitor_network import MonitorNetwork
+from harness.network_tracker import network_state
+from harness.polling import poll_with_backoff
+
+
+class WaitForNetworkIdle:
+    """Wait until no request is pending and the network has been quiet for `quiet_ms`.
+
+    Actors with MonitorNetwork are answered from the DevTools Network events,
+    which also see images, scripts and requests made before the page loaded;
+    other actors fall back to the in-page XHR/fetch tracker.
+    """
+
+    def __init__(self, quiet_ms: int = 500, timeout: float = 30):
+        self.quiet_ms = quiet_ms
+        self.timeout = timeout
+        self.waited = None
+
+    @beat("{} espera a que no haya peticiones pendientes ({quiet_ms} ms de calma)")
+    def perform_as(self, the_actor: Actor) -> None:
+        if the_actor.has_ability_to(MonitorNetwork):
+            monitor = the_actor.ability_to(MonitorNetwork)
+
+            def is_idle():
+                return monitor.pending_requests() == 0 and monitor.quiet_for_ms() >= self.quiet_ms
+        else:
+            browser = the_actor.ability_to(BrowseTheWeb).browser
+
+            def is_idle():
+                state = network_state(browser)
+                return state["pending"] == 0 and state["quietMs"] >= self.quiet_ms
+
+        try:
+            self.waited = poll_with_backoff(is_idle, self.timeout, "Red inactiva")
+        except TimeoutException:
+            if the_actor.has_ability_to(MonitorNetwork):
+                pending = the_actor.ability_to(MonitorNetwork).pending_urls()
+                raise TimeoutException(f"Red inactiva no se cumplió en {self.timeout} s; pendientes: {pending}")
+            raise
+        aside(f"Red inactiva tras {self.waited * 1000:.0f} ms")
+
+    def __repr__(self):
+        return f"WaitForNetworkIdle(quiet_ms={self.quiet_ms}, timeout={self.timeout})"
@@ -0,0 +1,34 @@
+from screenpy import Actor
+from screenpy.pacing import aside, beat
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from abilities.cache_elements import forget_cached_elements
+from harness.polling import poll_with_backoff
+
+
+class WaitForRoute:
+    """Wait until the Angular router lands on a URL containing `path`."""
+
+    def __init__(self, path: str, timeout: float = 10):
+        self.path = path
+        self.timeout = timeout
+        self.waited = None
+
+    @staticmethod
+    def to(path: str) -> "WaitForRoute":
+        return WaitForRoute(path)
+
+    @beat("{} espera a que la ruta cambie a {path}")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        self.waited = poll_with_backoff(
+            lambda: self.path in browser.current_url,
+            self.timeout,
+            f"Ruta {self.path}",
+        )
+        # El router destruye los componentes de la ruta anterior
+        forget_cached_elements(the_actor)
+        aside(f"Ruta {self.path} tras {self.waited * 1000:.0f} ms")
+
+    def __repr__(self):
+        return f"WaitForRoute({self.path})"
@@ -0,0 +1,30 @@
+from screenpy import Actor
+from screenpy.pacing import aside, beat
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from harness.polling import poll_with_backoff
+
+
+# SweetAlert2 quita .swal2-container del DOM cuando termina la animación de cierre
+SWEET_ALERT_OPEN_SCRIPT = "return document.querySelector('.swal2-container') !== null;"
+
+
+class WaitForSweetAlertToClose:
+    """Wait until no SweetAlert2 modal is left in the page."""
+
+    def __init__(self, timeout: float = 10):
+        self.timeout = timeout
+        self.waited = None
+
+    @beat("{} espera a que se cierre el SweetAlert")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        self.waited = poll_with_backoff(
+            lambda: not browser.execute_script(SWEET_ALERT_OPEN_SCRIPT),
+            self.timeout,
+            "SweetAlert cerrado",
+        )
+        aside(f"SweetAlert cerrado tras {self.waited * 1000:.0f} ms")
+
+    def __repr__(self):
+        return f"WaitForSweetAlertToClose(timeout={self.timeout})"
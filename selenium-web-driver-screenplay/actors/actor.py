@@ -1,9 +1,14 @@
+import os
+
 from screenpy import Actor
 from screenpy_selenium.abilities import BrowseTheWeb
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 
+from harness.browser_factory import create_browser
+from harness.resource_blocking import ResourceBlocker, profile_named
+
+from abilities.cache_elements import CacheElements
+from abilities.monitor_network import MonitorNetwork
+from abilities.authenticate import Authenticate
 from abilities.manage_playlists import ManagePlaylists
 from abilities.upload_songs import UploadSongs
 from abilities.rate_and_comment import RateAndComment
@@ -13,48 +18,61 @@ from abilities.search_users import SearchUsers
 from abilities.save_playlist_to_profile import SavePlaylistToProfile
 
 
-def _create_browser():
-    options = Options()
-    options.add_argument("--headless=new")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--window-size=1920,1080")
+# Perfil de harness.resource_blocking: off, lean o aggressive
+BLOCKING_PROFILE = os.getenv("STICKIFY_BLOCK_RESOURCES", "lean")
 
-    service = Service()
-    driver = webdriver.Chrome(service=service, options=options)
+
+def _create_browser(blocking_profile: str = BLOCKING_PROFILE):
+    # Perfil de navegador: STICKIFY_BROWSER_PROFILE (harness/browser_factory.py)
+    driver = create_browser()
+    ResourceBlocker(profile_named(blocking_profile)).apply(driver)
     return driver
 
 
-def create_standard_user() -> Actor:
+def _browser_abilities():
     browser = _create_browser()
+    return [
+        BrowseTheWeb.using(browser),
+        MonitorNetwork.using(browser),
+        CacheElements.using(browser),
+    ]
+
+
+def create_standard_user(api=None, with_browser: bool = True, name: str = "StandardUser") -> Actor:
+    """Standard user; with `api` its abilities call the backend directly.
+
+    `with_browser=False` skips Chrome entirely (API-only actors for load tests).
+    """
+    browser_abilities = _browser_abilities() if with_browser else []
     return (
-        Actor.named("StandardUser")
+        Actor.named(name)
         .who_can(
-            BrowseTheWeb.using(browser),
-            RateAndComment.granted(),
-            FollowUsers.granted(),
-            SearchMusic.granted(),
-            SearchUsers.granted(),
+            *browser_abilities,
+            Authenticate.granted(api),
+            RateAndComment.granted(api),
+            FollowUsers.granted(api),
+            SearchMusic.granted(api),
+            SearchUsers.granted(api),
         )
     )
 
 
-def create_premium_user() -> Actor:
-    browser = _create_browser()
+def create_premium_user(api=None, with_browser: bool = True, name: str = "PremiumUser") -> Actor:
+    browser_abilities = _browser_abilities() if with_browser else []
     return (
-        Actor.named("PremiumUser")
+        Actor.named(name)
         .who_can(
-            BrowseTheWeb.using(browser),
-            ManagePlaylists.granted(),
-            RateAndComment.granted(),
-            FollowUsers.granted(),
-            SearchMusic.granted(),
-            SearchUsers.granted(),
-            SavePlaylistToProfile.granted(),
-            UploadSongs.granted(),  # habilidad exclusiva
+            *browser_abilities,
+            Authenticate.granted(api),
+            ManagePlaylists.granted(api),
+            RateAndComment.granted(api),
+            FollowUsers.granted(api),
+            SearchMusic.granted(api),
+            SearchUsers.granted(api),
+            SavePlaylistToProfile.granted(api),
+            UploadSongs.granted(api),  # habilidad exclusiva
         )
     )
 
 def create_actor_named(name: str) -> Actor:
-    browser = _create_browser()
-    return Actor.named(name).who_can(BrowseTheWeb.using(browser))
+    return Actor.named(name).who_can(*_browser_abilities())
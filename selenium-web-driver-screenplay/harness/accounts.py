@@ -0,0 +1,71 @@
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from harness.seeding import make_playlist
+
+
+@dataclass(frozen=True)
+class Account:
+    username: str
+    email: str
+    password: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TestAccounts:
+    """Usuarios con los que la suite inicia sesión o interactúa."""
+
+    __test__ = False  # no es una clase de pruebas para pytest
+
+    listener: Account
+    follow_target: Account
+    playlist_owner: Account
+
+
+SHARED_ACCOUNTS = TestAccounts(
+    listener=Account("pol", "pol@correo.com", "pol123"),
+    # solo se usa como destino de "seguir", nunca inicia sesión
+    follow_target=Account("poorpol", "poorpol@correo.com"),
+    playlist_owner=Account("testuserplaylist3", "testuserplaylist3@correo.com", "testuserplaylist3"),
+)
+
+WORKER_PASSWORD = "Worker123!"
+PLAYLISTS_PER_OWNER = 2
+
+
+def for_worker(worker_id: str, base: TestAccounts = SHARED_ACCOUNTS) -> TestAccounts:
+    """Copia propia de cada cuenta para un worker de xdist (gw0, gw1...)."""
+
+    def derive(account: Account) -> Account:
+        local, domain = account.email.split("@")
+        return replace(
+            account,
+            username=f"{account.username}_{worker_id}",
+            email=f"{local}.{worker_id}@{domain}",
+            password=WORKER_PASSWORD,
+        )
+
+    return TestAccounts(
+        listener=derive(base.listener),
+        follow_target=derive(base.follow_target),
+        playlist_owner=derive(base.playlist_owner),
+    )
+
+
+def provision(seeder, accounts: TestAccounts, run_id: str) -> TestAccounts:
+    """Crea las cuentas que faltan y las deja en un estado conocido a través de la API."""
+    # seeder.teardown() deshace todo lo que se crea o cambia aquí
+
+    listener, _, _ = seeder.users(accounts.listener, accounts.follow_target, accounts.playlist_owner)
+
+    owner = accounts.playlist_owner
+    existing = {playlist["id"] for playlist in seeder.api.user_playlists(owner.email)}
+    seeder.playlists([
+        make_playlist(playlist_id, owner.email, name=f"E2E {run_id} playlist {number}")
+        for number in range(1, PLAYLISTS_PER_OWNER + 1)
+        if (playlist_id := f"e2e-{run_id}-{number}") not in existing
+    ])
+
+    # Las pruebas de seguir/dejar de seguir parten siempre de "no siguiendo"
+    seeder.follows(listener["id"], [accounts.follow_target.email], follow=False)
+    return accounts
@@ -0,0 +1,133 @@
+import json
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+API_URL = os.getenv("STICKIFY_API_URL", "http://localhost:3000/api")
+
+
+class StickifyApi:
+    """Cliente HTTP mínimo del backend de NestJS para preparar los datos de prueba."""
+
+    def __init__(self, base_url: str = API_URL, session: requests.Session = None, timeout: float = 15):
+        self.base_url = base_url.rstrip("/")
+        self.session = session or requests.Session()
+        self.timeout = timeout
+
+    def request(self, method: str, path: str, endpoint: str = None, **kwargs):
+        # `endpoint` (plantilla de ruta) solo lo usa el cliente de carga para agrupar latencias
+        response = self.session.request(
+            method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs
+        )
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    # --- AUTH ---
+    def login(self, email: str, password: str) -> dict:
+        return self.request("POST", "/auth/login", json={"email": email, "password": password})
+
+    def sign_up(self, username: str, email: str, password: str, premium: bool = False) -> dict:
+        return self.request(
+            "POST",
+            "/auth/sign-up",
+            json={"username": username, "email": email, "password": password, "premium": premium},
+        )
+
+    # --- USERS ---
+    def find_user(self, user_id: str) -> dict:
+        return self.request("GET", f"/users/{user_id}")
+
+    def find_user_by_email(self, email: str):
+        return self.request("GET", f"/users/by-email/{email}")
+
+    def toggle_follow(self, user_id: str, target_email: str, follow: bool) -> dict:
+        return self.request(
+            "PUT", f"/users/{user_id}/follow", json={"targetEmail": target_email, "follow": follow}
+        )
+
+    def is_following(self, user_id: str, target_email: str) -> bool:
+        return self.request("GET", f"/users/{user_id}/following/{target_email}")["following"]
+
+    def followers(self, user_id: str, limit: int = None, cursor: str = None) -> dict:
+        """Una página de GET /users/:id/followers: {"items", "nextCursor"}."""
+        return self.request("GET", f"/users/{user_id}/followers", params=_page_params(limit, cursor))
+
+    def following(self, user_id: str, limit: int = None, cursor: str = None) -> dict:
+        """Una página de GET /users/:id/following: {"items", "nextCursor"}."""
+        return self.request("GET", f"/users/{user_id}/following", params=_page_params(limit, cursor))
+
+    def delete_user(self, user_id: str):
+        return self.request("DELETE", f"/users/{user_id}")
+
+    # --- SONGS ---
+    def create_songs_batch(self, songs: list) -> list:
+        """POST /songs/batch; devuelve las canciones que guardó el backend."""
+        response = self.request("POST", "/songs/batch", json={"songs": songs})
+        if not response.get("success"):
+            raise RuntimeError(f"POST /songs/batch falló: {response.get('error')}")
+        return response["data"]
+
+    def import_songs(self, songs) -> dict:
+        """POST /songs/import en NDJSON, enviado en streaming; devuelve el resumen por bloques."""
+        lines = (json.dumps(song).encode("utf-8") + b"\n" for song in songs)
+        return self.request("POST", "/songs/import", data=lines, headers={"Content-Type": "application/x-ndjson"})
+
+    def delete_song(self, track_id: int):
+        return self.request("DELETE", f"/songs/{track_id}")
+
+    # --- RATINGS ---
+    def rate(self, user_id: str, track_id: int, rating: float) -> dict:
+        return self.request("POST", "/ratings", json={"userId": user_id, "trackId": track_id, "rating": rating})
+
+    def rate_many(self, ratings: list) -> dict:
+        """POST /ratings/batch con [{"userId", "trackId", "rating"}, ...]; devuelve {"received", "upserted"}."""
+        return self.request("POST", "/ratings/batch", json={"ratings": ratings})
+
+    def user_ratings(self, user_id: str) -> list:
+        return self.request("GET", f"/ratings/user/{user_id}", endpoint="GET /ratings/user/:userId")
+
+    def delete_rating(self, user_id: str, track_id: int):
+        return self.request("DELETE", f"/ratings/{user_id}/{track_id}")
+
+    # --- PLAYLISTS ---
+    def user_playlists(self, user_id: str) -> list:
+        return self.request("GET", f"/playlists/user/{user_id}")
+
+    def create_playlist(self, playlist: dict) -> dict:
+        return self.request("POST", "/playlists", json=playlist)
+
+    def delete_playlist(self, playlist_id: str):
+        return self.request("DELETE", f"/playlists/{playlist_id}")
+
+    def close(self):
+        self.session.close()
+
+    def __repr__(self):
+        return f"<StickifyApi {self.base_url}>"
+
+
+def _page_params(limit: int = None, cursor: str = None) -> dict:
+    return {key: value for key, value in (("limit", limit), ("cursor", cursor)) if value is not None}
+
+
+def pooled_session(max_connections: int) -> requests.Session:
+    """Sesión con un pool de conexiones para `max_connections` peticiones a la vez."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_default_api = None
+
+
+def default_api() -> StickifyApi:
+    """Cliente único del proceso: todas las acciones reutilizan las mismas conexiones."""
+
+    global _default_api
+    if _default_api is None:
+        _default_api = StickifyApi()
+    return _default_api
@@ -0,0 +1,79 @@
+"""Arranque y memoria de Chrome por perfil de harness/browser_factory.py.
+
+    python -m harness.browser_benchmark --runs 5 --url http://localhost:4200/login
+
+Por cada perfil: un arranque en frío (caché de disco vacía), `--runs` arranques en caliente
+(misma caché, chromedriver ya localizado) y la memoria del árbol de procesos con la página abierta.
+"""
+import argparse
+import json
+import statistics
+import tempfile
+import time
+
+from actions.log_in_via_api import APP_URL
+from harness.browser_factory import PROFILES, BrowserFactory, driver_memory
+
+
+def measure_start(factory: BrowserFactory, url: str) -> dict:
+    started = time.perf_counter()
+    driver = factory.create()
+    try:
+        launched = time.perf_counter()
+        driver.get(url)
+        loaded = time.perf_counter()
+        memory = driver_memory(driver)
+    finally:
+        driver.quit()
+    return {
+        "launch_ms": (launched - started) * 1000,
+        "first_page_ms": (loaded - launched) * 1000,
+        "rss_mb": memory["rss"] / 2**20,
+        "pss_mb": memory["pss"] / 2**20,
+    }
+
+
+def benchmark_profile(profile, url: str, runs: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix=f"stickify-{profile.name}-") as cache_root:
+        factory = BrowserFactory(profile, cache_root=cache_root)
+        cold = measure_start(factory, url)
+        warm = [measure_start(factory, url) for _ in range(runs)]
+    return {
+        "profile": profile.name,
+        "cold": cold,
+        "warm": {key: statistics.median(run[key] for run in warm) for key in cold},
+    }
+
+
+def format_results(results: list) -> str:
+    header = f"{'perfil':<15} {'':<6} {'arranque ms':>12} {'1ª página ms':>13} {'RSS MB':>8} {'PSS MB':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        for phase in ("cold", "warm"):
+            row = result[phase]
+            lines.append(
+                f"{result['profile']:<15} {'frío' if phase == 'cold' else 'cal.':<6} {row['launch_ms']:>12.0f} "
+                f"{row['first_page_ms']:>13.0f} {row['rss_mb']:>8.0f} {row['pss_mb']:>8.0f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m harness.browser_benchmark", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--profiles", nargs="+", choices=sorted(PROFILES), default=sorted(PROFILES))
+    parser.add_argument("--runs", type=int, default=3, help="arranques en caliente por perfil (se da la mediana)")
+    parser.add_argument("--url", default=f"{APP_URL}/login", help="página que se abre tras arrancar")
+    parser.add_argument("--json", dest="json_path", default=None, help="guardar los resultados en este archivo")
+    args = parser.parse_args(argv)
+
+    results = [benchmark_profile(PROFILES[name], args.url, args.runs) for name in args.profiles]
+    print(format_results(results))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=1)
+
+
+if __name__ == "__main__":
+    main()
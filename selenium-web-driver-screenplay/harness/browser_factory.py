@@ -0,0 +1,216 @@
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import psutil
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from harness.browser_pool import DEFAULT_WINDOW_SIZE
+from harness.network_tracker import install_network_tracker
+
+
+DEFAULT_PROFILE = os.getenv("STICKIFY_BROWSER_PROFILE", "fast-headless")
+DEFAULT_CACHE_ROOT = Path(os.getenv("STICKIFY_BROWSER_CACHE", Path.home() / ".cache" / "stickify-e2e" / "chrome"))
+
+# Siempre: sin extensiones, sin gestor de contraseñas ni ventanas emergentes
+COMMON_ARGUMENTS = (
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-popup-blocking",
+    "--disable-save-password-bubble",
+    "--disable-password-manager-reauthentication",
+)
+# Trabajo de fondo que Chrome hace al arrancar y que una prueba no necesita
+QUIET_STARTUP_ARGUMENTS = (
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-domain-reliability",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+)
+LOW_MEMORY_ARGUMENTS = (
+    "--process-per-site",
+    "--renderer-process-limit=2",
+    "--disable-dev-shm-usage",
+    "--disable-site-isolation-trials",
+)
+PREFS = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+
+@dataclass(frozen=True)
+class BrowserProfile:
+    """Opciones de Chrome para una forma de ejecutar la suite."""
+
+    name: str
+    headless: bool = True
+    # Incógnito evita usar la cuenta de Google del perfil, pero guarda la caché solo en memoria
+    incognito: bool = False
+    # Caché en disco que sobrevive al navegador: el bundle de Angular no se descarga en cada arranque
+    disk_cache: bool = False
+    arguments: tuple = ()
+    window_size: tuple = DEFAULT_WINDOW_SIZE
+
+
+PROFILES = {
+    # Sin incógnito para conservar la caché de disco: BrowserPool.reset borra el resto del almacenamiento
+    "fast-headless": BrowserProfile("fast-headless", disk_cache=True, arguments=QUIET_STARTUP_ARGUMENTS),
+    "debug-headed": BrowserProfile("debug-headed", headless=False, incognito=True),
+    "low-memory": BrowserProfile(
+        "low-memory", incognito=True, arguments=QUIET_STARTUP_ARGUMENTS + LOW_MEMORY_ARGUMENTS
+    ),
+}
+
+
+def profile_named(name: str) -> BrowserProfile:
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Perfil de navegador desconocido: {name!r} (disponibles: {', '.join(PROFILES)})") from None
+
+
+class _CacheSlots:
+    """Números de los directorios de caché en uso bajo una raíz (compartidos por las fábricas del proceso)."""
+
+    def __init__(self):
+        self._free = []
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> int:
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+            self._count += 1
+            return self._count - 1
+
+    def free(self, slot):
+        if slot is not None:
+            with self._lock:
+                self._free.append(slot)
+
+
+_slots_by_root = {}
+_slots_lock = threading.Lock()
+
+
+def _cache_slots(root: Path) -> _CacheSlots:
+    with _slots_lock:
+        return _slots_by_root.setdefault(root, _CacheSlots())
+
+
+class BrowserFactory:
+    """Crea navegadores Chrome con un BrowserProfile, listos para la suite."""
+
+    # Con disk_cache cada navegador vivo ocupa un directorio numerado bajo cache_root y lo libera
+    # al cerrarse: la caché pasa a los siguientes, pero nunca la usan dos Chrome a la vez.
+
+    def __init__(self, profile: BrowserProfile, extra_arguments=(), resource_blocker=None, cache_root: Path = None):
+        self.profile = profile
+        self.extra_arguments = tuple(extra_arguments)
+        self.resource_blocker = resource_blocker
+        worker_id = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.cache_root = Path(cache_root or DEFAULT_CACHE_ROOT) / worker_id
+        self._slots = _cache_slots(self.cache_root)
+
+    def options(self, cache_dir: Path = None) -> Options:
+        options = Options()
+        if self.profile.headless:
+            options.add_argument("--headless=new")
+        if self.profile.incognito:
+            options.add_argument("--incognito")
+        options.add_argument("--window-size={},{}".format(*self.profile.window_size))
+        for argument in COMMON_ARGUMENTS + self.profile.arguments + self.extra_arguments:
+            options.add_argument(argument)
+        if cache_dir is not None:
+            options.add_argument(f"--disk-cache-dir={cache_dir}")
+        options.add_experimental_option("prefs", PREFS)
+        # Eventos Network de DevTools para MonitorNetwork y consola del navegador para FlightRecorder
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL", "browser": "ALL"})
+        return options
+
+    def create(self):
+        slot = self._slots.take() if self.profile.disk_cache else None
+        try:
+            driver = webdriver.Chrome(service=Service(), options=self.options(self._cache_dir(slot)))
+        except Exception:
+            self._slots.free(slot)
+            raise
+        if slot is not None:
+            self._release_slot_on_quit(driver, slot)
+        install_network_tracker(driver)
+        if self.resource_blocker is not None:
+            self.resource_blocker.apply(driver)
+        return driver
+
+    def _cache_dir(self, slot):
+        if slot is None:
+            return None
+        path = self.cache_root / f"slot-{slot}"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _release_slot_on_quit(self, driver, slot: int):
+        quit_driver = driver.quit
+
+        def quit():
+            try:
+                quit_driver()
+            finally:
+                self._slots.free(slot)
+
+        driver.quit = quit
+
+    def __call__(self):
+        return self.create()
+
+    def __repr__(self):
+        return f"<BrowserFactory {self.profile.name}>"
+
+
+_factories = {}
+
+
+def create_browser(profile_name: str = DEFAULT_PROFILE):
+    """Un navegador de la fábrica del perfil, para el código que no usa un BrowserPool."""
+    if profile_name not in _factories:
+        _factories[profile_name] = BrowserFactory(profile_named(profile_name))
+    return _factories[profile_name].create()
+
+
+def driver_processes(driver) -> list:
+    """chromedriver y todos los procesos de Chrome que arrancó (navegador, renderers, GPU...)."""
+    process = getattr(driver.service, "process", None)
+    if process is None:
+        return []
+    try:
+        root = psutil.Process(process.pid)
+        return [root, *root.children(recursive=True)]
+    except psutil.NoSuchProcess:
+        return []
+
+
+def driver_memory(driver) -> dict:
+    """Memoria en bytes de los procesos de un navegador: RSS y, donde exista, PSS."""
+    # La suma de RSS cuenta las páginas compartidas en cada proceso; PSS (Linux) las reparte
+
+    rss = pss = 0
+    for process in driver_processes(driver):
+        try:
+            info = process.memory_full_info() if hasattr(process, "memory_full_info") else process.memory_info()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        rss += info.rss
+        pss += getattr(info, "pss", info.rss)
+    return {"rss": rss, "pss": pss}
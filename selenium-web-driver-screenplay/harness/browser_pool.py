@@ -0,0 +1,163 @@
+from collections import deque
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+
+DEFAULT_WINDOW_SIZE = (1920, 1080)
+# Todo lo que un origen guarda en el perfil salvo la caché HTTP, que se quiere conservar
+CLEARED_STORAGE = "cookies,local_storage,indexeddb,websql,file_systems,service_workers,cache_storage"
+
+
+@dataclass(frozen=True)
+class Release:
+    memory: dict = None
+    recycled: str = None  # "memory", "tests" o None si el navegador vuelve al pool
+
+
+class BrowserPool:
+    """Navegadores ya arrancados que se limpian y se reutilizan entre pruebas."""
+
+    # Con memory_probe (driver -> {"rss", "pss"} en bytes) se mide cada navegador al devolverlo:
+    # si pasa de max_memory_mb o ya sirvió max_tests pruebas se cierra en lugar de reutilizarse.
+
+    def __init__(
+        self,
+        factory,
+        size: int = 1,
+        window_size: tuple = DEFAULT_WINDOW_SIZE,
+        memory_probe=None,
+        max_memory_mb: float = None,
+        max_tests: int = None,
+        origins=(),
+    ):
+        self.factory = factory
+        self.size = max(1, size)
+        self.window_size = window_size
+        self.memory_probe = memory_probe
+        self.max_memory_mb = max_memory_mb
+        self.max_tests = max_tests
+        # Orígenes (app, backend) cuyo almacenamiento se borra en reset() aunque no sean la página actual
+        self.origins = {_origin(url) for url in origins}
+        self._idle = deque()
+        self._uses = {}
+        self.started = 0
+        self.replaced = 0
+        self.recycled = {"memory": 0, "tests": 0}
+
+    def warm_up(self):
+        """Arranca navegadores hasta tener `size` libres."""
+        while len(self._idle) < self.size:
+            self._idle.append(self._start())
+
+    def acquire(self):
+        """Devuelve un navegador sano; los que se cayeron mientras esperaban se reemplazan."""
+        while self._idle:
+            driver = self._idle.popleft()
+            if self.is_healthy(driver):
+                return driver
+            self._uses.pop(id(driver), None)
+            self._discard(driver)
+            self.replaced += 1
+        return self._start()
+
+    def release(self, driver):
+        """Limpia el navegador y lo guarda para la siguiente prueba, o lo cierra."""
+        # Release lleva la memoria medida antes de limpiarlo (None sin sonda o si se cayó)
+        # y el motivo por el que se cerró
+        uses = self._uses.pop(id(driver), 0) + 1
+        if not self.is_healthy(driver):
+            self._discard(driver)
+            return Release()
+        memory = self._sample(driver)
+        reason = self._recycle_reason(memory, uses)
+        if reason is not None:
+            self.recycled[reason] += 1
+            self._discard(driver)
+            return Release(memory, reason)
+        if not self.reset(driver) or len(self._idle) >= self.size:
+            self._discard(driver)
+            return Release(memory)
+        self._uses[id(driver)] = uses
+        self._idle.append(driver)
+        return Release(memory)
+
+    def _sample(self, driver):
+        if self.memory_probe is None:
+            return None
+        try:
+            return self.memory_probe(driver)
+        except Exception:  # el árbol de procesos cambió mientras se leía
+            return None
+
+    def _recycle_reason(self, memory, uses: int):
+        if self.max_memory_mb and memory and memory["pss"] / 2**20 > self.max_memory_mb:
+            return "memory"
+        if self.max_tests and uses >= self.max_tests:
+            return "tests"
+        return None
+
+    def reset(self, driver) -> bool:
+        """Deja el navegador como nuevo: sin almacenamiento, sin cookies y en blanco."""
+
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # fast-headless no usa --incognito (perdería la caché de disco): el perfil conserva
+            # localStorage, IndexedDB, service workers... de cada origen y se borran aquí
+            origins = set(self.origins)
+            if driver.current_url.startswith("http"):
+                origins.add(_origin(driver.current_url))
+                driver.execute_script("window.sessionStorage.clear();")
+            if hasattr(driver, "execute_cdp_cmd"):
+                for origin in origins:
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": CLEARED_STORAGE})
+            elif driver.current_url.startswith("http"):
+                driver.execute_script("window.localStorage.clear();")
+            driver.delete_all_cookies()
+
+            driver.get("about:blank")
+            driver.set_window_size(*self.window_size)
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def is_healthy(driver) -> bool:
+        process = getattr(driver.service, "process", None)
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            driver.current_url
+            return True
+        except Exception:  # chromedriver caído: WebDriverException o error de conexión
+            return False
+
+    def shutdown(self):
+        while self._idle:
+            self._discard(self._idle.popleft())
+        self._uses.clear()
+
+    def _start(self):
+        self.started += 1
+        return self.factory()
+
+    @staticmethod
+    def _discard(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def __repr__(self):
+        return f"<BrowserPool size={self.size} idle={len(self._idle)}>"
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
@@ -0,0 +1,104 @@
+# Plugin de pytest: navegadores reutilizados entre pruebas (harness/browser_pool.py) y resumen de
+# su memoria. Se registra desde tests/conftest.py.
+import html
+import os
+from urllib.parse import urlsplit
+
+import pytest
+
+from actions.log_in_via_api import APP_URL
+from harness import browser_factory
+from harness.api_client import API_URL
+from harness.browser_pool import BrowserPool
+from harness.report_properties import teardown_properties
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-pool-size",
+        type=int,
+        default=int(os.getenv("STICKIFY_BROWSER_POOL_SIZE", "1")),
+        help="Número de navegadores que cada proceso mantiene abiertos entre pruebas.",
+    )
+    parser.addoption(
+        "--browser-profile",
+        choices=sorted(browser_factory.PROFILES),
+        default=browser_factory.DEFAULT_PROFILE,
+        help="Perfil de Chrome (harness/browser_factory.py); también STICKIFY_BROWSER_PROFILE.",
+    )
+    parser.addoption(
+        "--browser-max-memory-mb",
+        type=float,
+        default=float(os.getenv("STICKIFY_BROWSER_MAX_MEMORY_MB", "1024")),
+        help="Un navegador que supera esta memoria (PSS de chromedriver + Chrome) se cierra en vez de reutilizarse (0 = sin límite).",
+    )
+    parser.addoption(
+        "--browser-max-tests",
+        type=int,
+        default=int(os.getenv("STICKIFY_BROWSER_MAX_TESTS", "50")),
+        help="Pruebas que sirve un navegador antes de cerrarlo y abrir otro (0 = sin límite).",
+    )
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request, cassette_proxy, resource_blocker):
+    """Navegadores reutilizados durante toda la sesión (uno por prueba a la vez)."""
+    # El front se sirve sin pasar por el proxy; el backend (también en localhost) sí pasa
+    extra_arguments = cassette_proxy.chrome_arguments(bypass=[urlsplit(APP_URL).netloc]) if cassette_proxy else ()
+    factory = browser_factory.BrowserFactory(
+        browser_factory.profile_named(request.config.getoption("--browser-profile")), extra_arguments, resource_blocker
+    )
+    pool = BrowserPool(
+        factory,
+        size=request.config.getoption("--browser-pool-size"),
+        memory_probe=browser_factory.driver_memory,
+        max_memory_mb=request.config.getoption("--browser-max-memory-mb"),
+        max_tests=request.config.getoption("--browser-max-tests"),
+        origins=(APP_URL, API_URL),
+    )
+
+    # Arranca de una vez los `--browser-pool-size` navegadores antes de la primera prueba
+    pool.warm_up()
+
+    yield pool
+
+    pool.shutdown()
+
+
+def _memory_summary(config):
+    properties = teardown_properties(config)
+    memory = {nodeid: test["browser_pss_mb"] for nodeid, test in properties.items() if "browser_pss_mb" in test}
+    if not memory:
+        return []
+    heaviest = max(memory, key=memory.get)
+    recycled = [test["browser_recycled"] for test in properties.values() if test.get("browser_recycled")]
+    return [
+        f"Memoria del navegador al terminar cada prueba: media {sum(memory.values()) / len(memory):.0f} MB, "
+        f"máx. {memory[heaviest]:.0f} MB ({heaviest}); {len(recycled)} navegadores reciclados "
+        f"({recycled.count('memory')} por memoria, {recycled.count('tests')} por número de pruebas)"
+    ]
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    for line in _memory_summary(config):
+        terminalreporter.write_line(line)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    for line in _memory_summary(session.config):
+        prefix.append(f"<p>{html.escape(line)}</p>")
+    heaviest = sorted(
+        ((nodeid, test) for nodeid, test in teardown_properties(session.config).items() if "browser_pss_mb" in test),
+        key=lambda item: -item[1]["browser_pss_mb"],
+    )[:10]
+    if heaviest:
+        rows = "".join(
+            f"<tr><td>{html.escape(nodeid)}</td><td>{test['browser_pss_mb']:.0f}</td><td>{test['browser_rss_mb']:.0f}</td>"
+            f"<td>{html.escape(test.get('browser_recycled') or '')}</td></tr>"
+            for nodeid, test in heaviest
+        )
+        prefix.append(
+            "<table><thead><tr><th>Prueba</th><th>PSS MB</th><th>RSS MB</th><th>Reciclado</th></tr></thead>"
+            f"<tbody>{rows}</tbody></table>"
+        )
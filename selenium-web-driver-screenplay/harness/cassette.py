@@ -0,0 +1,305 @@
+# Graba en una cassette el tráfico del navegador con el backend y lo reproduce en ejecuciones
+# posteriores. Chrome usa CassetteProxy como proxy: las peticiones a STICKIFY_API_URL se graban
+# o se responden desde la cassette; el resto, y las que cumplen una regla de passthrough
+# (por defecto las que modifican datos), van al servidor real.
+# Una cassette es JSON Lines comprimido con gzip, un intercambio por línea.
+import base64
+import gzip
+import hashlib
+import http.client
+import json
+import logging
+import select
+import socket
+import threading
+from dataclasses import asdict, dataclass, field
+from fnmatch import fnmatch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+# Llamadas que cambian datos: siempre van al backend real
+DEFAULT_PASSTHROUGH = ("POST *", "PUT *", "PATCH *", "DELETE *")
+# Cabeceras que no se guardan: dependen de la conexión o se recalculan al responder
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-connection", "transfer-encoding", "content-length", "date", "upgrade",
+}
+UPSTREAM_TIMEOUT = 30
+
+
+def body_hash(body: bytes) -> str:
+    return hashlib.sha1(body or b"").hexdigest()[:16]
+
+
+@dataclass
+class Exchange:
+    method: str
+    path: str
+    body_hash: str
+    status: int
+    headers: list = field(default_factory=list)
+    body: str = ""
+    binary: bool = False
+    test: str = ""
+
+    @property
+    def key(self) -> tuple:
+        return self.test, self.method, self.path, self.body_hash
+
+    def content(self) -> bytes:
+        return base64.b64decode(self.body) if self.binary else self.body.encode("utf-8")
+
+    @staticmethod
+    def of(method: str, path: str, request_body: bytes, status: int, headers, content: bytes, test: str = "") -> "Exchange":
+        headers = [[name, value] for name, value in headers if name.lower() not in HOP_BY_HOP_HEADERS]
+        try:
+            return Exchange(method, path, body_hash(request_body), status, headers, content.decode("utf-8"), test=test)
+        except UnicodeDecodeError:
+            return Exchange(
+                method, path, body_hash(request_body), status, headers, base64.b64encode(content).decode(), True, test
+            )
+
+
+class Cassette:
+    """Intercambios grabados por (nodeid de la prueba, método, ruta + query, hash del cuerpo)."""
+
+    # Una clave puede tener varias respuestas (GET /users antes y después de seguir a alguien):
+    # la n-ésima petición igual de una prueba recibe la n-ésima respuesta, y la última cuando
+    # se acaban. Separarlas por prueba aguanta otro orden de ejecución y los workers de xdist.
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.test = ""
+        self._exchanges = {}
+        self._played = {}
+        self._new = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def load(path) -> "Cassette":
+        cassette = Cassette(path)
+        for part in [cassette.path, *worker_parts(cassette.path)]:
+            if part.exists():
+                with gzip.open(part, "rt", encoding="utf-8") as lines:
+                    for line in lines:
+                        cassette._index(Exchange(**json.loads(line)))
+        return cassette
+
+    def __len__(self):
+        return sum(len(responses) for responses in self._exchanges.values())
+
+    def _index(self, exchange: Exchange):
+        self._exchanges.setdefault(exchange.key, []).append(exchange)
+
+    def find(self, method: str, path: str, request_body: bytes):
+        with self._lock:
+            key = (self.test, method, path, body_hash(request_body))
+            responses = self._exchanges.get(key)
+            if not responses:
+                return None
+            played = self._played.get(key, 0)
+            self._played[key] = played + 1
+            return responses[min(played, len(responses) - 1)]
+
+    def add(self, exchange: Exchange):
+        with self._lock:
+            exchange.test = self.test
+            self._index(exchange)
+            self._new.append(exchange)
+
+    def rewind(self, test: str = ""):
+        """Pasa a las grabaciones de `test` y cuenta sus peticiones repetidas desde cero."""
+        with self._lock:
+            self.test = test
+            self._played.clear()
+
+    def save(self, path: Path = None):
+        """Escribe lo grabado en este proceso (añadiéndolo si el archivo ya existe)."""
+        path = Path(path or self.path)
+        with self._lock:
+            new, self._new = self._new, []
+        if not new:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # gzip admite varios miembros concatenados: añadir no obliga a reescribir
+        with gzip.open(path, "at", encoding="utf-8") as lines:
+            for exchange in new:
+                lines.write(json.dumps(asdict(exchange), separators=(",", ":")) + "\n")
+
+
+def worker_parts(path: Path) -> list:
+    """Cassettes de los workers de pytest-xdist junto a `path` (cassette.gw0.jsonl.gz...)."""
+    name = path.name.split(".")[0]
+    return sorted(path.parent.glob(f"{name}.gw*{''.join(path.suffixes)}"))
+
+
+def worker_path(path: Path, worker_id: str) -> Path:
+    name = path.name.split(".")[0]
+    return path.with_name(f"{name}.{worker_id}{''.join(path.suffixes)}")
+
+
+def merge_worker_parts(path: Path):
+    """Añade a `path` la cassette de cada worker y borra las partes."""
+    for part in worker_parts(path):
+        with path.open("ab") as target:
+            target.write(part.read_bytes())
+        part.unlink()
+
+
+class CassetteProxy:
+    """Proxy HTTP local de Chrome que graba o reproduce las llamadas al backend."""
+
+    # Solo toca lo que va a backend_url y mientras `active` (las pruebas marcadas cassette);
+    # lo demás se reenvía tal cual
+
+    def __init__(self, cassette: Cassette, mode: str, backend_url: str, passthrough=DEFAULT_PASSTHROUGH):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Modo de cassette desconocido: {mode!r} (use {RECORD!r} o {REPLAY!r})")
+        self.cassette = cassette
+        self.mode = mode
+        backend = urlsplit(backend_url)
+        self.backend_host = backend.netloc
+        self.backend_path = backend.path.rstrip("/")
+        self.passthrough = tuple(passthrough)
+        self.active = False
+        self.stats = {"replayed": 0, "recorded": 0, "passthrough": 0, "missed": 0}
+        self._server = None
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def chrome_arguments(self, bypass=()) -> list:
+        """Argumentos de Chrome que pasan el tráfico por el proxy, localhost incluido."""
+        # <-loopback> quita la excepción implícita de localhost, donde corre el backend
+        return [f"--proxy-server=http://{self.address}", f"--proxy-bypass-list={';'.join(['<-loopback>', *bypass])}"]
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> "CassetteProxy":
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="cassette-proxy", daemon=True).start()
+        logger.info("Proxy de cassette (%s) en %s", self.mode, self.address)
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self.mode == RECORD:
+            self.cassette.save()
+        logger.info("Cassette %s: %s", self.cassette.path, self.stats)
+
+    def begin_test(self, active: bool, test: str = ""):
+        self.active = active
+        self.cassette.rewind(test)
+
+    def is_backend(self, host: str, path: str) -> bool:
+        return host == self.backend_host and path.startswith(self.backend_path + "/")
+
+    def passes_through(self, method: str, path: str) -> bool:
+        route = f"{method} {path[len(self.backend_path):]}"
+        return any(fnmatch(route, rule) for rule in self.passthrough)
+
+    def respond(self, method: str, host: str, path: str, headers, body: bytes):
+        """Devuelve (status, headers, contenido) de una petición que pasa por el proxy."""
+        if not (self.active and self.is_backend(host, path)) or self.passes_through(method, path):
+            if self.active and self.is_backend(host, path):
+                self._count("passthrough")
+            return forward(method, host, path, headers, body)
+
+        if self.mode == REPLAY:
+            exchange = self.cassette.find(method, path, body)
+            if exchange is not None:
+                self._count("replayed")
+                return exchange.status, exchange.headers, exchange.content()
+            self._count("missed")
+            logger.warning("Cassette sin respuesta para %s %s; se consulta el backend", method, path)
+            return forward(method, host, path, headers, body)
+
+        status, response_headers, content = forward(method, host, path, headers, body)
+        if status < 500:
+            self.cassette.add(Exchange.of(method, path, body, status, response_headers, content))
+            self._count("recorded")
+        return status, response_headers, content
+
+    def _count(self, stat: str):
+        self.stats[stat] += 1
+
+
+def forward(method: str, host: str, path: str, headers, body: bytes):
+    connection = http.client.HTTPConnection(host, timeout=UPSTREAM_TIMEOUT)
+    try:
+        outgoing = {name: value for name, value in headers if name.lower() not in HOP_BY_HOP_HEADERS}
+        connection.request(method, path, body=body or None, headers=outgoing)
+        response = connection.getresponse()
+        return response.status, response.getheaders(), response.read()
+    except OSError as error:
+        return 502, [("Content-Type", "text/plain")], f"Proxy: {host} no responde ({error})".encode()
+    finally:
+        connection.close()
+
+
+def _handler_for(proxy: CassetteProxy):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _proxy(self):
+            # Petición a un proxy: la línea trae la URL absoluta
+            url = urlsplit(self.path)
+            host = url.netloc or self.headers.get("Host", "")
+            path = (url.path or "/") + (f"?{url.query}" if url.query else "")
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, headers, content = proxy.respond(self.command, host, path, self.headers.items(), body)
+
+            self.send_response(status)
+            for name, value in headers:
+                if name.lower() not in HOP_BY_HOP_HEADERS:
+                    self.send_header(name, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(content)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = do_HEAD = _proxy
+
+        def do_CONNECT(self):
+            """HTTPS y WebSockets: abre un túnel y copia los bytes en los dos sentidos."""
+
+            host, _, port = self.path.partition(":")
+            try:
+                upstream = socket.create_connection((host, int(port or 443)), timeout=UPSTREAM_TIMEOUT)
+            except OSError:
+                self.send_error(502)
+                return
+            self.send_response(200, "Connection Established")
+            self.end_headers()
+            sockets = [self.connection, upstream]
+            try:
+                while True:
+                    readable, _, broken = select.select(sockets, [], sockets, UPSTREAM_TIMEOUT)
+                    if broken or not readable:
+                        break
+                    for source in readable:
+                        data = source.recv(65536)
+                        if not data:
+                            return
+                        (upstream if source is self.connection else self.connection).sendall(data)
+            except OSError:
+                pass
+            finally:
+                upstream.close()
+                self.close_connection = True
+
+        def log_message(self, format, *args):
+            logger.debug("%s " + format, self.address_string(), *args)
+
+    return Handler
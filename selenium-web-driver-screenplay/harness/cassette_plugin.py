@@ -0,0 +1,77 @@
+# Plugin de pytest: con --cassette graba o reproduce (harness/cassette.py) las respuestas del
+# backend a las pruebas marcadas con @pytest.mark.cassette. Se registra desde tests/conftest.py.
+import os
+from pathlib import Path
+
+import pytest
+
+from harness.api_client import API_URL
+from harness.cassette import (
+    DEFAULT_PASSTHROUGH, RECORD, Cassette, CassetteProxy, merge_worker_parts, worker_parts, worker_path,
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cassette",
+        choices=("record", "replay"),
+        default=os.getenv("STICKIFY_CASSETTE") or None,
+        help="Graba o reproduce las respuestas del backend en las pruebas marcadas con @pytest.mark.cassette.",
+    )
+    parser.addoption(
+        "--cassette-file",
+        default=os.getenv("STICKIFY_CASSETTE_FILE", "cassettes/backend.jsonl.gz"),
+        help="Archivo del cassette (JSON Lines comprimido con gzip).",
+    )
+    parser.addoption(
+        "--cassette-passthrough",
+        default=",".join(DEFAULT_PASSTHROUGH),
+        help="Rutas que siempre van al backend real, separadas por comas (p. ej. 'POST *,GET /users*').",
+    )
+
+
+def _records(config) -> bool:
+    """Con --cassette record, el proceso principal limpia y une las partes de los workers de xdist."""
+    return config.getoption("--cassette") == RECORD and not hasattr(config, "workerinput")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "cassette: las respuestas del backend a esta prueba se graban o reproducen con --cassette"
+    )
+    if _records(config):
+        path = Path(config.getoption("--cassette-file"))
+        for stale in [path, *worker_parts(path)]:
+            stale.unlink(missing_ok=True)
+
+
+def pytest_sessionfinish(session):
+    if _records(session.config):
+        merge_worker_parts(Path(session.config.getoption("--cassette-file")))
+
+
+@pytest.fixture(scope="session")
+def cassette_proxy(request):
+    """Proxy local que graba o reproduce el tráfico del navegador con el backend (None sin --cassette)."""
+    mode = request.config.getoption("--cassette")
+    if mode is None:
+        yield None
+        return
+    path = Path(request.config.getoption("--cassette-file"))
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    if mode == RECORD:
+        cassette = Cassette(worker_path(path, worker_id) if worker_id else path)
+    else:
+        cassette = Cassette.load(path)
+    passthrough = [rule.strip() for rule in request.config.getoption("--cassette-passthrough").split(",") if rule.strip()]
+    proxy = CassetteProxy(cassette, mode, API_URL, passthrough).start()
+
+    yield proxy
+
+    proxy.stop()
+
+
+@pytest.fixture(autouse=True)
+def _cassette_for_test(request, cassette_proxy):
+    if cassette_proxy is not None:
+        cassette_proxy.begin_test(request.node.get_closest_marker("cassette") is not None, request.node.nodeid)
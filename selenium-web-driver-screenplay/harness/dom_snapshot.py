@@ -0,0 +1,37 @@
+# Lee todas las tarjetas de una colección en una sola llamada a execute_script.
+# Cada campo es un selector CSS relativo a la tarjeta; con el sufijo "@atributo"
+# se devuelve ese atributo en vez del texto, y un selector vacío apunta a la
+# propia tarjeta (p. ej. "@class").
+SNAPSHOT_SCRIPT = """
+const [using, value, fields] = arguments;
+let cards;
+if (using === 'xpath') {
+  const found = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  cards = Array.from({ length: found.snapshotLength }, (_, i) => found.snapshotItem(i));
+} else {
+  cards = Array.from(document.querySelectorAll(value));
+}
+const textOf = (el) => (el.textContent || '').replace(/\\s+/g, ' ').trim();
+const isVisible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+  && getComputedStyle(el).visibility !== 'hidden';
+return cards.map((card) => {
+  const row = { visible: isVisible(card), text: textOf(card) };
+  for (const [name, spec] of Object.entries(fields)) {
+    const at = spec.lastIndexOf('@');
+    const selector = at >= 0 ? spec.slice(0, at) : spec;
+    const el = selector ? card.querySelector(selector) : card;
+    row[name] = !el ? null : at >= 0 ? el.getAttribute(spec.slice(at + 1)) : textOf(el);
+  }
+  return row;
+});
+"""
+
+
+def snapshot_cards(browser, locator, fields: dict = None) -> list:
+    """Un dict por elemento de `locator` (Target o tupla (By, valor)), solo CSS o XPath."""
+    # Cada dict lleva 'visible', 'text' y una clave por cada entrada de `fields`
+
+    using, value = tuple(locator)
+    if using not in ("css selector", "xpath"):
+        raise ValueError(f"snapshot_cards solo admite CSS o XPath, no '{using}'")
+    return browser.execute_script(SNAPSHOT_SCRIPT, using, value, fields or {})
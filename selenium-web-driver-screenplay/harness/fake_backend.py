@@ -0,0 +1,888 @@
+# Backend de NestJS (/api) en memoria, para ejecutar la suite sin Postgres:
+#   python -m harness.fake_backend --port 3000 --latency 40~10
+# Solo las rutas que usan la app de Angular, el seeder y las abilities, con las mismas rutas,
+# códigos y cuerpos de error que los controladores reales. Hay un índice por cada búsqueda
+# de las rutas (email, username, dueño, canción...): cada petición es un acceso a un dict.
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from harness.accounts import SHARED_ACCOUNTS
+from harness.seeding import SEED_PASSWORD, make_song
+
+
+logger = logging.getLogger(__name__)
+
+# Mismos valores que JwtModule en el backend
+JWT_SECRET = "AABBCC"
+JWT_EXPIRES_IN_SECONDS = 3600
+ALLOWED_ORIGIN = "http://localhost:4200"
+DEFAULT_CATALOG_SIZE = 24
+# Como FindSongsDto en stickify-back/src/songs/dto/find-songs.dto.ts
+SONGS_PAGE_PARAMS = ("limit", "cursor", "q", "artist", "genre", "year", "ids")
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+MAX_AVERAGE_TRACK_IDS = 500
+# Como stickify-back/src/user/dto/follows-page.dto.ts
+DEFAULT_FOLLOWS_PAGE_SIZE = 50
+MAX_FOLLOWS_PAGE_SIZE = 200
+FOLLOW_LIST_FIELDS = ("id", "username", "email", "premium", "followersCount", "followingCount")
+MAX_BATCH_RATINGS = 10000
+# Como stickify-back/src/songs/dto/songs-batch.dto.ts
+SONGS_BATCH_CHUNK = 500
+# Rutas cuyo cuerpo no es JSON sino una línea JSON por registro
+NDJSON_ENDPOINTS = {"POST /songs/import"}
+
+
+class HttpError(Exception):
+    """Respuesta de error; `body` se envía como JSON, igual que una HttpException de Nest."""
+
+    def __init__(self, status: int, body):
+        super().__init__(status, body)
+        self.status = status
+        self.body = body
+
+
+def not_found(message: str) -> HttpError:
+    return HttpError(404, {"statusCode": 404, "message": message, "error": "Not Found"})
+
+
+def bad_request(message: str) -> HttpError:
+    return HttpError(400, {"statusCode": 400, "message": message, "error": "Bad Request"})
+
+
+def conflict(message: str) -> HttpError:
+    return HttpError(409, {"statusCode": 409, "message": message, "error": "Conflict"})
+
+
+def sign_jwt(payload: dict, secret: str = JWT_SECRET, expires_in: int = JWT_EXPIRES_IN_SECONDS) -> str:
+    """Token HS256 con `iat`/`exp`, como los que firma `JwtService.sign`."""
+
+    def encode(data) -> str:
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    now = int(time.time())
+    signing_input = f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode({**payload, 'iat': now, 'exp': now + expires_in})}"
+    signature = hmac.new(secret.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{base64.urlsafe_b64encode(signature).rstrip(b'=').decode()}"
+
+
+@dataclass
+class Latency:
+    """Retardo antes de cada respuesta: `base_ms` ± `jitter_ms`, o un valor fijo por ruta."""
+
+    # Las rutas se nombran como los endpoints de las pruebas de carga: "GET /songs", "PUT /users/:id/follow"
+
+    base_ms: float = 0.0
+    jitter_ms: float = 0.0
+    routes: dict = field(default_factory=dict)
+
+    @staticmethod
+    def parse(text: str) -> "Latency":
+        """'40', '40~10' o '40~10,GET /songs=200,POST /ratings=80'."""
+        latency = Latency()
+        for part in filter(None, (part.strip() for part in (text or "").split(","))):
+            if "=" in part:
+                route, milliseconds = part.rsplit("=", 1)
+                latency.routes[route.strip()] = float(milliseconds)
+            else:
+                base, _, jitter = part.partition("~")
+                latency.base_ms, latency.jitter_ms = float(base), float(jitter or 0)
+        return latency
+
+    def seconds_for(self, endpoint: str) -> float:
+        if endpoint in self.routes:
+            return self.routes[endpoint] / 1000
+        jitter = random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.base_ms + jitter) / 1000
+
+    def __str__(self):
+        text = f"{self.base_ms:g}~{self.jitter_ms:g} ms"
+        return text + "".join(f", {route}={ms:g} ms" for route, ms in self.routes.items())
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _song_order(song):
+    return song["isUserUpload"], song["trackId"]
+
+
+def _as_list(value) -> list:
+    return [item for item in (value if isinstance(value, list) else [value]) if item] if value else []
+
+
+def _songs_page(songs: list, query: dict) -> dict:
+    """Página de GET /songs con los mismos filtros y cursor que SongsService.findPage."""
+    try:
+        limit = int(query.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        raise bad_request("limit debe ser un entero positivo")
+    limit = min(limit, MAX_PAGE_SIZE)
+    year = query.get("year")
+    if year is not None and not re.fullmatch(r"\d{4}", year):
+        raise bad_request("year debe tener cuatro dígitos")
+    text = (query.get("q") or "").strip().lower()
+    artists, genres = set(_as_list(query.get("artist"))), set(_as_list(query.get("genre")))
+    try:
+        track_ids = {int(track_id) for ids in _as_list(query.get("ids")) for track_id in ids.split(",") if track_id}
+    except ValueError:
+        raise bad_request("ids debe ser una lista de enteros separados por comas") from None
+    if len(track_ids) > MAX_PAGE_SIZE:
+        raise bad_request(f"ids admite como máximo {MAX_PAGE_SIZE} canciones")
+    after = _decode_cursor(query["cursor"]) if query.get("cursor") else None
+
+    def matches(song):
+        return (
+            (not text or text in song["trackName"].lower() or text in song["artistName"].lower())
+            and (not artists or song["artistName"] in artists)
+            and (not genres or song["primaryGenreName"] in genres)
+            and (not year or song["releaseDate"][:4] == year)
+            and (not track_ids or song["trackId"] in track_ids)
+            and (after is None or _song_order(song) < after)
+        )
+
+    page = []
+    for song in songs:
+        if matches(song):
+            page.append(song)
+            if len(page) > limit:
+                break
+    items = page[:limit]
+    return {"items": items, "nextCursor": _encode_cursor(items[-1]) if len(page) > limit else None}
+
+
+def _encode_cursor(song) -> str:
+    raw = json.dumps([song["isUserUpload"], song["trackId"]], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str):
+    try:
+        is_user_upload, track_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise bad_request("Cursor inválido") from None
+    if not isinstance(is_user_upload, bool) or not isinstance(track_id, int):
+        raise bad_request("Cursor inválido")
+    return is_user_upload, track_id
+
+
+def _page_limit(query: dict, default: int, maximum: int) -> int:
+    try:
+        limit = int(query.get("limit", default))
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        raise bad_request("limit debe ser un entero positivo")
+    return min(limit, maximum)
+
+
+def _encode_follow_cursor(edge: tuple, user_id: str) -> str:
+    raw = json.dumps([edge[0], user_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_follow_cursor(cursor: str) -> tuple:
+    try:
+        sequence, user_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise bad_request("Cursor inválido") from None
+    if not isinstance(sequence, int) or not isinstance(user_id, str):
+        raise bad_request("Cursor inválido")
+    return sequence, user_id
+
+
+def _empty_batch_summary() -> dict:
+    return {"received": 0, "inserted": 0, "skipped": 0, "failed": 0, "invalid": 0, "chunks": []}
+
+
+def _public(user: dict) -> dict:
+    return {key: value for key, value in user.items() if key != "password"}
+
+
+class Store:
+    """Las tablas del backend, con los índices secundarios que usan las rutas."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.users = {}              # id -> user (con contraseña)
+        # Como user_follows: id -> {otro id: (secuencia, createdAt)}, en los dos sentidos
+        self.following_by_user = {}
+        self.followers_by_user = {}
+        self.follow_sequence = 0
+        self.user_ids_by_email = {}
+        self.user_ids_by_username = {}
+        self.songs = {}              # trackId -> song
+        self.ratings = {}            # (userId, trackId) -> rating
+        self.rated_tracks_by_user = {}
+        self.rating_totals = {}      # trackId -> [count, sum], como song_rating_aggregates
+        self.comments = {}           # id -> comment
+        self.comment_ids_by_user = {}
+        self.playlists = {}          # id -> playlist
+        self.playlist_ids_by_owner = {}
+        self.saved_playlists = {}    # email -> {playlistId: entry}
+
+    # --- USERS ---
+    def user_by_email(self, email: str):
+        return self.users.get(self.user_ids_by_email.get(email))
+
+    def add_user(self, user: dict) -> dict:
+        if user["email"] in self.user_ids_by_email:
+            raise HttpError(400, {"code": "23505", "detail": f"Key (email)=({user['email']}) already exists."})
+        if user["username"] in self.user_ids_by_username:
+            raise HttpError(400, {"code": "23505", "detail": f"Key (username)=({user['username']}) already exists."})
+        user = {"id": str(uuid.uuid4()), "premium": False, "followersCount": 0, "followingCount": 0, **user}
+        self.users[user["id"]] = user
+        self.user_ids_by_email[user["email"]] = user["id"]
+        self.user_ids_by_username[user["username"]] = user["id"]
+        return user
+
+    def update_user(self, user: dict, changes: dict):
+        self.user_ids_by_email.pop(user["email"], None)
+        self.user_ids_by_username.pop(user["username"], None)
+        user.update({key: value for key, value in changes.items() if key != "id"})
+        self.user_ids_by_email[user["email"]] = user["id"]
+        self.user_ids_by_username[user["username"]] = user["id"]
+
+    def remove_user(self, user_id: str):
+        user = self.users.pop(user_id, None)
+        if user:
+            self.user_ids_by_email.pop(user["email"], None)
+            self.user_ids_by_username.pop(user["username"], None)
+            # ON DELETE CASCADE de user_follows; el trigger descuenta a los demás
+            for followee_id in list(self.following_by_user.get(user_id, ())):
+                self.unfollow(user_id, followee_id)
+            for follower_id in list(self.followers_by_user.get(user_id, ())):
+                self.unfollow(follower_id, user_id)
+
+    # --- FOLLOWS ---
+    def follow(self, follower_id: str, followee_id: str):
+        following = self.following_by_user.setdefault(follower_id, {})
+        if followee_id in following:
+            return
+        self.follow_sequence += 1
+        edge = (self.follow_sequence, _now_iso())
+        following[followee_id] = edge
+        self.followers_by_user.setdefault(followee_id, {})[follower_id] = edge
+        self._add_to_follow_counts(follower_id, followee_id, 1)
+
+    def unfollow(self, follower_id: str, followee_id: str):
+        if self.following_by_user.get(follower_id, {}).pop(followee_id, None) is None:
+            return
+        self.followers_by_user.get(followee_id, {}).pop(follower_id, None)
+        self._add_to_follow_counts(follower_id, followee_id, -1)
+
+    def _add_to_follow_counts(self, follower_id: str, followee_id: str, delta: int):
+        if follower_id in self.users:
+            self.users[follower_id]["followingCount"] += delta
+        if followee_id in self.users:
+            self.users[followee_id]["followersCount"] += delta
+
+    # --- SONGS ---
+    def add_song(self, song: dict) -> dict:
+        song = {"isUserUpload": False, **song, "trackId": int(song["trackId"])}
+        # Como el backend: si el trackId ya existe se devuelve la canción existente
+        return self.songs.setdefault(song["trackId"], song)
+
+    # --- RATINGS ---
+    def put_rating(self, user_id: str, track_id: int, rating: float) -> dict:
+        entry = {"userId": user_id, "trackId": track_id, "rating": rating}
+        previous = self.ratings.get((user_id, track_id))
+        self.ratings[(user_id, track_id)] = entry
+        self.rated_tracks_by_user.setdefault(user_id, set()).add(track_id)
+        if previous is None:
+            self._add_to_totals(track_id, 1, rating)
+        else:
+            self._add_to_totals(track_id, 0, rating - previous["rating"])
+        return entry
+
+    def remove_rating(self, user_id: str, track_id: int):
+        removed = self.ratings.pop((user_id, track_id), None)
+        if removed:
+            self.rated_tracks_by_user[user_id].discard(track_id)
+            self._add_to_totals(track_id, -1, -removed["rating"])
+
+    def _add_to_totals(self, track_id: int, count: int, total: float):
+        totals = self.rating_totals.setdefault(track_id, [0, 0.0])
+        totals[0] += count
+        totals[1] += total
+
+    def average_rating(self, track_id: int) -> tuple:
+        """(media, votos) de una canción; (0, 0) si nadie la valoró."""
+        count, total = self.rating_totals.get(track_id, (0, 0.0))
+        return (total / count if count else 0), count
+
+    # --- COMMENTS ---
+    def put_comment(self, comment: dict) -> dict:
+        previous = self.comments.get(comment["id"])
+        if previous:
+            self.comment_ids_by_user[previous["user"]].pop(previous["id"], None)
+            comment = {**previous, **comment}
+        self.comments[comment["id"]] = comment
+        # dict en lugar de set para conservar el orden de inserción
+        self.comment_ids_by_user.setdefault(comment["user"], {})[comment["id"]] = None
+        return comment
+
+    def remove_comment(self, comment_id: str):
+        comment = self.comments.pop(comment_id, None)
+        if comment:
+            self.comment_ids_by_user[comment["user"]].pop(comment_id, None)
+
+    # --- PLAYLISTS ---
+    def put_playlist(self, playlist: dict) -> dict:
+        previous = self.playlists.get(playlist["id"])
+        if previous:
+            self.playlist_ids_by_owner.get(previous.get("createdBy"), {}).pop(previous["id"], None)
+            playlist = {**previous, **playlist}
+        playlist = {"trackIds": [], "type": "user", "createdAt": _now_iso(), **playlist}
+        self.playlists[playlist["id"]] = playlist
+        self.playlist_ids_by_owner.setdefault(playlist.get("createdBy"), {})[playlist["id"]] = None
+        return playlist
+
+    def remove_playlist(self, playlist_id: str):
+        playlist = self.playlists.pop(playlist_id, None)
+        if playlist:
+            self.playlist_ids_by_owner.get(playlist.get("createdBy"), {}).pop(playlist_id, None)
+
+    def playlist_by_id_or_name(self, identifier: str):
+        if identifier in self.playlists:
+            return self.playlists[identifier]
+        return next((playlist for playlist in self.playlists.values() if playlist["name"] == identifier), None)
+
+
+class Router:
+    """Rutas como "/songs/:trackId", probadas en el orden en que se declaran, como en Nest."""
+
+    def __init__(self):
+        self.routes = []
+
+    def add(self, method: str, template: str, handler):
+        pattern = re.sub(r":(\w+)", r"(?P<\1>[^/]+)", template)
+        self.routes.append((method, re.compile(f"^{pattern}$"), f"{method} {template}", handler))
+
+    def match(self, method: str, path: str):
+        for route_method, pattern, endpoint, handler in self.routes:
+            if route_method == method:
+                found = pattern.match(path)
+                if found:
+                    return endpoint, handler, {key: unquote(value) for key, value in found.groupdict().items()}
+        return f"{method} {path}", None, {}
+
+
+class FakeStickifyBackend:
+    """Sirve las rutas del backend desde memoria en `host:port` (bajo `/api`)."""
+
+    # start() lanza el servidor en un hilo daemon; reset() vacía los datos y carga los iniciales
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 3000, latency: Latency = None, data: dict = None):
+        self.host = host
+        self.port = port
+        self.latency = latency or Latency()
+        self.initial_data = data if data is not None else default_data()
+        self.store = Store()
+        self.router = Router()
+        self._register_routes()
+        self._server = None
+        self._thread = None
+        self.load(self.initial_data)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/api"
+
+    def start(self) -> "FakeStickifyBackend":
+        self._server = ThreadingHTTPServer((self.host, self.port), _handler_for(self))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-backend", daemon=True)
+        self._thread.start()
+        logger.info("Backend simulado en %s (latencia %s)", self.url, self.latency)
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset(self):
+        with self.store.lock:
+            self.store = Store()
+            self.load(self.initial_data)
+
+    def load(self, data: dict):
+        """Carga users, songs, playlists, ratings, comments y savedPlaylists desde un dict."""
+        store = self.store
+        with store.lock:
+            for user in data.get("users", []):
+                store.add_user(dict(user))
+            for song in data.get("songs", []):
+                store.add_song(dict(song))
+            for playlist in data.get("playlists", []):
+                store.put_playlist(dict(playlist))
+            for rating in data.get("ratings", []):
+                store.put_rating(rating["userId"], int(rating["trackId"]), rating["rating"])
+            for comment in data.get("comments", []):
+                store.put_comment({"id": str(uuid.uuid4()), **comment})
+            for saved in data.get("savedPlaylists", []):
+                self._save_playlist({"userId": saved["userId"], "playlistId": saved["playlistId"]})
+
+    # --- DISPATCH ---
+    def handle(self, method: str, raw_path: str, body: bytes):
+        """Devuelve (status, cuerpo json, endpoint) de una petición."""
+        url = urlsplit(raw_path)
+        if not url.path.startswith("/api/"):
+            return 404, {"statusCode": 404, "message": f"Cannot {method} {url.path}", "error": "Not Found"}, None
+        endpoint, handler, params = self.router.match(method, url.path[len("/api"):].rstrip("/") or "/")
+        delay = self.latency.seconds_for(endpoint)
+        if delay:
+            time.sleep(delay)
+        if handler is None:
+            return 404, {"statusCode": 404, "message": f"Cannot {method} {url.path}", "error": "Not Found"}, endpoint
+        # ?genre=Pop&genre=Rock llega como lista, igual que en Express
+        query = {key: values if len(values) > 1 else values[0] for key, values in parse_qs(url.query).items()}
+        try:
+            if endpoint in NDJSON_ENDPOINTS:
+                payload = body.decode("utf-8").splitlines()
+            else:
+                payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"statusCode": 400, "message": "Unexpected token in JSON", "error": "Bad Request"}, endpoint
+        status = 201 if method == "POST" else 200
+        try:
+            with self.store.lock:
+                result = handler(params=params, query=query, body=payload)
+        except HttpError as error:
+            return error.status, error.body, endpoint
+        except (ValueError, KeyError) as error:
+            # Ids que no son números (GET /songs/abc) o campos que faltan en el cuerpo
+            return 400, bad_request(f"Petición inválida: {error}").body, endpoint
+        except Exception:
+            logger.exception("Error en %s", endpoint)
+            return 500, {"statusCode": 500, "message": "Internal server error"}, endpoint
+        if isinstance(result, tuple):
+            status, result = result
+        return status, result, endpoint
+
+    def _register_routes(self):
+        add = self.router.add
+        add("POST", "/auth/login", self._login)
+        add("POST", "/auth/sign-up", self._sign_up)
+
+        add("GET", "/users", lambda **_: [_public(user) for user in self.store.users.values()])
+        add("GET", "/users/by-username/:username", self._user_by_username)
+        add("GET", "/users/by-email/:email", lambda params, **_: _public_or_none(self.store.user_by_email(params["email"])))
+        add("GET", "/users/:id", self._user)
+        add("GET", "/users/:id/followers", self._followers)
+        add("GET", "/users/:id/following", self._following)
+        add("GET", "/users/:id/following/:email", self._is_following)
+        add("PUT", "/users/:id/follow", self._toggle_follow)
+        add("PUT", "/users/:id", self._update_user)
+        add("DELETE", "/users/:id", lambda params, **_: self.store.remove_user(params["id"]))
+
+        add("GET", "/songs", self._songs)
+        add("POST", "/songs/batch", self._songs_batch)
+        add("POST", "/songs/import", self._import_songs)
+        add("POST", "/songs", lambda body, **_: self.store.add_song(body))
+        add("GET", "/songs/facets", self._song_facets)
+        add("GET", "/songs/:trackId", lambda params, **_: self.store.songs.get(int(params["trackId"])))
+        add("PUT", "/songs/:trackId", self._update_song)
+        add("DELETE", "/songs/:trackId", self._remove_song)
+
+        add("POST", "/ratings", self._rate)
+        add("POST", "/ratings/batch", self._rate_many)
+        add("GET", "/ratings", lambda **_: list(self.store.ratings.values()))
+        add("GET", "/ratings/user/:userId", self._ratings_of_user)
+        add("GET", "/ratings/average", self._average)
+        add("GET", "/ratings/averages", self._averages)
+        add("DELETE", "/ratings/:userId/:trackId", self._remove_rating)
+
+        add("POST", "/comments", self._comment)
+        add("GET", "/comments", lambda **_: list(self.store.comments.values()))
+        add("GET", "/comments/user/:userId", self._comments_of_user)
+        add("GET", "/comments/:id", lambda params, **_: self.store.comments.get(params["id"]))
+        add("PUT", "/comments/:id", lambda params, body, **_: self.store.put_comment({**body, "id": params["id"]}))
+        add("DELETE", "/comments/:id", lambda params, **_: self.store.remove_comment(params["id"]))
+
+        add("POST", "/playlists", lambda body, **_: self.store.put_playlist(body))
+        add("GET", "/playlists", lambda **_: list(self.store.playlists.values()))
+        add("GET", "/playlists/user/:userId", self._playlists_of_user)
+        add("GET", "/playlists/by-name/:name", self._playlist_by_name)
+        add("GET", "/playlists/:id", lambda params, **_: self.store.playlists.get(params["id"]))
+        add("PUT", "/playlists/:id", lambda params, body, **_: self.store.put_playlist({**body, "id": params["id"]}))
+        add("DELETE", "/playlists/:id", lambda params, **_: self.store.remove_playlist(params["id"]))
+
+        add("POST", "/user-saved-playlists", lambda body, **_: self._save_playlist(body))
+        add("GET", "/user-saved-playlists/check/:userId/:playlistId", self._is_saved)
+        add("GET", "/user-saved-playlists/user/:userId/full", self._saved_playlists)
+        add("DELETE", "/user-saved-playlists/:userId/:playlistId", self._unsave_playlist)
+
+    # --- AUTH ---
+    def _login(self, body, **_):
+        user = self.store.user_by_email(body.get("email"))
+        if not user or user["password"] != body.get("password"):
+            raise HttpError(404, {"code": "400", "detail": "Invalid credentials"})
+        user = _public(user)
+        return 201, {"success": True, "token": sign_jwt(user), "user": user}
+
+    def _sign_up(self, body, **_):
+        user = self.store.add_user({
+            "username": body.get("username"),
+            "email": body.get("email"),
+            "password": body.get("password"),
+            "premium": bool(body.get("premium", False)),
+        })
+        return {"success": True, "token": sign_jwt(_public(user))}
+
+    # --- USERS ---
+    def _user_by_username(self, params, **_):
+        return _public_or_none(self.store.users.get(self.store.user_ids_by_username.get(params["username"])))
+
+    def _update_user(self, params, body, **_):
+        user = self.store.users.get(params["id"])
+        if user is None:
+            return None
+        self.store.update_user(user, body)
+        return _public(user)
+
+    def _user(self, params, **_):
+        user = self.store.users.get(params["id"])
+        return _public_or_none(user)
+
+    def _toggle_follow(self, params, body, **_):
+        user = self.store.users.get(params["id"])
+        target = self.store.user_by_email(body.get("targetEmail"))
+        if not user or not target:
+            raise bad_request("Usuario no encontrado")
+        if user["id"] == target["id"]:
+            raise bad_request("Un usuario no puede seguirse a sí mismo")
+        if body.get("follow"):
+            self.store.follow(user["id"], target["id"])
+        else:
+            self.store.unfollow(user["id"], target["id"])
+        # Como UsersService.toggleFollow: contadores y estado de la arista, sin listas
+        return {**_public(user), "targetEmail": target["email"], "isFollowing": bool(body.get("follow"))}
+
+    def _is_following(self, params, **_):
+        target = self.store.user_by_email(params["email"])
+        return {"following": bool(target) and target["id"] in self.store.following_by_user.get(params["id"], {})}
+
+    def _followers(self, params, query, **_):
+        return self._follows_page(self.store.followers_by_user.get(params["id"], {}), query)
+
+    def _following(self, params, query, **_):
+        return self._follows_page(self.store.following_by_user.get(params["id"], {}), query)
+
+    def _follows_page(self, edges: dict, query: dict) -> dict:
+        """Página como UsersService.followsPage: primero el seguimiento más reciente."""
+        limit = _page_limit(query, DEFAULT_FOLLOWS_PAGE_SIZE, MAX_FOLLOWS_PAGE_SIZE)
+        after = _decode_follow_cursor(query["cursor"]) if query.get("cursor") else None
+        ordered = sorted(edges.items(), key=lambda item: (item[1][0], item[0]), reverse=True)
+        if after is not None:
+            ordered = [(user_id, edge) for user_id, edge in ordered if (edge[0], user_id) < after]
+        page = ordered[:limit + 1]
+        items = [
+            {
+                **{key: self.store.users[user_id][key] for key in FOLLOW_LIST_FIELDS},
+                "followedAt": edge[1],
+            }
+            for user_id, edge in page[:limit]
+        ]
+        if len(page) <= limit:
+            return {"items": items, "nextCursor": None}
+        last_id, last_edge = page[limit - 1]
+        return {"items": items, "nextCursor": _encode_follow_cursor(last_edge, last_id)}
+
+    # --- SONGS ---
+    def _songs(self, query, **_):
+        songs = self.store.songs.values()
+        if query.get("isUserUpload"):
+            wanted = query["isUserUpload"] == "true"
+            songs = [song for song in songs if song["isUserUpload"] == wanted]
+        songs = sorted(songs, key=_song_order, reverse=True)
+        if not any(param in query for param in SONGS_PAGE_PARAMS):
+            return songs
+        return _songs_page(songs, query)
+
+    def _song_facets(self, **_):
+        # Como SongsService.findFacets
+        songs = self.store.songs.values()
+        return {
+            "genres": sorted({song["primaryGenreName"] for song in songs if song["primaryGenreName"] is not None}),
+            "artists": sorted({song["artistName"] for song in songs if song["artistName"] is not None}),
+        }
+
+    def _songs_batch(self, body, **_):
+        songs = body.get("songs", [])
+        summary = _empty_batch_summary()
+        for start in range(0, len(songs), SONGS_BATCH_CHUNK):
+            self._insert_chunk(songs[start:start + SONGS_BATCH_CHUNK], summary)
+        # Como SongsService.createBatch: las nuevas y las que ya existían, sin repetir
+        stored = [self.store.songs[track_id] for track_id in dict.fromkeys(int(song["trackId"]) for song in songs)]
+        return {"success": True, "message": "Songs batch processed successfully", "data": stored, "summary": summary}
+
+    def _import_songs(self, body, **_):
+        summary = _empty_batch_summary()
+        chunk = []
+        for line in body:
+            if not line.strip():
+                continue
+            try:
+                chunk.append(json.loads(line))
+            except ValueError:
+                summary["invalid"] += 1
+                continue
+            if len(chunk) == SONGS_BATCH_CHUNK:
+                self._insert_chunk(chunk, summary)
+                chunk = []
+        if chunk:
+            self._insert_chunk(chunk, summary)
+        return summary
+
+    def _insert_chunk(self, songs: list, summary: dict):
+        inserted = 0
+        for song in songs:
+            before = len(self.store.songs)
+            self.store.add_song(song)
+            inserted += len(self.store.songs) - before
+        report = {"chunk": len(summary["chunks"]), "received": len(songs), "inserted": inserted, "skipped": len(songs) - inserted}
+        summary["chunks"].append(report)
+        for key in ("received", "inserted", "skipped"):
+            summary[key] += report[key]
+
+    def _update_song(self, params, body, **_):
+        song = self.store.songs.get(int(params["trackId"]))
+        if song is None:
+            return None
+        song.update({key: value for key, value in body.items() if key != "trackId"})
+        return song
+
+    def _remove_song(self, params, **_):
+        self.store.songs.pop(int(params["trackId"]), None)
+
+    # --- RATINGS ---
+    def _rate(self, body, **_):
+        return self.store.put_rating(body["userId"], int(body["trackId"]), body["rating"])
+
+    def _rate_many(self, body, **_):
+        ratings = (body or {}).get("ratings")
+        if not isinstance(ratings, list):
+            raise bad_request("Se esperaba { ratings: [...] }")
+        if len(ratings) > MAX_BATCH_RATINGS:
+            raise bad_request(f"Como máximo {MAX_BATCH_RATINGS} calificaciones por petición")
+        for index, rating in enumerate(ratings):
+            if not (
+                isinstance(rating, dict)
+                and isinstance(rating.get("userId"), str)
+                and type(rating.get("trackId")) is int
+                and type(rating.get("rating")) in (int, float)
+            ):
+                raise bad_request(f"Calificación {index} inválida: se espera {{ userId, trackId, rating }}")
+        # Como RatingsService.upsertMany: gana la última calificación de cada (userId, trackId)
+        unique = {(rating["userId"], rating["trackId"]): rating["rating"] for rating in ratings}
+        for (user_id, track_id), rating in unique.items():
+            self.store.put_rating(user_id, track_id, rating)
+        return {"received": len(ratings), "upserted": len(unique)}
+
+    def _ratings_of_user(self, params, **_):
+        user_id = params["userId"]
+        return [self.store.ratings[(user_id, track_id)] for track_id in self.store.rated_tracks_by_user.get(user_id, ())]
+
+    def _average(self, query, **_):
+        track_id = query.get("trackId")
+        average = self.store.average_rating(int(track_id))[0] if track_id else 0
+        return {"trackId": track_id, "average": average}
+
+    def _averages(self, query, **_):
+        try:
+            track_ids = list(dict.fromkeys(int(item) for item in (query.get("trackIds") or "").split(",") if item))
+        except ValueError:
+            raise bad_request("trackIds debe ser una lista de enteros separados por comas") from None
+        if len(track_ids) > MAX_AVERAGE_TRACK_IDS:
+            raise bad_request(f"Como máximo {MAX_AVERAGE_TRACK_IDS} trackIds por petición")
+        return [
+            {"trackId": track_id, "average": average, "count": count}
+            for track_id in track_ids
+            for average, count in [self.store.average_rating(track_id)]
+        ]
+
+    def _remove_rating(self, params, **_):
+        self.store.remove_rating(params["userId"], int(params["trackId"]))
+        return 204, None
+
+    # --- COMMENTS ---
+    def _comment(self, body, **_):
+        return self.store.put_comment({**body, "id": str(uuid.uuid4())})
+
+    def _comments_of_user(self, params, **_):
+        return [self.store.comments[comment_id] for comment_id in self.store.comment_ids_by_user.get(params["userId"], {})]
+
+    # --- PLAYLISTS ---
+    def _playlists_of_user(self, params, **_):
+        owned = self.store.playlist_ids_by_owner.get(params["userId"], {})
+        return [self.store.playlists[playlist_id] for playlist_id in owned]
+
+    def _playlist_by_name(self, params, **_):
+        # El backend usa LIKE %name%
+        name = params["name"].lower()
+        return next((p for p in self.store.playlists.values() if name in p["name"].lower()), None)
+
+    # --- USER SAVED PLAYLISTS ---
+    def _save_playlist(self, body):
+        user_email, identifier = body.get("userId"), str(body.get("playlistId"))
+        if not self.store.user_by_email(user_email):
+            raise not_found("Usuario no encontrado")
+        playlist = self.store.playlist_by_id_or_name(identifier)
+        if playlist is None and identifier.startswith("auto-"):
+            playlist = self.store.put_playlist({
+                "id": identifier, "name": identifier, "createdBy": "automatic", "type": "auto",
+            })
+        if playlist is None:
+            raise not_found("Playlist no encontrada")
+        saved = self.store.saved_playlists.setdefault(user_email, {})
+        if playlist["id"] in saved:
+            raise conflict("Playlist ya guardada")
+        saved[playlist["id"]] = {"id": str(uuid.uuid4()), "user_id": user_email, "playlist_id": playlist["id"]}
+        return saved[playlist["id"]]
+
+    def _is_saved(self, params, **_):
+        return params["playlistId"] in self.store.saved_playlists.get(params["userId"], {})
+
+    def _saved_playlists(self, params, **_):
+        saved = self.store.saved_playlists.get(params["userId"], {})
+        return [self.store.playlists[playlist_id] for playlist_id in saved if playlist_id in self.store.playlists]
+
+    def _unsave_playlist(self, params, **_):
+        self.store.saved_playlists.get(params["userId"], {}).pop(params["playlistId"], None)
+        return 204, None
+
+    def __repr__(self):
+        return f"<FakeStickifyBackend {self.url}>"
+
+
+def _public_or_none(user):
+    return _public(user) if user else None
+
+
+def _handler_for(backend: FakeStickifyBackend):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, como Nest
+
+        def _respond(self):
+            status, result, _ = backend.handle(self.command, self.path, self._read_body())
+            # Nest responde cuerpo vacío cuando el handler devuelve null/undefined
+            content = b"" if result is None else json.dumps(result).encode()
+            self.send_response(status)
+            self._cors_headers()
+            if content:
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def _read_body(self) -> bytes:
+            if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+                return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            # Cuerpo enviado en streaming (p. ej. NDJSON de POST /songs/import)
+            body = bytearray()
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return bytes(body)
+                body += self.rfile.read(size)
+                self.rfile.readline()
+
+        def _cors_headers(self):
+            self.send_header("Access-Control-Allow-Origin", ALLOWED_ORIGIN)
+            self.send_header("Access-Control-Allow-Credentials", "true")
+            self.send_header("Vary", "Origin")
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self._cors_headers()
+            self.send_header("Access-Control-Allow-Methods", "GET,HEAD,PUT,PATCH,POST,DELETE")
+            self.send_header(
+                "Access-Control-Allow-Headers", self.headers.get("Access-Control-Request-Headers", "Content-Type")
+            )
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            logger.debug("%s " + format, self.address_string(), *args)
+
+    return Handler
+
+
+def default_data(catalog_size: int = DEFAULT_CATALOG_SIZE) -> dict:
+    """Las cuentas de prueba compartidas y un catálogo pequeño para que la portada tenga contenido."""
+
+    users = [
+        {
+            "username": account.username,
+            "email": account.email,
+            "password": account.password or SEED_PASSWORD,
+            # el dueño de playlists necesita premium para crearlas desde la interfaz
+            "premium": account is SHARED_ACCOUNTS.playlist_owner,
+        }
+        for account in (SHARED_ACCOUNTS.listener, SHARED_ACCOUNTS.follow_target, SHARED_ACCOUNTS.playlist_owner)
+    ]
+    genres = ("Rock", "Pop", "Jazz", "Electronic")
+    songs = [
+        make_song(
+            1000 + number,
+            artistName=f"Artist {number % 6 + 1}",
+            trackName=f"Song {number + 1}",
+            primaryGenreName=genres[number % len(genres)],
+            collectionName=f"Album {number % 4 + 1}",
+            isUserUpload=False,
+        )
+        for number in range(catalog_size)
+    ]
+    return {"users": users, "songs": songs}
+
+
+def load_data(path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backend de Stickify en memoria para las pruebas.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--latency", default="", help="'40', '40~10' o '40~10,GET /songs=200' (ms).")
+    parser.add_argument("--data", help="JSON con users, songs, playlists, ratings, comments y savedPlaylists.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    backend = FakeStickifyBackend(
+        args.host, args.port, Latency.parse(args.latency), load_data(args.data) if args.data else None
+    ).start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        backend.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Plugin de pytest: con --fake-backend sirve la API desde memoria (harness/fake_backend.py)
+# durante toda la sesión. Se registra desde tests/conftest.py.
+import os
+from urllib.parse import urlsplit
+
+from harness.api_client import API_URL
+from harness.fake_backend import FakeStickifyBackend, Latency, load_data
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fake-backend",
+        action="store_true",
+        default=os.getenv("STICKIFY_FAKE_BACKEND") == "1",
+        help="Sirve la API desde memoria (harness/fake_backend.py) en lugar de NestJS + Postgres.",
+    )
+    parser.addoption(
+        "--fake-backend-latency",
+        default=os.getenv("STICKIFY_FAKE_BACKEND_LATENCY", ""),
+        help="Latencia del backend simulado en ms: '40', '40~10' o '40~10,GET /songs=200'.",
+    )
+    parser.addoption(
+        "--fake-backend-data",
+        default=os.getenv("STICKIFY_FAKE_BACKEND_DATA"),
+        help="JSON con los datos iniciales del backend simulado (por defecto cuentas y un catálogo pequeño).",
+    )
+
+
+def pytest_configure(config):
+    # Solo el proceso principal lo levanta; los workers de xdist usan el mismo puerto
+    if not config.getoption("--fake-backend") or hasattr(config, "workerinput"):
+        return
+    api_url = urlsplit(API_URL)
+    data = config.getoption("--fake-backend-data")
+    config._fake_backend = FakeStickifyBackend(
+        api_url.hostname,
+        api_url.port or 80,
+        Latency.parse(config.getoption("--fake-backend-latency")),
+        load_data(data) if data else None,
+    ).start()
+
+
+def pytest_unconfigure(config):
+    fake_backend = getattr(config, "_fake_backend", None)
+    if fake_backend is not None:
+        fake_backend.stop()
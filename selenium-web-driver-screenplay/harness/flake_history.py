@@ -0,0 +1,148 @@
+"""Historial de resultados de las pruebas entre ejecuciones (SQLite) y pruebas intermitentes.
+
+    python -m harness.flake_history                   # las que más tiempo cuestan en reintentos
+    python -m harness.flake_history --window 50 --top 20
+
+Una ejecución "flaky" es la que falló y pasó al reintentarla; la tasa de intermitencia de una prueba es
+la fracción de ejecuciones flaky entre sus últimas `--window`.
+"""
+import argparse
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+DEFAULT_PATH = os.getenv("STICKIFY_FLAKE_DB", ".flake_history.sqlite")
+HISTORY_WINDOW = 30
+OUTCOMES = ("passed", "flaky", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    test TEXT NOT NULL,
+    run TEXT NOT NULL,
+    finished REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    retry_seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (test, finished);
+"""
+
+
+@dataclass(frozen=True)
+class TestResult:
+    __test__ = False  # no es una clase de pruebas para pytest
+
+    test: str
+    outcome: str  # passed, flaky o failed
+    attempts: int
+    duration: float  # todos los intentos
+    retry_seconds: float  # solo los intentos fallidos que se repitieron
+
+
+@dataclass(frozen=True)
+class FlakeStats:
+    test: str
+    runs: int
+    flaky: int
+    failed: int
+    mean_duration: float
+    retry_seconds: float
+
+    @property
+    def flake_rate(self) -> float:
+        return self.flaky / self.runs if self.runs else 0.0
+
+
+class FlakeHistory:
+    """Resultados de cada prueba en cada ejecución, en un SQLite local."""
+
+    # Solo escribe el proceso principal de pytest (una vez, al terminar la sesión);
+    # los workers de xdist solo leen la cuarentena al arrancar
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = Path(path)
+        self._connection = sqlite3.connect(self.path, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def record(self, results, run: str = None):
+        run = run or time.strftime("%Y%m%d_%H%M%S")
+        finished = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (result.test, run, finished, result.outcome, result.attempts, result.duration, result.retry_seconds)
+                    for result in results
+                ],
+            )
+
+    def stats(self, window: int = HISTORY_WINDOW) -> dict:
+        """{prueba: FlakeStats} de las últimas `window` ejecuciones de cada prueba."""
+        rows = self._connection.execute(
+            """
+            SELECT test, COUNT(*), SUM(outcome = 'flaky'), SUM(outcome = 'failed'), AVG(duration), SUM(retry_seconds)
+            FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY test ORDER BY finished DESC) AS position FROM results
+            )
+            WHERE position <= ?
+            GROUP BY test
+            """,
+            (window,),
+        )
+        return {row[0]: FlakeStats(*row) for row in rows}
+
+    def quarantined(self, threshold: float, min_runs: int, window: int = HISTORY_WINDOW) -> dict:
+        """{prueba: FlakeStats} de las que superan `threshold` de intermitencia (0 desactiva la cuarentena)."""
+        if threshold <= 0:
+            return {}
+        return {
+            test: stats for test, stats in self.stats(window).items()
+            if stats.runs >= min_runs and stats.flake_rate > threshold
+        }
+
+    def close(self):
+        self._connection.close()
+
+    def __repr__(self):
+        return f"<FlakeHistory {self.path}>"
+
+
+def format_stats(stats, top: int = 20) -> str:
+    """Primero las pruebas que más tiempo cuestan en reintentos."""
+
+    header = f"{'prueba':<70} {'ejec.':>5} {'flaky':>6} {'fallos':>6} {'tasa':>6} {'media s':>8} {'reintentos s':>13}"
+    lines = [header, "-" * len(header)]
+    ranked = sorted(stats, key=lambda item: (-item.retry_seconds, -item.flake_rate))
+    for item in [item for item in ranked if item.flaky or item.failed][:top]:
+        lines.append(
+            f"{item.test[-70:]:<70} {item.runs:>5} {item.flaky:>6} {item.failed:>6} {item.flake_rate:>6.0%} "
+            f"{item.mean_duration:>8.1f} {item.retry_seconds:>13.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m harness.flake_history", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--db", default=DEFAULT_PATH, help="archivo SQLite del historial")
+    parser.add_argument("--window", type=int, default=HISTORY_WINDOW, help="últimas ejecuciones de cada prueba")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if not Path(args.db).exists():
+        parser.error(f"No existe {args.db}: se crea al terminar una ejecución de pytest")
+    history = FlakeHistory(args.db)
+    try:
+        print(format_stats(history.stats(args.window).values(), args.top))
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import json
+import logging
+import time
+import zipfile
+from collections import deque
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from abilities.monitor_network import MonitorNetwork
+from harness.screenshots import safe_name
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 200
+# Cuerpos de respuesta que se guardan en el HAR: solo llamadas a la API y hasta este tamaño
+BODY_RESOURCE_TYPES = {"XHR", "Fetch"}
+MAX_BODY_BYTES = 256 * 1024
+
+
+class FlightRecorder:
+    """Historia reciente de un actor; solo se escribe a disco si su prueba falla."""
+
+    # Durante la prueba solo se añade a buffers circulares: los últimos `capacity` pasos y la
+    # consola (la red ya la guarda MonitorNetwork). write_bundle() junta en un zip el HAR de las
+    # últimas peticiones (con los cuerpos de la API), el DOM y una captura.
+
+    def __init__(self, browser, monitor: MonitorNetwork = None, capacity: int = DEFAULT_CAPACITY):
+        self.browser = browser
+        self.monitor = monitor
+        self.capacity = capacity
+        self.steps = deque(maxlen=capacity)
+        self.console = deque(maxlen=capacity)
+
+    @staticmethod
+    def of(actor, capacity: int = DEFAULT_CAPACITY) -> "FlightRecorder":
+        monitor = actor.ability_to(MonitorNetwork) if actor.has_ability_to(MonitorNetwork) else None
+        recorder = FlightRecorder(actor.ability_to(BrowseTheWeb).browser, monitor, capacity)
+        # Lo que dejó en la consola la prueba anterior de un navegador reutilizado
+        recorder.drain_console()
+        recorder.console.clear()
+        return recorder
+
+    def on_step(self, step):
+        """Listener de StepRecorder: el paso y su hora de inicio, para cuadrarlo con los logs del navegador."""
+        self.steps.append({**asdict(step), "wall_time": time.time() - step.duration})
+
+    def drain_console(self):
+        try:
+            self.console.extend(self.browser.get_log("browser"))
+        except Exception:  # navegador caído o sin log "browser"
+            pass
+
+    def write_bundle(self, path: Path, meta: dict) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.drain_console()
+        har = self.har()
+        files = {
+            "meta.json": json.dumps({**meta, "url": self._safely(lambda: self.browser.current_url)}, indent=1),
+            "steps.json": json.dumps(list(self.steps), indent=1),
+            "console.json": json.dumps(list(self.console), indent=1),
+            "network.har": json.dumps(har, indent=1),
+            "dom.html": self._safely(lambda: self.browser.page_source) or "",
+        }
+        screenshot = self._safely(self.browser.get_screenshot_as_png)
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as bundle:
+            for name, content in files.items():
+                bundle.writestr(name, content)
+            if screenshot:
+                bundle.writestr("screenshot.png", screenshot)
+        return path
+
+    def har(self) -> dict:
+        if self.monitor is None:
+            return har_from_events([], self.capacity)
+        self._safely(self.monitor.poll)
+        har = har_from_events(self.monitor.events, self.capacity)
+        for entry in har["log"]["entries"]:
+            if entry["_resourceType"] in BODY_RESOURCE_TYPES and entry["response"]["status"]:
+                self._attach_body(entry)
+        return har
+
+    def _attach_body(self, entry):
+        body = self._safely(
+            lambda: self.browser.execute_cdp_cmd("Network.getResponseBody", {"requestId": entry["_requestId"]})
+        )
+        if body and len(body.get("body", "")) <= MAX_BODY_BYTES:
+            entry["response"]["content"]["text"] = body["body"]
+            if body.get("base64Encoded"):
+                entry["response"]["content"]["encoding"] = "base64"
+
+    @staticmethod
+    def _safely(call):
+        try:
+            return call()
+        except Exception as error:
+            logger.debug("FlightRecorder: %s", error)
+            return None
+
+    def __repr__(self):
+        return f"<FlightRecorder {len(self.steps)} pasos, {len(self.console)} mensajes de consola>"
+
+
+def _iso(wall_time: float) -> str:
+    return datetime.fromtimestamp(wall_time, timezone.utc).isoformat()
+
+
+def _headers(headers: dict) -> list:
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+def har_from_events(events, limit: int) -> dict:
+    """HAR 1.2 de las últimas `limit` peticiones, a partir de los eventos Network de DevTools."""
+
+    entries = {}
+    redirects = 0
+    for message in events:
+        method, params = message.get("method"), message.get("params", {})
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            if request_id in entries and params.get("redirectResponse"):
+                # Misma requestId tras una redirección: la anterior queda como entrada propia
+                redirects += 1
+                _respond(entries[request_id], params["redirectResponse"])
+                entries[f"{request_id}#{redirects}"] = entries.pop(request_id)
+            entries[request_id] = _new_entry(request_id, params)
+            continue
+        entry = entries.get(request_id)
+        if entry is None:
+            continue
+        if method == "Network.responseReceived":
+            _respond(entry, params.get("response", {}))
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            entry["time"] = max(0.0, (params.get("timestamp", entry["_timestamp"]) - entry["_timestamp"]) * 1000)
+            entry["timings"]["wait"] = entry["time"]
+            if method == "Network.loadingFinished":
+                entry["response"]["bodySize"] = params.get("encodedDataLength", -1)
+            else:
+                entry["_error"] = params.get("errorText") or params.get("blockedReason")
+    return {
+        "log": {
+            "version": "1.2",
+            "creator": {"name": "stickify-flight-recorder", "version": "1"},
+            "entries": list(entries.values())[-limit:],
+        }
+    }
+
+
+def _new_entry(request_id: str, params: dict) -> dict:
+    request = params.get("request", {})
+    post_data = request.get("postData")
+    entry = {
+        "startedDateTime": _iso(params.get("wallTime", time.time())),
+        "time": 0.0,
+        "request": {
+            "method": request.get("method", "GET"),
+            "url": request.get("url", ""),
+            "httpVersion": "",
+            "headers": _headers(request.get("headers")),
+            "queryString": [],
+            "cookies": [],
+            "headersSize": -1,
+            "bodySize": len(post_data) if post_data else 0,
+        },
+        "response": {
+            "status": 0,
+            "statusText": "",
+            "httpVersion": "",
+            "headers": [],
+            "cookies": [],
+            "content": {"size": 0, "mimeType": ""},
+            "redirectURL": "",
+            "headersSize": -1,
+            "bodySize": -1,
+        },
+        "cache": {},
+        "timings": {"send": 0, "wait": 0, "receive": 0},
+        "_requestId": request_id,
+        "_resourceType": params.get("type"),
+        "_timestamp": params.get("timestamp", 0.0),
+    }
+    if post_data:
+        entry["request"]["postData"] = {"mimeType": request.get("headers", {}).get("Content-Type", ""), "text": post_data}
+    return entry
+
+
+def _respond(entry: dict, response: dict):
+    entry["response"].update({
+        "status": response.get("status", 0),
+        "statusText": response.get("statusText", ""),
+        "httpVersion": response.get("protocol", ""),
+        "headers": _headers(response.get("headers")),
+        "redirectURL": (response.get("headers") or {}).get("location", ""),
+    })
+    entry["response"]["content"]["mimeType"] = response.get("mimeType", "")
+
+
+def bundle_path(directory: Path, nodeid: str) -> Path:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return Path(directory) / f"{safe_name(nodeid)}_{timestamp}.zip"
@@ -0,0 +1,64 @@
+# Plugin de pytest: lleva la historia reciente del actor (harness/flight_recorder.py) y la escribe
+# en --trace-dir cuando la prueba falla. Se registra desde tests/conftest.py.
+import os
+from datetime import datetime
+
+import pytest
+
+from harness.flight_recorder import FlightRecorder, bundle_path
+from harness.step_recorder import STEP_RECORDER
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--flight-recorder",
+        type=int,
+        default=int(os.getenv("STICKIFY_FLIGHT_RECORDER", "200")),
+        help="Pasos, mensajes de consola y peticiones recientes que se guardan en la traza de una prueba fallida (0 = sin traza).",
+    )
+    parser.addoption("--trace-dir", default="traces", help="Carpeta de las trazas de pruebas fallidas.")
+
+
+def pytest_configure(config):
+    # Los pasos de la traza llegan de los eventos del StepRecorder
+    if config.getoption("--flight-recorder"):
+        STEP_RECORDER.install()
+
+
+def pytest_unconfigure(config):
+    STEP_RECORDER.uninstall()
+
+
+@pytest.fixture(autouse=True)
+def _flight_recorder(request):
+    """Historia reciente del actor; solo se escribe a disco si la prueba falla."""
+    capacity = request.config.getoption("--flight-recorder")
+    if not capacity or "actor" not in request.fixturenames:
+        yield
+        return
+    recorder = request.node._flight_recorder = FlightRecorder.of(request.getfixturevalue("actor"), capacity)
+    STEP_RECORDER.add_listener(recorder.on_step)
+
+    yield
+
+    STEP_RECORDER.remove_listener(recorder.on_step)
+    # Vacía la consola: en un navegador reutilizado no debe aparecer en la traza de la siguiente prueba
+    recorder.drain_console()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+
+    recorder = getattr(item, "_flight_recorder", None)
+    if rep.when != "call" or not rep.failed or recorder is None:
+        return
+    path = recorder.write_bundle(
+        bundle_path(item.config.getoption("--trace-dir"), item.nodeid),
+        {"test": item.nodeid, "error": rep.longreprtext, "duration": rep.duration, "time": datetime.now().isoformat()},
+    )
+    rep.sections.append(("Traza", f"python -m harness.trace_viewer {path}"))
+    pytest_html = item.config.pluginmanager.get_plugin("html")
+    if pytest_html:
+        rep.extras = [*getattr(rep, "extras", []), pytest_html.extras.url(str(path.resolve().as_uri()), name="Traza")]
@@ -0,0 +1,47 @@
+# Cuenta las peticiones XHR/fetch en curso de la página. Se instala con
+# Page.addScriptToEvaluateOnNewDocument para que cada documento nuevo lo tenga
+# desde antes de que Angular haga su primera petición.
+TRACKER_SCRIPT = """
+(() => {
+  if (window.__stickifyNet) { return; }
+  const net = window.__stickifyNet = { pending: 0, lastChange: Date.now() };
+  const begin = () => { net.pending += 1; net.lastChange = Date.now(); };
+  const end = () => { net.pending = Math.max(0, net.pending - 1); net.lastChange = Date.now(); };
+
+  const send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function (...args) {
+    begin();
+    this.addEventListener('loadend', end, { once: true });
+    return send.apply(this, args);
+  };
+
+  if (window.fetch) {
+    const originalFetch = window.fetch;
+    window.fetch = function (...args) {
+      begin();
+      return originalFetch.apply(this, args).finally(end);
+    };
+  }
+})();
+"""
+
+STATE_SCRIPT = """
+if (!window.__stickifyNet) { return null; }
+return { pending: window.__stickifyNet.pending, quietMs: Date.now() - window.__stickifyNet.lastChange };
+"""
+
+
+def install_network_tracker(driver):
+    """Instala el tracker en cada documento que cargue el navegador."""
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_SCRIPT})
+
+
+def network_state(driver):
+    """Devuelve {'pending': n, 'quietMs': ms}; instala el tracker si la página no lo tiene."""
+
+    state = driver.execute_script(STATE_SCRIPT)
+    if state is None:
+        # Página cargada antes de instalar el tracker: lo que ya estaba en vuelo no se ve
+        driver.execute_script(TRACKER_SCRIPT)
+        state = driver.execute_script(STATE_SCRIPT)
+    return state
@@ -0,0 +1,21 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+
+def poll_with_backoff(condition, timeout: float, description: str,
+                      first_interval: float = 0.05, factor: float = 1.5, max_interval: float = 0.5) -> float:
+    """Llama a `condition` hasta que sea verdadera y devuelve los segundos que tardó."""
+    # El intervalo crece de first_interval a max_interval: lo rápido vuelve enseguida
+    # y lo lento no satura al driver
+
+    start = time.monotonic()
+    interval = first_interval
+    while True:
+        if condition():
+            return time.monotonic() - start
+        elapsed = time.monotonic() - start
+        if elapsed >= timeout:
+            raise TimeoutException(f"{description} no se cumplió en {timeout} s")
+        time.sleep(min(interval, timeout - elapsed))
+        interval = min(interval * factor, max_interval)
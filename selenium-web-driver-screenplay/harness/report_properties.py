@@ -0,0 +1,12 @@
+# user_properties de los reportes de teardown, que los plugins de harness/ resumen al final de la sesión.
+
+
+def teardown_properties(config):
+    """{nodeid: user_properties} de los reportes de teardown (también los que llegan de los workers de xdist)."""
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    properties = {}
+    for reports in (reporter.stats.values() if reporter else []):
+        for report in reports:
+            if getattr(report, "when", None) == "teardown" and report.user_properties:
+                properties[report.nodeid] = dict(report.user_properties)
+    return properties
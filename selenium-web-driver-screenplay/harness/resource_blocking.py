@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from urllib.parse import urlsplit
+
+
+# Network.setBlockedURLs solo entiende patrones de URL: cada tipo se traduce a los suyos
+RESOURCE_TYPE_PATTERNS = {
+    "image": (
+        "*.png", "*.png?*", "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.gif", "*.webp", "*.webp?*", "*.svg",
+        "*.ico", "*mzstatic.com/image/*",  # carátulas de iTunes (artworkUrl100)
+    ),
+    "font": ("*.woff", "*.woff?*", "*.woff2", "*.woff2?*", "*.ttf", "*.otf", "*fonts.gstatic.com/*"),
+    "media": ("*.mp3", "*.m4a", "*.aac", "*.wav", "*.ogg", "*.mp4", "*audio-ssl.itunes.apple.com/*"),
+}
+# Tipos de DevTools (Network.requestWillBeSent.type) de cada tipo de arriba
+DEVTOOLS_TYPES = {"image": "Image", "font": "Font", "media": "Media"}
+# Lo que la app necesita para funcionar nunca se bloquea por tamaño
+ESSENTIAL_DEVTOOLS_TYPES = {"Document", "Script", "Stylesheet", "XHR", "Fetch", "Preflight"}
+
+
+@dataclass(frozen=True)
+class BlockingProfile:
+    """Lo que no descarga un navegador de prueba: tipos de recurso, patrones de URL y archivos grandes de terceros."""
+
+    name: str
+    resource_types: frozenset = frozenset()
+    url_globs: tuple = ()
+    # Recursos de terceros que ya pesaron más que esto se bloquean en las siguientes pruebas
+    max_bytes: int = None
+
+
+PROFILES = {
+    "off": BlockingProfile("off"),
+    # Sin fuentes los iconos de Font Awesome miden 0 px y los botones con solo icono dejan de ser "visibles"
+    "lean": BlockingProfile("lean", frozenset({"image", "media"}), max_bytes=512 * 1024),
+    "aggressive": BlockingProfile(
+        "aggressive", frozenset({"image", "media", "font"}), ("*googletagmanager.com/*",), max_bytes=100 * 1024
+    ),
+}
+
+
+def profile_named(name: str) -> BlockingProfile:
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Perfil de bloqueo desconocido: {name!r} (disponibles: {', '.join(PROFILES)})") from None
+
+
+@dataclass
+class BlockedStats:
+    requests: int = 0
+    bytes_saved: int = 0
+    estimated: int = 0  # peticiones cuyo tamaño se estimó con la media de su tipo
+
+
+class ResourceBlocker:
+    """Aplica un BlockingProfile a los navegadores y estima lo que ahorra."""
+
+    # Network.setBlockedURLs de DevTools se puede cambiar entre pruebas en un navegador del pool:
+    # apply(driver, allow=...) desbloquea los tipos que una prueba comprueba. Los tamaños de lo
+    # descargado se recuerdan para estimar lo bloqueado.
+
+    def __init__(self, profile: BlockingProfile, own_origins=()):
+        self.profile = profile
+        # La app y el backend nunca se bloquean por tamaño (main.js de `ng serve` pesa varios MB)
+        self.own_hosts = {urlsplit(origin).netloc for origin in own_origins}
+        self.learned_urls = set()
+        self.known_sizes = {}
+        self._sizes_by_type = {}
+
+    def patterns(self, allow=()) -> list:
+        allowed = set(allow)
+        patterns = [
+            pattern
+            for resource_type in sorted(self.profile.resource_types - allowed)
+            for pattern in RESOURCE_TYPE_PATTERNS[resource_type]
+        ]
+        patterns.extend(self.profile.url_globs)
+        allowed_devtools_types = {DEVTOOLS_TYPES[resource_type] for resource_type in allowed if resource_type in DEVTOOLS_TYPES}
+        patterns.extend(
+            url for url in sorted(self.learned_urls)
+            if self.known_sizes.get(url, (None,))[0] not in allowed_devtools_types
+        )
+        return patterns
+
+    def apply(self, driver, allow=()):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns(allow)})
+
+    def account(self, monitor) -> BlockedStats:
+        """Aprende tamaños de un MonitorNetwork y devuelve lo que habrían costado sus peticiones bloqueadas."""
+
+        monitor.poll()
+        for url, (resource_type, size) in monitor.sizes.items():
+            self.known_sizes[url] = (resource_type, size)
+            self._sizes_by_type.setdefault(resource_type, []).append(size)
+            if self._too_big(url, resource_type, size):
+                self.learned_urls.add(url)
+
+        stats = BlockedStats()
+        for url, resource_type in monitor.blocked:
+            stats.requests += 1
+            if url in self.known_sizes:
+                stats.bytes_saved += self.known_sizes[url][1]
+            elif self._sizes_by_type.get(resource_type):
+                sizes = self._sizes_by_type[resource_type]
+                stats.bytes_saved += sum(sizes) // len(sizes)
+                stats.estimated += 1
+        monitor.blocked.clear()
+        monitor.sizes.clear()
+        return stats
+
+    def _too_big(self, url: str, resource_type: str, size: int) -> bool:
+        if self.profile.max_bytes is None or size <= self.profile.max_bytes or resource_type in ESSENTIAL_DEVTOOLS_TYPES:
+            return False
+        return url.startswith("http") and urlsplit(url).netloc not in self.own_hosts
+
+    def is_blocked(self, url: str, allow=()) -> bool:
+        return any(fnmatch(url, pattern) for pattern in self.patterns(allow))
+
+    def __repr__(self):
+        return f"<ResourceBlocker {self.profile.name}: {len(self.learned_urls)} URLs aprendidas>"
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
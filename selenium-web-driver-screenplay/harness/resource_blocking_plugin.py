@@ -0,0 +1,55 @@
+# Plugin de pytest: bloqueo de imágenes, fuentes y audio en el navegador (harness/resource_blocking.py)
+# y resumen de lo que se ahorró. Se registra desde tests/conftest.py.
+import html
+import os
+
+import pytest
+
+from actions.log_in_via_api import APP_URL
+from harness.api_client import API_URL
+from harness.report_properties import teardown_properties
+from harness.resource_blocking import PROFILES, ResourceBlocker, format_bytes, profile_named
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--block-resources",
+        choices=sorted(PROFILES),
+        default=os.getenv("STICKIFY_BLOCK_RESOURCES", "lean"),
+        help="Recursos que el navegador no descarga (harness/resource_blocking.py).",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "allow_resources(*types): no bloquear esos tipos (image, font, media) en esta prueba"
+    )
+
+
+@pytest.fixture(scope="session")
+def resource_blocker(request):
+    """Bloqueo de imágenes, audio, etc. común a la sesión; recuerda los tamaños vistos."""
+    return ResourceBlocker(profile_named(request.config.getoption("--block-resources")), (APP_URL, API_URL))
+
+
+def _blocked_summary(config):
+    blocked = [test for test in teardown_properties(config).values() if "blocked_requests" in test]
+    if not blocked:
+        return []
+    requests_blocked = sum(test["blocked_requests"] for test in blocked)
+    bytes_saved = sum(test["bytes_saved"] for test in blocked)
+    return [
+        f"Recursos bloqueados ({config.getoption('--block-resources')}): {requests_blocked} peticiones, "
+        f"~{format_bytes(bytes_saved)} ahorrados en {len(blocked)} pruebas"
+    ]
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    for line in _blocked_summary(config):
+        terminalreporter.write_line(line)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    for line in _blocked_summary(session.config):
+        prefix.append(f"<p>{html.escape(line)}</p>")
@@ -0,0 +1,195 @@
+# Plugin de pytest: repite solo la prueba que falla y pone en cuarentena las intermitentes
+# según el historial de harness/flake_history.py. Se registra desde tests/conftest.py.
+import html
+import os
+from pathlib import Path
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+from harness.flake_history import DEFAULT_PATH as DEFAULT_FLAKE_DB, FlakeHistory, TestResult
+from harness.step_recorder import STEP_RECORDER
+
+
+QUARANTINED = "quarantined"  # user_property de los fallos de una prueba en cuarentena
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--retries",
+        type=int,
+        default=int(os.getenv("STICKIFY_RETRIES", "1")),
+        help="Veces que se repite una prueba que falla (solo esa prueba, no la suite).",
+    )
+    parser.addoption(
+        "--flake-db",
+        default=DEFAULT_FLAKE_DB,
+        help="SQLite con el historial de resultados entre ejecuciones (vacío para desactivarlo); también STICKIFY_FLAKE_DB.",
+    )
+    parser.addoption(
+        "--quarantine-threshold",
+        type=float,
+        default=float(os.getenv("STICKIFY_QUARANTINE_THRESHOLD", "0.2")),
+        help="Una prueba con más de esta fracción de ejecuciones intermitentes queda en cuarentena: sus fallos no cambian el código de salida (0 = sin cuarentena).",
+    )
+    parser.addoption(
+        "--quarantine-min-runs",
+        type=int,
+        default=5,
+        help="Ejecuciones del historial necesarias antes de poner una prueba en cuarentena.",
+    )
+
+
+def _load_quarantine(config):
+    """Pruebas en cuarentena según el historial (el archivo se crea al terminar la primera ejecución)."""
+    path = config.getoption("--flake-db")
+    if not path or not Path(path).exists():
+        return {}
+    history = FlakeHistory(path)
+    try:
+        return history.quarantined(config.getoption("--quarantine-threshold"), config.getoption("--quarantine-min-runs"))
+    finally:
+        history.close()
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", f"{QUARANTINED}: prueba intermitente según --flake-db (lo añade el plugin, no se escribe a mano)"
+    )
+    config._quarantined = _load_quarantine(config)
+
+
+def pytest_collection_modifyitems(config, items):
+    # Con el marcador se pueden excluir o elegir: -m "not quarantined"
+    for item in items:
+        if item.nodeid in config._quarantined:
+            item.add_marker(QUARANTINED)
+
+
+def _is_quarantined(report) -> bool:
+    return any(name == QUARANTINED for name, _ in report.user_properties)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Ejecuta la prueba y, si su llamada falla, la repite hasta `--retries` veces."""
+    # Cada intento es un runtestprotocol completo, con fixtures nuevas; los fallidos se reportan como "rerun"
+
+    retries = max(item.config.getoption("--retries"), 0)
+    stats = item.config._quarantined.get(item.nodeid)
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    for attempt in range(retries + 1):
+        STEP_RECORDER.current_test = item.nodeid
+        try:
+            reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        finally:
+            STEP_RECORDER.current_test = None
+        call = next((report for report in reports if report.when == "call"), None)
+        retry = attempt < retries and call is not None and call.failed
+        if call is not None:
+            call.user_properties.append(("attempt_duration", sum(report.duration for report in reports)))
+            if retry:
+                call.outcome = "rerun"
+            elif call.failed and stats is not None:
+                call.user_properties.append(
+                    (QUARANTINED, f"intermitente en {stats.flaky} de sus últimas {stats.runs} ejecuciones")
+                )
+        for report in reports:
+            item.ihook.pytest_runtest_logreport(report=report)
+        if not retry:
+            break
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+def pytest_report_teststatus(report, config):
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+    if report.when == "call" and report.failed and _is_quarantined(report):
+        # Sigue siendo un fallo (para --lf y los reportes); solo cambia cómo se muestra
+        return "failed", "F", "FAILED (cuarentena)"
+    return None
+
+
+def _reports(config, when=None):
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    for reports in (reporter.stats.values() if reporter else []):
+        for report in reports:
+            if when is None or getattr(report, "when", None) == when:
+                yield report
+
+
+def _attempt_duration(report) -> float:
+    return dict(report.user_properties).get("attempt_duration", report.duration)
+
+
+def _run_results(config):
+    """TestResult de cada prueba de esta ejecución, a partir de sus reportes "call" (también los de los workers)."""
+    calls = {}
+    for report in _reports(config, "call"):
+        calls.setdefault(report.nodeid, []).append(report)
+    results = []
+    for nodeid, reports in calls.items():
+        reruns = [report for report in reports if report.outcome == "rerun"]
+        final = next((report for report in reports if report.outcome != "rerun"), None)
+        if final is None or final.skipped:
+            continue
+        outcome = "failed" if final.failed else "flaky" if reruns else "passed"
+        retry_seconds = sum(_attempt_duration(report) for report in reruns)
+        results.append(TestResult(nodeid, outcome, len(reruns) + 1, retry_seconds + _attempt_duration(final), retry_seconds))
+    return results
+
+
+def _only_quarantined_failures(config) -> bool:
+    failed = [report for report in _reports(config) if getattr(report, "outcome", None) == "failed"]
+    return bool(failed) and all(report.when == "call" and _is_quarantined(report) for report in failed)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if hasattr(session.config, "workerinput"):
+        return
+    results = _run_results(session.config)
+    if session.config.getoption("--flake-db") and results:
+        history = FlakeHistory(session.config.getoption("--flake-db"))
+        try:
+            history.record(results)
+        finally:
+            history.close()
+    # Los fallos en cuarentena se reportan, pero no rompen el pipeline
+    if exitstatus == pytest.ExitCode.TESTS_FAILED and _only_quarantined_failures(session.config):
+        session.exitstatus = pytest.ExitCode.OK
+
+
+def _flake_summary(config):
+    results = _run_results(config)
+    flaky = [result for result in results if result.outcome == "flaky"]
+    lines = []
+    if flaky:
+        lines.append(
+            f"Pruebas intermitentes (pasaron al reintentar): {len(flaky)}, "
+            f"{sum(result.retry_seconds for result in flaky):.1f} s en intentos fallidos"
+        )
+        lines.extend(f"  {result.test} ({result.attempts} intentos)" for result in flaky)
+    if config._quarantined:
+        failed = {report.nodeid for report in _reports(config, "call") if report.failed and _is_quarantined(report)}
+        lines.append(
+            f"En cuarentena (sus fallos no cambian el código de salida): {len(config._quarantined)}, "
+            f"{len(failed)} fallaron en esta ejecución"
+        )
+        lines.extend(
+            f"  {test} ({stats.flake_rate:.0%} intermitente, {stats.retry_seconds:.0f} s en reintentos)"
+            f"{' - FALLÓ' if test in failed else ''}"
+            for test, stats in sorted(config._quarantined.items(), key=lambda item: -item[1].retry_seconds)
+        )
+    return lines
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    for line in _flake_summary(config):
+        terminalreporter.write_line(line)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    for line in _flake_summary(session.config):
+        prefix.append(f"<p>{html.escape(line)}</p>")
@@ -0,0 +1,137 @@
+import hashlib
+import io
+import logging
+import queue
+import random
+import re
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {"png": "image/png", "webp": "image/webp", "jpeg": "image/jpeg"}
+POLICIES = ("off", "failures", "all", "sampled", "steps")
+
+
+@dataclass(frozen=True)
+class ScreenshotPolicy:
+    """Cuándo capturar: "failures", "all", "sampled:0.1" (fallos + 10 % del resto), "steps" u "off"."""
+
+    mode: str = "failures"
+    rate: float = 0.0
+
+    @staticmethod
+    def parse(text: str) -> "ScreenshotPolicy":
+        mode, _, rate = (text or "failures").partition(":")
+        if mode not in POLICIES:
+            raise ValueError(f"Política de capturas desconocida: {text!r} (use {', '.join(POLICIES)})")
+        return ScreenshotPolicy(mode, float(rate or 0.1) if mode == "sampled" else 0.0)
+
+    def after_test(self, failed: bool) -> bool:
+        if self.mode == "off":
+            return False
+        if failed or self.mode in ("all", "steps"):
+            return True
+        return self.mode == "sampled" and random.random() < self.rate
+
+    @property
+    def after_each_step(self) -> bool:
+        return self.mode == "steps"
+
+
+def safe_name(text: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", text)[:150]
+
+
+class ScreenshotWriter:
+    """Codifica y escribe las capturas en un hilo aparte."""
+
+    # submit() recibe el PNG de get_screenshot_as_png() y vuelve enseguida con un Future de la ruta.
+    # Una captura idéntica a otra ya escrita no se repite: el Future apunta al archivo existente.
+    # JPEG/WebP y max_width necesitan Pillow.
+
+    def __init__(self, directory: Path, image_format: str = "png", max_width: int = None, quality: int = 80):
+        if image_format not in FORMATS:
+            raise ValueError(f"Formato de captura desconocido: {image_format!r} (use {', '.join(FORMATS)})")
+        if image_format != "png" or max_width:
+            try:
+                import PIL.Image  # noqa: F401
+            except ImportError:
+                raise RuntimeError(
+                    f"Las capturas en {image_format} o reducidas necesitan Pillow: pip install Pillow"
+                ) from None
+        self.directory = Path(directory)
+        self.image_format = image_format
+        self.max_width = max_width
+        self.quality = quality
+        self.written = 0
+        self.duplicates = 0
+        self._by_hash = {}
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def mime_type(self) -> str:
+        return FORMATS[self.image_format]
+
+    def submit(self, png: bytes, name: str) -> Future:
+        digest = hashlib.sha1(png).hexdigest()
+        with self._lock:
+            if digest in self._by_hash:
+                self.duplicates += 1
+                return self._by_hash[digest]
+            future = self._by_hash[digest] = Future()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+                self._thread.start()
+        self._queue.put((png, self.directory / f"{safe_name(name)}.{self.image_format}", future))
+        return future
+
+    def capture(self, driver, name: str):
+        """Captura ahora y escribe después; None si el navegador ya no responde."""
+        try:
+            png = driver.get_screenshot_as_png()
+        except Exception as error:  # navegador caído o sin ventana
+            logger.warning("No se pudo capturar la pantalla (%s): %s", name, error)
+            return None
+        return self.submit(png, name)
+
+    def encode(self, png: bytes) -> bytes:
+        if self.image_format == "png" and not self.max_width:
+            return png
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(png))
+        if self.max_width and image.width > self.max_width:
+            image = image.resize((self.max_width, round(image.height * self.max_width / image.width)), Image.LANCZOS)
+        if self.image_format == "jpeg":
+            image = image.convert("RGB")
+        output = io.BytesIO()
+        image.save(output, self.image_format.upper(), quality=self.quality)
+        return output.getvalue()
+
+    def _run(self):
+        while True:
+            png, path, future = self._queue.get()
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(self.encode(png))
+                self.written += 1
+                future.set_result(path)
+            except Exception as error:
+                future.set_exception(error)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Espera a que todas las capturas enviadas estén en disco."""
+
+        if self._thread is not None:
+            self._queue.join()
+
+    def __repr__(self):
+        return f"<ScreenshotWriter {self.directory} {self.image_format}: {self.written} escritas, {self.duplicates} repetidas>"
@@ -0,0 +1,112 @@
+# Plugin de pytest: capturas de pantalla del actor según --screenshots (harness/screenshots.py),
+# escritas en otro hilo y adjuntas a report.html si la prueba falla. Se registra desde tests/conftest.py.
+import base64
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from harness.screenshots import FORMATS as SCREENSHOT_FORMATS, ScreenshotPolicy, ScreenshotWriter
+from harness.step_recorder import STEP_RECORDER
+
+
+logger = logging.getLogger(__name__)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--screenshots",
+        default=os.getenv("STICKIFY_SCREENSHOTS", "failures"),
+        help="Cuándo capturar pantalla: failures, all, sampled:0.1, steps u off.",
+    )
+    parser.addoption(
+        "--screenshot-format",
+        choices=sorted(SCREENSHOT_FORMATS),
+        default=os.getenv("STICKIFY_SCREENSHOT_FORMAT", "png"),
+        help="Formato de las capturas; webp y jpeg necesitan Pillow.",
+    )
+    parser.addoption(
+        "--screenshot-max-width",
+        type=int,
+        default=int(os.getenv("STICKIFY_SCREENSHOT_MAX_WIDTH", "0")),
+        help="Ancho máximo de las capturas en píxeles (0 = tamaño original; necesita Pillow).",
+    )
+    parser.addoption("--screenshot-dir", default="screenshots", help="Carpeta de las capturas.")
+
+
+def pytest_configure(config):
+    try:
+        config._screenshot_policy = ScreenshotPolicy.parse(config.getoption("--screenshots"))
+        config._screenshot_writer = ScreenshotWriter(
+            Path(config.getoption("--screenshot-dir")),
+            config.getoption("--screenshot-format"),
+            config.getoption("--screenshot-max-width") or None,
+        )
+    except (ValueError, RuntimeError) as error:
+        raise pytest.UsageError(str(error)) from None
+    # Las capturas por paso cuelgan de los eventos del StepRecorder
+    if config._screenshot_policy.after_each_step:
+        STEP_RECORDER.install()
+
+
+def pytest_unconfigure(config):
+    STEP_RECORDER.uninstall()
+    screenshot_writer = getattr(config, "_screenshot_writer", None)
+    if screenshot_writer is not None:
+        screenshot_writer.flush()
+
+
+@pytest.fixture(autouse=True)
+def _step_screenshots(request):
+    """Con --screenshots steps: una captura tras cada paso de primer nivel del actor."""
+    if not request.config._screenshot_policy.after_each_step or "actor" not in request.fixturenames:
+        yield
+        return
+    driver = request.getfixturevalue("actor").ability_to(BrowseTheWeb).browser
+    writer = request.config._screenshot_writer
+    counter = iter(range(1, 10**6))
+
+    def listener(step):
+        if step.depth == 0:
+            writer.capture(driver, f"{request.node.name}_{next(counter):03d}_{step.action}")
+
+    STEP_RECORDER.add_listener(listener)
+
+    yield
+
+    STEP_RECORDER.remove_listener(listener)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+
+    if rep.when != "call" or "actor" not in item.funcargs:
+        return
+    if not item.config._screenshot_policy.after_test(rep.failed):
+        return
+    writer = item.config._screenshot_writer
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    status = "PASSED" if rep.passed else "FAILED"
+    # Solo se toman los bytes aquí; la codificación y la escritura van en otro hilo
+    browser = item.funcargs["actor"].ability_to(BrowseTheWeb).browser
+    screenshot = writer.capture(browser, f"{item.name}_{status}_{timestamp}")
+
+    # Al reporte HTML solo van los fallos: se espera a que esa captura esté escrita
+    pytest_html = item.config.pluginmanager.get_plugin("html")
+    if screenshot is None or not rep.failed or not pytest_html:
+        return
+    try:
+        content = screenshot.result(timeout=30).read_bytes()
+    except Exception as e:
+        logger.warning("Error al capturar la pantalla: %s", e)
+        return
+    extra = getattr(rep, "extras", [])
+    extra.append(pytest_html.extras.image(
+        base64.b64encode(content).decode(), mime_type=writer.mime_type, extension=writer.image_format
+    ))
+    rep.extras = extra
@@ -0,0 +1,172 @@
+import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+
+from harness.api_client import StickifyApi, pooled_session
+
+
+logger = logging.getLogger(__name__)
+
+SEED_PASSWORD = "Seed123!"
+# trackIds altos (columna integer) para no chocar con el catálogo real
+SEED_TRACK_ID_RANGE = (2_000_000_000, 2_100_000_000)
+
+
+def make_song(track_id: int = None, **fields) -> dict:
+    """Cuerpo de CreateSongDto con valores por defecto para canciones de prueba."""
+    track_id = track_id or random.randint(*SEED_TRACK_ID_RANGE)
+    song = {
+        "trackId": track_id,
+        "artistName": "E2E Artist",
+        "trackName": f"E2E Track {track_id}",
+        "primaryGenreName": "Rock",
+        "collectionName": "E2E Album",
+        "artworkUrl100": "",
+        "releaseDate": datetime.now(timezone.utc).isoformat(),
+        "isUserUpload": True,
+        "collectionId": track_id,
+        "artistId": track_id,
+    }
+    song.update(fields)
+    return song
+
+
+def make_playlist(playlist_id: str, owner_email: str, track_ids=(), **fields) -> dict:
+    playlist = {
+        "id": playlist_id,
+        "name": f"E2E {playlist_id}",
+        "trackIds": [str(track_id) for track_id in track_ids],
+        "type": "user",
+        "createdBy": owner_email,
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+    }
+    playlist.update(fields)
+    return playlist
+
+
+class Seeder:
+    """Crea datos de prueba a través de la API REST y los elimina al terminar."""
+
+    # Las peticiones independientes de una llamada van en paralelo sobre un pool de conexiones.
+    # Cada llamada registra su limpieza; teardown() las ejecuta de la más nueva a la más vieja
+    # y solo quita lo que creó este seeder.
+
+    def __init__(self, api: StickifyApi = None, max_workers: int = 8):
+        self.api = api or StickifyApi(session=pooled_session(max_workers))
+        self._owns_api = api is None
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="seed")
+        self._cleanups = []
+
+    def run_all(self, calls) -> list:
+        """Ejecuta las funciones sin argumentos en paralelo y devuelve sus resultados en orden."""
+        futures = [self._executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+    def _on_teardown(self, calls):
+        calls = list(calls)
+        if calls:
+            self._cleanups.append(calls)
+
+    # --- USERS ---
+    def users(self, *accounts) -> list:
+        """Asegura que existan las cuentas y devuelve sus usuarios del backend, en orden."""
+        created = self.run_all([lambda account=account: self._sign_up(account) for account in accounts])
+        users = self.run_all([lambda account=account: self.api.find_user_by_email(account.email) for account in accounts])
+        self._on_teardown(
+            lambda user_id=user["id"]: self.api.delete_user(user_id)
+            for user, was_created in zip(users, created) if was_created
+        )
+        return users
+
+    def _sign_up(self, account) -> bool:
+        try:
+            self.api.sign_up(account.username, account.email, account.password or SEED_PASSWORD)
+            return True
+        except requests.HTTPError as error:
+            # 400 = el usuario ya existe (violación de unicidad en el backend)
+            if error.response is None or error.response.status_code != 400:
+                raise
+            return False
+
+    def delete_user_afterwards(self, email: str):
+        """Elimina al terminar un usuario creado fuera del seeder (p. ej. con el formulario de registro)."""
+
+        def delete():
+            user = self.api.find_user_by_email(email)
+            if user:
+                self.api.delete_user(user["id"])
+
+        self._on_teardown([delete])
+
+    # --- SONGS ---
+    def songs(self, songs: list) -> list:
+        """Crea las canciones con un solo POST /songs/batch."""
+        created = self.api.create_songs_batch(songs)
+        self._on_teardown(lambda track_id=song["trackId"]: self.api.delete_song(track_id) for song in created)
+        return created
+
+    # --- PLAYLISTS ---
+    def playlists(self, playlists: list) -> list:
+        created = self.run_all([lambda playlist=playlist: self.api.create_playlist(playlist) for playlist in playlists])
+        self._on_teardown(lambda playlist_id=playlist["id"]: self.api.delete_playlist(playlist_id) for playlist in playlists)
+        return created
+
+    # --- RATINGS ---
+    def ratings(self, ratings) -> list:
+        """Valora con un solo POST /ratings/batch; `ratings` son tuplas (username, track_id, rating)."""
+        # Al terminar se borran solo las valoraciones nuevas y se restauran las sobrescritas
+        ratings = list(ratings)
+        created = [{"userId": user_id, "trackId": track_id, "rating": rating} for user_id, track_id, rating in ratings]
+        if not created:
+            return created
+        # Lo que ya existía (p. ej. en una cuenta compartida) se restaura al terminar, no se borra
+        user_ids = list(dict.fromkeys(user_id for user_id, _, _ in ratings))
+        previous = {
+            (rating["userId"], int(rating["trackId"])): rating["rating"]
+            for existing in self.run_all([lambda user_id=user_id: self.api.user_ratings(user_id) for user_id in user_ids])
+            for rating in existing
+        }
+        self.api.rate_many(created)
+        touched = dict.fromkeys((user_id, int(track_id)) for user_id, track_id, _ in ratings)
+        restore = [
+            {"userId": user_id, "trackId": track_id, "rating": previous[user_id, track_id]}
+            for user_id, track_id in touched if (user_id, track_id) in previous
+        ]
+        self._on_teardown([
+            *(
+                lambda user_id=user_id, track_id=track_id: self.api.delete_rating(user_id, track_id)
+                for user_id, track_id in touched if (user_id, track_id) not in previous
+            ),
+            *([lambda: self.api.rate_many(restore)] if restore else []),
+        ])
+        return created
+
+    # --- FOLLOWS ---
+    def follows(self, follower_id: str, target_emails, follow: bool = True) -> list:
+        """Deja el seguimiento hacia cada usuario como se pide; al terminar solo se deshace lo cambiado."""
+
+        changed = [email for email in target_emails if self.api.is_following(follower_id, email) != follow]
+        # Cada seguimiento es su propia arista en user_follows: se pueden cambiar en paralelo
+        results = self.run_all([lambda email=email: self.api.toggle_follow(follower_id, email, follow) for email in changed])
+        self._on_teardown(lambda email=email: self.api.toggle_follow(follower_id, email, not follow) for email in changed)
+        return results
+
+    # --- TEARDOWN ---
+    def teardown(self):
+        while self._cleanups:
+            for future in [self._executor.submit(call) for call in self._cleanups.pop()]:
+                try:
+                    future.result()
+                except requests.RequestException as error:
+                    # 404 = ya se había borrado (p. ej. la propia prueba lo eliminó)
+                    if getattr(error.response, "status_code", None) != 404:
+                        logger.warning("Limpieza de datos de prueba fallida: %s", error)
+
+    def close(self):
+        self.teardown()
+        self._executor.shutdown()
+        if self._owns_api:
+            self.api.close()
@@ -0,0 +1,37 @@
+# Plugin de pytest: fixtures con los datos creados por API (harness/seeding.py) y las cuentas
+# de prueba (harness/accounts.py). Se registra desde tests/conftest.py.
+import os
+
+import pytest
+
+from harness import accounts as test_accounts
+from harness.seeding import Seeder
+
+
+@pytest.fixture(scope="session")
+def session_seeder():
+    """Datos creados por API para toda la sesión; se eliminan al terminar."""
+    seeder = Seeder()
+
+    yield seeder
+
+    seeder.close()
+
+
+@pytest.fixture
+def seed():
+    """Datos creados por API para una sola prueba; se eliminan al terminarla."""
+    seeder = Seeder()
+
+    yield seeder
+
+    seeder.close()
+
+
+@pytest.fixture(scope="session")
+def accounts(session_seeder):
+    """Cuentas de prueba: las compartidas en modo serie, unas propias por worker con pytest-xdist."""
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    if worker_id is None:
+        return test_accounts.provision(session_seeder, test_accounts.SHARED_ACCOUNTS, "main")
+    return test_accounts.provision(session_seeder, test_accounts.for_worker(worker_id), worker_id)
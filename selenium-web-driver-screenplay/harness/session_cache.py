@@ -0,0 +1,90 @@
+import base64
+import json
+import time
+from dataclasses import dataclass, field
+
+
+# Un token que vence en menos de esto se descarta y se vuelve a iniciar sesión
+EXPIRY_MARGIN_SECONDS = 300
+
+
+def token_expiry(token: str) -> float:
+    """El claim `exp` de un JWT como timestamp (infinito si no lo tiene)."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError):
+        return 0.0
+    return float(claims.get("exp", float("inf")))
+
+
+@dataclass
+class StoredSession:
+    """Almacenamiento del navegador de una cuenta con la sesión iniciada."""
+
+    token: str
+    local_storage: dict
+    cookies: list = field(default_factory=list)
+    expires_at: float = float("inf")
+
+    @staticmethod
+    def capture(browser, token: str) -> "StoredSession":
+        """Lee localStorage y las cookies de un navegador que está en el origen de la app."""
+        return StoredSession(
+            token=token,
+            local_storage=browser.execute_script("return Object.assign({}, window.localStorage);"),
+            cookies=browser.get_cookies(),
+            expires_at=token_expiry(token),
+        )
+
+    def restore_into(self, browser):
+        """Restaura lo guardado; el navegador ya debe estar en el origen de la app."""
+        browser.execute_script(
+            "const items = arguments[0];"
+            "Object.keys(items).forEach(key => window.localStorage.setItem(key, items[key]));",
+            self.local_storage,
+        )
+        for cookie in self.cookies:
+            browser.add_cookie(cookie)
+
+    def expires_within(self, seconds: float) -> bool:
+        return self.expires_at - time.time() < seconds
+
+
+class SessionCache:
+    """Sesiones iniciadas por correo de la cuenta, compartidas por los actores del proceso."""
+
+    def __init__(self, expiry_margin: float = EXPIRY_MARGIN_SECONDS):
+        self.expiry_margin = expiry_margin
+        self._sessions = {}
+        self.logins = 0
+        self.restores = 0
+
+    def get(self, email: str):
+        session = self._sessions.get(email)
+        if session is not None and session.expires_within(self.expiry_margin):
+            del self._sessions[email]
+            return None
+        return session
+
+    def put(self, email: str, session: StoredSession):
+        self._sessions[email] = session
+
+    def mark_dirty(self, email: str):
+        """Descarta la sesión para que el siguiente actor de esa cuenta vuelva a iniciarla."""
+
+        self._sessions.pop(email, None)
+
+    def clear(self):
+        self._sessions.clear()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __repr__(self):
+        return f"<SessionCache sessions={len(self)} logins={self.logins} restores={self.restores}>"
+
+
+# Uno por proceso: con pytest-xdist cada worker tiene su propia caché
+SESSION_CACHE = SessionCache()
@@ -0,0 +1,176 @@
+import html
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from screenpy import Actor
+
+
+# Clasificación de cada paso para el resumen "dónde se va el tiempo"
+NAVIGATION_ACTIONS = {"Open", "Visit", "OpenPage", "GoBack", "GoForward", "RefreshPage", "Refresh"}
+LOGIN_ACTIONS = {"LogInViaApi"}
+
+
+@dataclass
+class Step:
+    test: str
+    action: str
+    description: str
+    kind: str
+    locator: str
+    started: float
+    duration: float
+    self_time: float
+    depth: int
+    passed: bool
+
+
+def classify(action) -> str:
+    name = type(action).__name__
+    if name.startswith("See"):
+        return "question"
+    if name.startswith("Wait") or name in ("Eventually", "Pause"):
+        return "wait"
+    if name in LOGIN_ACTIONS:
+        return "login"
+    if name in NAVIGATION_ACTIONS:
+        return "navigate"
+    return "interact"
+
+
+def locator_of(action):
+    """Descripción, si se puede, del elemento sobre el que actúa una Action o su Question."""
+    for source in (action, getattr(action, "question", None)):
+        if source is None:
+            continue
+        for attribute in ("target", "locator"):
+            value = getattr(source, attribute, None)
+            if value is not None:
+                return str(value)
+        args = getattr(source, "args", None)
+        if args:
+            return str(args[0])
+    return None
+
+
+def describe(action) -> str:
+    try:
+        text = action.describe() if hasattr(action, "describe") else repr(action)
+    except Exception:
+        text = type(action).__name__
+    return text[:200]
+
+
+class StepRecorder:
+    """Mide cada Action que realiza un Actor (`attempts_to`, `should` y pasos anidados)."""
+
+    # Mientras está instalado sustituye Actor.perform. Cada paso guarda su duración total y la
+    # propia (sin los anidados): los totales por tipo no cuentan dos veces una tarea y sus pasos.
+
+    def __init__(self):
+        self.steps = []
+        self.current_test = None
+        self._stack = []
+        self._listeners = []
+        self._original_perform = None
+        self._epoch = time.monotonic()
+
+    def install(self):
+        if self._original_perform is not None:
+            return
+        recorder = self
+        original = self._original_perform = Actor.perform
+
+        def perform(actor, action):
+            return recorder.record(action, lambda: original(actor, action))
+
+        Actor.perform = perform
+
+    def uninstall(self):
+        if self._original_perform is not None:
+            Actor.perform = self._original_perform
+            self._original_perform = None
+
+    def add_listener(self, listener):
+        """Llama a `listener(step)` tras cada paso registrado."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
+
+    def record(self, action, run):
+        frame = {"children": 0.0}
+        self._stack.append(frame)
+        started = time.monotonic()
+        passed = False
+        try:
+            result = run()
+            passed = True
+            return result
+        finally:
+            duration = time.monotonic() - started
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1]["children"] += duration
+            step = Step(
+                test=self.current_test,
+                action=type(action).__name__,
+                description=describe(action),
+                kind=classify(action),
+                locator=locator_of(action),
+                started=started - self._epoch,
+                duration=duration,
+                self_time=max(0.0, duration - frame["children"]),
+                depth=len(self._stack),
+                passed=passed,
+            )
+            self.steps.append(step)
+            for listener in self._listeners:
+                listener(step)
+
+    def write_json(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([asdict(step) for step in self.steps], indent=1), encoding="utf-8")
+
+
+STEP_RECORDER = StepRecorder()
+
+
+def load_steps(paths) -> list:
+    steps = []
+    for path in paths:
+        steps.extend(json.loads(Path(path).read_text(encoding="utf-8")))
+    return steps
+
+
+def totals_by_kind(steps) -> dict:
+    totals = {}
+    for step in steps:
+        totals[step["kind"]] = totals.get(step["kind"], 0.0) + step["self_time"]
+    return totals
+
+
+def summary_html(steps, limit: int = 15) -> list:
+    """Fragmentos HTML del resumen de pytest-html: totales por tipo y los pasos más lentos."""
+
+    if not steps:
+        return []
+    totals = totals_by_kind(steps)
+    totals_text = " · ".join(f"{kind}: {seconds:.1f} s" for kind, seconds in sorted(totals.items(), key=lambda t: -t[1]))
+    rows = "".join(
+        "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{:.0f}</td></tr>".format(
+            html.escape(step["test"] or ""),
+            html.escape(step["kind"]),
+            html.escape(step["description"]),
+            html.escape(step["locator"] or ""),
+            step["self_time"] * 1000,
+        )
+        for step in sorted(steps, key=lambda s: -s["self_time"])[:limit]
+    )
+    return [
+        "<h2>Tiempo por paso</h2>",
+        f"<p>{len(steps)} pasos — {html.escape(totals_text)}</p>",
+        "<table><thead><tr><th>Prueba</th><th>Tipo</th><th>Paso</th><th>Locator</th><th>ms</th></tr></thead>"
+        f"<tbody>{rows}</tbody></table>",
+    ]
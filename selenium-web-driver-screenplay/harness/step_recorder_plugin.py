@@ -0,0 +1,71 @@
+# Plugin de pytest: con --step-trace guarda la duración de cada Action/Question
+# (harness/step_recorder.py) y la resume en report.html. Se registra desde tests/conftest.py.
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from harness.step_recorder import STEP_RECORDER, load_steps, summary_html
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--step-trace",
+        default="step_trace.json",
+        help="Archivo JSON con la duración de cada Action/Question (vacío para desactivar).",
+    )
+
+
+def _step_trace_path(config):
+    option = config.getoption("--step-trace")
+    if not option:
+        return None
+    path = Path(option)
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    # Con pytest-xdist cada worker escribe el suyo y el proceso principal los une
+    return path.with_name(f"{path.stem}.{worker_id}{path.suffix}") if worker_id else path
+
+
+def _worker_step_traces(path):
+    return sorted(path.parent.glob(f"{path.stem}.gw*{path.suffix}"))
+
+
+def pytest_configure(config):
+    path = _step_trace_path(config)
+    if path is None:
+        return
+    if not hasattr(config, "workerinput"):
+        for stale in _worker_step_traces(path):
+            stale.unlink()
+    STEP_RECORDER.install()
+
+
+def pytest_unconfigure(config):
+    # Las capturas por paso y la traza de fallos también lo instalan; install() no se repite
+    STEP_RECORDER.uninstall()
+
+
+def _all_steps(config):
+    path = _step_trace_path(config)
+    worker_traces = _worker_step_traces(path) if path else []
+    if worker_traces and not hasattr(config, "workerinput"):
+        return load_steps(worker_traces)
+    return [asdict(step) for step in STEP_RECORDER.steps]
+
+
+def pytest_sessionfinish(session):
+    path = _step_trace_path(session.config)
+    if path is None or not (STEP_RECORDER.steps or _worker_step_traces(path)):
+        return
+    if hasattr(session.config, "workerinput") or not _worker_step_traces(path):
+        STEP_RECORDER.write_json(path)
+    else:
+        path.write_text(json.dumps(_all_steps(session.config), indent=1), encoding="utf-8")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    if _step_trace_path(session.config):
+        prefix.extend(summary_html(_all_steps(session.config)))
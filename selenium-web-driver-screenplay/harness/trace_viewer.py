@@ -0,0 +1,142 @@
+"""Visor de los paquetes de traza que escribe harness/flight_recorder.py al fallar una prueba.
+
+    python -m harness.trace_viewer traces/tests_test_login.py__test_x_20260101_120000.zip
+    python -m harness.trace_viewer traza.zip -i             # paso a paso con Enter
+    python -m harness.trace_viewer traza.zip --html traza.html
+
+Pasos de Screenplay, mensajes de consola y peticiones de red en una sola línea de tiempo.
+"""
+import argparse
+import base64
+import html
+import json
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class Event:
+    wall_time: float
+    kind: str  # "paso", "consola" o "red"
+    text: str
+    problem: bool = False
+
+
+def load_bundle(path) -> dict:
+    with zipfile.ZipFile(path) as bundle:
+        names = set(bundle.namelist())
+        data = {name: bundle.read(name) for name in names}
+    return {
+        "meta": json.loads(data.get("meta.json", b"{}")),
+        "steps": json.loads(data.get("steps.json", b"[]")),
+        "console": json.loads(data.get("console.json", b"[]")),
+        "har": json.loads(data.get("network.har", b'{"log": {"entries": []}}')),
+        "dom": data.get("dom.html", b"").decode("utf-8", "replace"),
+        "screenshot": data.get("screenshot.png"),
+    }
+
+
+def timeline(bundle: dict) -> list:
+    events = []
+    for step in bundle["steps"]:
+        events.append(Event(
+            step["wall_time"],
+            "paso",
+            f"{'  ' * step['depth']}{step['description']} ({step['duration'] * 1000:.0f} ms)",
+            not step["passed"],
+        ))
+    for entry in bundle["console"]:
+        events.append(Event(
+            entry.get("timestamp", 0) / 1000,
+            "consola",
+            f"{entry.get('level', '')} {entry.get('message', '')}",
+            entry.get("level") == "SEVERE",
+        ))
+    for entry in bundle["har"]["log"]["entries"]:
+        status = entry["response"]["status"]
+        error = entry.get("_error")
+        events.append(Event(
+            datetime.fromisoformat(entry["startedDateTime"]).timestamp(),
+            "red",
+            f"{entry['request']['method']} {entry['request']['url']} → {error or status or '…'} ({entry['time']:.0f} ms)",
+            bool(error) or status >= 400,
+        ))
+    return sorted(events, key=lambda event: event.wall_time)
+
+
+def format_event(event: Event, start: float) -> str:
+    mark = "!" if event.problem else " "
+    return f"{event.wall_time - start:>8.3f}s {mark} {event.kind:<8} {event.text}"
+
+
+def print_timeline(bundle: dict, interactive: bool = False):
+    meta = bundle["meta"]
+    print(f"{meta.get('test', '?')} — {meta.get('url') or ''}")
+    if meta.get("error"):
+        print(meta["error"].strip().splitlines()[-1])
+    print()
+    events = timeline(bundle)
+    start = events[0].wall_time if events else 0
+    for event in events:
+        print(format_event(event, start), end="")
+        if interactive and input().strip().lower() == "q":
+            return
+        if not interactive:
+            print()
+
+
+def write_html(bundle: dict, path):
+    events = timeline(bundle)
+    start = events[0].wall_time if events else 0
+    rows = "\n".join(
+        f'<tr class="{event.kind}{" problem" if event.problem else ""}"><td>{event.wall_time - start:.3f}s</td>'
+        f"<td>{event.kind}</td><td>{html.escape(event.text)}</td></tr>"
+        for event in events
+    )
+    screenshot = ""
+    if bundle["screenshot"]:
+        encoded = base64.b64encode(bundle["screenshot"]).decode("ascii")
+        screenshot = f'<img src="data:image/png;base64,{encoded}" alt="captura">'
+    meta = bundle["meta"]
+    page = f"""<!DOCTYPE html>
+<html lang="es"><head><meta charset="utf-8"><title>{html.escape(meta.get('test', 'traza'))}</title>
+<style>
+body {{ font-family: sans-serif; margin: 1em; }}
+table {{ border-collapse: collapse; font: 12px monospace; }}
+td {{ padding: 2px 8px; vertical-align: top; }}
+tr.consola td:nth-child(2) {{ color: #a60; }} tr.red td:nth-child(2) {{ color: #06a; }}
+tr.problem {{ background: #fdd; }}
+img, iframe {{ max-width: 100%; width: 1280px; border: 1px solid #ccc; }} iframe {{ height: 720px; }}
+pre {{ background: #f4f4f4; padding: 1em; overflow: auto; }}
+</style></head><body>
+<h1>{html.escape(meta.get('test', ''))}</h1>
+<p>{html.escape(meta.get('url') or '')}</p>
+<pre>{html.escape(meta.get('error') or '')}</pre>
+<h2>Línea de tiempo</h2><table>{rows}</table>
+<h2>Captura</h2>{screenshot}
+<h2>DOM</h2><iframe sandbox srcdoc="{html.escape(bundle['dom'])}"></iframe>
+</body></html>"""
+    with open(path, "w", encoding="utf-8") as output:
+        output.write(page)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m harness.trace_viewer", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("bundle", help="archivo .zip de la carpeta de trazas")
+    parser.add_argument("-i", "--interactive", action="store_true", help="avanzar evento a evento con Enter (q para salir)")
+    parser.add_argument("--html", dest="html_path", default=None, help="escribir una página HTML autónoma")
+    args = parser.parse_args(argv)
+
+    bundle = load_bundle(args.bundle)
+    if args.html_path:
+        write_html(bundle, args.html_path)
+        print(f"Traza escrita en {args.html_path}")
+    else:
+        print_timeline(bundle, args.interactive)
+
+
+if __name__ == "__main__":
+    main()
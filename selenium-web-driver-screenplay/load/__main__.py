@@ -0,0 +1,72 @@
+"""Generador de carga contra la API de Stickify.
+
+Lazo cerrado (N usuarios que repiten tareas):  python -m load --users 1000 --duration 120
+Lazo abierto (tasa de llegadas):               python -m load --profile ramp:10-200 --duration 120
+"""
+import argparse
+import asyncio
+import json
+import logging
+
+from harness.api_client import API_URL
+from load.metrics import format_table
+from load.open_loop import run_open_loop
+from load.profiles import parse_profile
+from load.runner import LoadConfig, run_load
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m load", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--users", type=int, default=100, help="usuarios virtuales concurrentes (lazo cerrado)")
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="lazo abierto: constant:R, ramp:R1-R2 o step:RxS,RxS... (escenarios por segundo)",
+    )
+    parser.add_argument("--max-in-flight", type=int, default=0, help="escenarios simultáneos como máximo (lazo abierto)")
+    parser.add_argument("--premium-ratio", type=float, default=0.2, help="fracción de usuarios Premium")
+    parser.add_argument("--duration", type=float, default=60, help="segundos de carga")
+    parser.add_argument("--ramp-up", type=float, default=10, help="segundos hasta que arrancan todos los usuarios")
+    parser.add_argument("--think-time", type=float, nargs=2, default=(0.5, 2.0), metavar=("MIN", "MAX"))
+    parser.add_argument("--accounts", type=int, default=50, help="cuentas reales que comparten los usuarios virtuales")
+    parser.add_argument("--connections", type=int, default=200, help="conexiones HTTP simultáneas como máximo")
+    parser.add_argument("--base-url", default=API_URL)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", dest="json_path", default=None, help="guardar el resumen en este archivo")
+    args = parser.parse_args(argv)
+    config = LoadConfig(
+        users=args.users,
+        premium_ratio=args.premium_ratio,
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        think_time=tuple(args.think_time),
+        accounts=args.accounts,
+        connections=args.connections,
+        max_in_flight=args.max_in_flight,
+        base_url=args.base_url,
+        seed=args.seed,
+    )
+    profile = parse_profile(args.profile, args.duration) if args.profile else None
+    return config, profile, args.json_path
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.WARNING)
+    config, profile, json_path = parse_args(argv)
+    if profile is None:
+        metrics = asyncio.run(run_load(config))
+        print(f"{config.users} usuarios durante {metrics.elapsed:.1f} s (latencias en ms)")
+    else:
+        metrics = asyncio.run(run_open_loop(config, profile))
+        print(f"Llegadas {profile} durante {metrics.elapsed:.1f} s (latencias en ms desde el inicio previsto)")
+    rows = metrics.summary()
+    print(format_table(rows))
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as output:
+            json.dump(rows, output, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import contextvars
+import json
+import time
+
+import aiohttp
+
+from harness.api_client import API_URL
+
+
+# Momento en que debía salir la siguiente petición del escenario actual. El planificador
+# de llegadas lo fija al inicio previsto del escenario y cada petición lo adelanta en su
+# tiempo de servicio: cada paso mide su latencia desde donde habría empezado sin colas,
+# de modo que la espera por un backend saturado no desaparece de las métricas de ningún
+# endpoint (coordinated omission).
+INTENDED_START = contextvars.ContextVar("intended_start", default=None)
+
+
+class ApiError(Exception):
+
+    def __init__(self, endpoint: str, status: int, body: bytes):
+        super().__init__(f"{endpoint} -> HTTP {status}: {body[:200]!r}")
+        self.endpoint = endpoint
+        self.status = status
+
+
+class AsyncStickifyApi:
+    """asyncio counterpart of StickifyApi that times every call per endpoint.
+
+    Same `request` signature as the synchronous client, so the abilities in
+    `abilities/` work with either; here they return coroutines.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, base_url: str = API_URL, metrics=None):
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.metrics = metrics
+
+    async def request(self, method: str, path: str, endpoint: str = None, **kwargs):
+        endpoint = endpoint or f"{method} {path}"
+        sent = time.perf_counter()
+        intended = INTENDED_START.get()
+        started = sent if intended is None else intended
+        ok = False
+        try:
+            async with self.session.request(method, f"{self.base_url}{path}", **kwargs) as response:
+                body = await response.read()
+                if response.status >= 400:
+                    raise ApiError(endpoint, response.status, body)
+                ok = True
+                return json.loads(body) if body else None
+        finally:
+            finished = time.perf_counter()
+            if intended is not None:
+                # El siguiente paso debía empezar cuando este habría terminado a su hora
+                INTENDED_START.set(intended + finished - sent)
+            if self.metrics is not None:
+                self.metrics.record(endpoint, finished - started, ok)
+
+    # --- AUTH (preparación de cuentas, sin pasar por las habilidades) ---
+    async def sign_up(self, username: str, email: str, password: str, premium: bool = False):
+        return await self.request(
+            "POST",
+            "/auth/sign-up",
+            json={"username": username, "email": email, "password": password, "premium": premium},
+        )
+
+    async def login(self, email: str, password: str) -> dict:
+        return await self.request("POST", "/auth/login", json={"email": email, "password": password})
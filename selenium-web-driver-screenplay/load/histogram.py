@@ -0,0 +1,63 @@
+import math
+
+
+class HdrHistogram:
+    """Log-linear latency histogram in the style of HdrHistogram.
+
+    Values (integers, here microseconds) below 2**sub_bits are counted
+    exactly; above that every power-of-two range is split into
+    2**(sub_bits - 1) linear buckets, so any recorded value is reported with
+    a relative error below 10**-significant_digits whatever its magnitude.
+    Memory depends on the spread of values, not on how many are recorded.
+    """
+
+    def __init__(self, significant_digits: int = 3):
+        self.sub_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._half = 1 << (self.sub_bits - 1)
+        self.counts = {}
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        if value < (1 << self.sub_bits):
+            return value
+        shift = value.bit_length() - self.sub_bits
+        sub = value >> shift
+        return (1 << self.sub_bits) + (shift - 1) * self._half + (sub - self._half)
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < (1 << self.sub_bits):
+            return index
+        offset = index - (1 << self.sub_bits)
+        shift = offset // self._half + 1
+        sub = offset % self._half + self._half
+        return ((sub + 1) << shift) - 1
+
+    def record(self, value: int, count: int = 1):
+        value = max(0, int(value))
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """Smallest value (highest equivalent of its bucket) with `percentile`% of samples at or below it."""
+        if not self.total:
+            return 0
+        rank = max(1, math.ceil(percentile / 100 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def merge(self, other: "HdrHistogram"):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
@@ -0,0 +1,71 @@
+import time
+from collections import Counter, defaultdict
+
+from load.histogram import HdrHistogram
+
+
+class LatencyStats:
+    """Latency histograms (microseconds) and error counts per endpoint for one load run."""
+
+    def __init__(self):
+        self.histograms = defaultdict(HdrHistogram)
+        self.errors = Counter()
+        self.started = None
+        self.finished = None
+
+    def start(self):
+        self.started = time.monotonic()
+
+    def stop(self):
+        self.finished = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def record(self, endpoint: str, seconds: float, ok: bool):
+        self.histograms[endpoint].record(seconds * 1_000_000)
+        if not ok:
+            self.errors[endpoint] += 1
+
+    def summary(self) -> list:
+        """One row per endpoint (plus TOTAL): requests, errors, req/s and latencies in ms."""
+        elapsed = self.elapsed or 1.0
+        rows = []
+        everything = HdrHistogram()
+        for endpoint in sorted(self.histograms):
+            histogram = self.histograms[endpoint]
+            # Las filas "scenario ..." y "(...)" no son peticiones: no entran en el total
+            if not endpoint.startswith(("scenario ", "(")):
+                everything.merge(histogram)
+            rows.append(self._row(endpoint, histogram, self.errors[endpoint], elapsed))
+        rows.append(self._row("TOTAL", everything, sum(
+            count for endpoint, count in self.errors.items() if not endpoint.startswith(("scenario ", "("))
+        ), elapsed))
+        return rows
+
+    @staticmethod
+    def _row(endpoint, histogram: HdrHistogram, errors, elapsed) -> dict:
+        return {
+            "endpoint": endpoint,
+            "requests": histogram.total,
+            "errors": errors,
+            "rps": histogram.total / elapsed,
+            "p50_ms": histogram.value_at_percentile(50) / 1000,
+            "p95_ms": histogram.value_at_percentile(95) / 1000,
+            "p99_ms": histogram.value_at_percentile(99) / 1000,
+            "max_ms": histogram.max / 1000,
+        }
+
+
+def format_table(rows: list) -> str:
+    header = f"{'endpoint':<45} {'reqs':>8} {'errs':>6} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['endpoint']:<45} {row['requests']:>8} {row['errors']:>6} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}"
+        )
+    return "\n".join(lines)
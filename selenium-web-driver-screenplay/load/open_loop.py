@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import random
+import time
+
+import aiohttp
+
+from actors.actor import create_premium_user, create_standard_user
+from load.client import INTENDED_START, ApiError, AsyncStickifyApi
+from load.metrics import LatencyStats
+from load.runner import LoadConfig, load_catalog, provision_accounts
+from load.scenarios import SCENARIO_MIX
+
+
+logger = logging.getLogger(__name__)
+
+
+async def run_open_loop(config: LoadConfig, profile) -> LatencyStats:
+    """Start scenarios at the rate of `profile`, whether or not earlier ones finished.
+
+    Latencies are measured from each arrival's intended start, so a slow
+    backend (or a full `max_in_flight`) shows up as queueing delay instead of
+    quietly lowering the request rate like the closed-loop runner does.
+    """
+    metrics = LatencyStats()
+    rng = random.Random(config.seed)
+    connector = aiohttp.TCPConnector(limit=config.connections)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        setup_api = AsyncStickifyApi(session, config.base_url)
+        accounts = await provision_accounts(setup_api, config.accounts, config.premium_ratio)
+        catalog = await load_catalog(setup_api)
+        if not catalog.track_ids:
+            raise RuntimeError("El backend no tiene canciones: no hay nada que buscar ni calificar")
+
+        api = AsyncStickifyApi(session, config.base_url, metrics)
+        in_flight = asyncio.Semaphore(config.max_in_flight) if config.max_in_flight else None
+        scenarios, weights, _ = zip(*SCENARIO_MIX)
+        running = set()
+
+        metrics.start()
+        origin = time.perf_counter()
+        for number, offset in enumerate(profile.arrivals()):
+            intended = origin + offset
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # Cuánto se retrasó el propio generador: si crece, el cuello de botella es esta máquina
+            metrics.record("(scheduler lag)", max(0.0, time.perf_counter() - intended), True)
+
+            scenario = rng.choices(scenarios, weights=weights)[0]
+            task = asyncio.create_task(
+                _arrive(scenario, number, intended, api, accounts, catalog, in_flight, metrics, random.Random(rng.random()))
+            )
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+        await asyncio.gather(*running)
+        metrics.stop()
+
+    return metrics
+
+
+async def _arrive(scenario, number, intended, api, accounts, catalog, in_flight, metrics, rng):
+    premium = dict((s, p) for s, _, p in SCENARIO_MIX)[scenario]
+    candidates = [account for account in accounts if account["premium"] == premium] or accounts
+    factory = create_premium_user if premium else create_standard_user
+    actor = factory(api=api, with_browser=False, name=f"Arrival-{number}")
+    ok = False
+    try:
+        if in_flight is not None:
+            await in_flight.acquire()
+        try:
+            INTENDED_START.set(intended)
+            await scenario(actor, rng.choice(candidates), catalog, rng)
+            ok = True
+        finally:
+            if in_flight is not None:
+                in_flight.release()
+    except (ApiError, aiohttp.ClientError, asyncio.TimeoutError) as error:
+        # Ya quedó contado como error en las métricas del endpoint
+        logger.debug("%s: %s", scenario.__name__, error)
+    except Exception:
+        # Un fallo del propio escenario (datos inesperados, JSON inválido...) no debe tumbar la ejecución
+        logger.warning("Llegada %d (%s) falló", number, scenario.__name__, exc_info=True)
+    finally:
+        metrics.record(f"scenario {scenario.__name__}", time.perf_counter() - intended, ok)
@@ -0,0 +1,93 @@
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+class ArrivalProfile(ABC):
+    """Target arrival rate (scenarios per second) over time, as linear segments."""
+
+    duration: float
+
+    @abstractmethod
+    def segments(self) -> list:
+        """[(seconds, rate at the start, rate at the end), ...] covering the whole duration."""
+
+    def rate_at(self, elapsed: float) -> float:
+        for seconds, start, end in self.segments():
+            if elapsed < seconds:
+                return start + (end - start) * elapsed / seconds
+            elapsed -= seconds
+        return 0.0
+
+    def arrivals(self):
+        """Yield the intended start offsets (seconds) of every arrival.
+
+        The n-th arrival goes where the integrated rate reaches n, so the count
+        follows the profile even when the rate changes between two arrivals.
+        """
+        offset = expected = 0.0  # inicio del segmento y llegadas previstas hasta él
+        target = 0
+        for seconds, start, end in self.segments():
+            if seconds <= 0:
+                continue
+            slope = (end - start) / seconds
+            total = start * seconds + slope * seconds ** 2 / 2
+            while target < expected + total:
+                yield offset + _time_to_reach(target - expected, start, slope)
+                target += 1
+            offset += seconds
+            expected += total
+
+
+def _time_to_reach(count: float, rate: float, slope: float) -> float:
+    """Seconds until rate*t + slope*t²/2 reaches `count` (stable form of the quadratic root)."""
+    denominator = rate + math.sqrt(max(rate * rate + 2 * slope * count, 0.0))
+    return 2 * count / denominator if denominator > 0 else 0.0
+
+
+@dataclass
+class ConstantRate(ArrivalProfile):
+    rate: float
+    duration: float
+
+    def segments(self) -> list:
+        return [(self.duration, self.rate, self.rate)]
+
+
+@dataclass
+class RampRate(ArrivalProfile):
+    start: float
+    end: float
+    duration: float
+
+    def segments(self) -> list:
+        return [(self.duration, self.start, self.end)]
+
+
+@dataclass
+class StepRate(ArrivalProfile):
+    steps: list  # [(tasa, segundos), ...]
+
+    @property
+    def duration(self) -> float:
+        return sum(seconds for _, seconds in self.steps)
+
+    def segments(self) -> list:
+        return [(seconds, rate, rate) for rate, seconds in self.steps]
+
+
+def parse_profile(text: str, duration: float) -> ArrivalProfile:
+    """Parse 'constant:50', 'ramp:10-200' or 'step:10x30,50x30,100x60' (rate x seconds)."""
+    kind, _, spec = text.partition(":")
+    try:
+        if kind == "constant":
+            return ConstantRate(float(spec), duration)
+        if kind == "ramp":
+            start, end = spec.split("-")
+            return RampRate(float(start), float(end), duration)
+        if kind == "step":
+            steps = [part.split("x") for part in spec.split(",")]
+            return StepRate([(float(rate), float(seconds)) for rate, seconds in steps])
+    except ValueError:
+        pass
+    raise ValueError(f"Perfil de llegadas no válido: '{text}' (constant:R, ramp:R1-R2 o step:RxS,RxS...)")
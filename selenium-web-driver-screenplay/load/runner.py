@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+
+import aiohttp
+
+from actors.actor import create_premium_user, create_standard_user
+from harness.api_client import API_URL
+from load.client import ApiError, AsyncStickifyApi
+from load.metrics import LatencyStats
+from load.tasks import PREMIUM_MIX, STANDARD_MIX, Catalog, VirtualUser, pick_task
+
+
+logger = logging.getLogger(__name__)
+
+LOAD_PASSWORD = "Load123!"
+
+
+@dataclass
+class LoadConfig:
+    users: int = 100
+    premium_ratio: float = 0.2
+    duration: float = 60.0
+    ramp_up: float = 10.0
+    think_time: tuple = (0.5, 2.0)
+    accounts: int = 50
+    connections: int = 200
+    max_in_flight: int = 0  # solo en lazo abierto; 0 = sin límite
+    base_url: str = API_URL
+    seed: int = None
+
+
+async def run_load(config: LoadConfig) -> LatencyStats:
+    """Run `config.users` closed-loop virtual users and return the per-endpoint latencies."""
+    metrics = LatencyStats()
+    rng = random.Random(config.seed)
+    connector = aiohttp.TCPConnector(limit=config.connections)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # La preparación no cuenta en las métricas
+        setup_api = AsyncStickifyApi(session, config.base_url)
+        logins = await provision_accounts(setup_api, config.accounts, config.premium_ratio)
+        catalog = await load_catalog(setup_api)
+        if not catalog.track_ids:
+            raise RuntimeError("El backend no tiene canciones: no hay nada que buscar ni calificar")
+
+        api = AsyncStickifyApi(session, config.base_url, metrics)
+        virtual_users = [_virtual_user(index, api, logins, config) for index in range(config.users)]
+
+        metrics.start()
+        deadline = asyncio.get_running_loop().time() + config.duration
+        await asyncio.gather(*(
+            _drive(vu, index, catalog, config, deadline, random.Random(rng.random()))
+            for index, vu in enumerate(virtual_users)
+        ))
+        metrics.stop()
+
+    return metrics
+
+
+def _virtual_user(index: int, api, logins: list, config: LoadConfig) -> VirtualUser:
+    premium = index < round(config.users * config.premium_ratio)
+    candidates = [login for login in logins if login["premium"] == premium] or logins
+    user = candidates[index % len(candidates)]
+    factory = create_premium_user if premium else create_standard_user
+    actor = factory(api=api, with_browser=False, name=f"{'Premium' if premium else 'Standard'}User-{index}")
+    return VirtualUser(actor, user, premium)
+
+
+async def _drive(vu: VirtualUser, index: int, catalog: Catalog, config: LoadConfig, deadline: float, rng):
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(index * config.ramp_up / max(config.users, 1))
+    mix = PREMIUM_MIX if vu.premium else STANDARD_MIX
+    while loop.time() < deadline:
+        task = pick_task(mix, rng)
+        try:
+            await task(vu, catalog, rng)
+        except (ApiError, aiohttp.ClientError, asyncio.TimeoutError) as error:
+            # Ya quedó contado como error en las métricas del endpoint
+            logger.debug("%s: %s", task.__name__, error)
+        await asyncio.sleep(rng.uniform(*config.think_time))
+
+
+async def provision_accounts(api: AsyncStickifyApi, count: int, premium_ratio: float) -> list:
+    """Sign up (if missing) and log in `count` load-test accounts; returns their users."""
+    premium_count = round(count * premium_ratio)
+
+    async def account(index: int) -> dict:
+        email = f"load.{index}@load.stickify.test"
+        premium = index < premium_count
+        try:
+            await api.sign_up(f"load_user_{index}", email, LOAD_PASSWORD, premium)
+        except ApiError as error:
+            if error.status != 400:  # 400 = ya existe
+                raise
+        user = (await api.login(email, LOAD_PASSWORD))["user"]
+        user.setdefault("premium", premium)
+        return user
+
+    return await asyncio.gather(*(account(index) for index in range(count)))
+
+
+async def load_catalog(api: AsyncStickifyApi) -> Catalog:
+    songs, users, playlists = await asyncio.gather(
+        api.request("GET", "/songs"),
+        api.request("GET", "/users"),
+        api.request("GET", "/playlists"),
+    )
+    return Catalog(
+        track_ids=[song["trackId"] for song in songs],
+        emails=[user["email"] for user in users],
+        playlist_ids=[playlist["id"] for playlist in playlists],
+    )
@@ -0,0 +1,37 @@
+from abilities.authenticate import Authenticate
+from abilities.follow_users import FollowUsers
+from abilities.manage_playlists import ManagePlaylists
+from abilities.rate_and_comment import RateAndComment
+from abilities.search_music import SearchMusic
+from load.runner import LOAD_PASSWORD
+
+
+# Secuencias completas de una visita, lanzadas por el planificador de llegadas.
+# Cada una empieza con el login, como haría un usuario real que abre la app.
+async def search_and_rate(actor, account: dict, catalog, rng):
+    await actor.ability_to(Authenticate).log_in(account["email"], LOAD_PASSWORD)
+    songs = await actor.ability_to(SearchMusic).songs()
+    track_id = rng.choice(songs)["trackId"] if songs else rng.choice(catalog.track_ids)
+    await actor.ability_to(RateAndComment).rate(account["username"], track_id, rng.randint(1, 5))
+    await actor.ability_to(RateAndComment).average(track_id)
+
+
+async def follow_someone(actor, account: dict, catalog, rng):
+    user = (await actor.ability_to(Authenticate).log_in(account["email"], LOAD_PASSWORD))["user"]
+    target = rng.choice(catalog.emails)
+    if target != account["email"]:
+        await actor.ability_to(FollowUsers).follow(user["id"], target, rng.random() < 0.5)
+
+
+async def review_own_playlists(actor, account: dict, catalog, rng):
+    await actor.ability_to(Authenticate).log_in(account["email"], LOAD_PASSWORD)
+    await actor.ability_to(ManagePlaylists).of_user(account["email"])
+    await actor.ability_to(SearchMusic).songs()
+
+
+# (escenario, peso, necesita actor Premium)
+SCENARIO_MIX = [
+    (search_and_rate, 60, False),
+    (follow_someone, 25, False),
+    (review_own_playlists, 15, True),
+]
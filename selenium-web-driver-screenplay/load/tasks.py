@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+
+from screenpy import Actor
+
+from abilities.follow_users import FollowUsers
+from abilities.rate_and_comment import RateAndComment
+from abilities.save_playlist_to_profile import SavePlaylistToProfile
+from abilities.search_music import SearchMusic
+
+
+@dataclass
+class VirtualUser:
+    actor: Actor
+    user: dict  # usuario devuelto por /auth/login (id, email, ...)
+    premium: bool = False
+
+    @property
+    def email(self) -> str:
+        return self.user["email"]
+
+    @property
+    def username(self) -> str:
+        """What the app stores as the author of ratings and comments."""
+        return self.user["username"]
+
+
+@dataclass
+class Catalog:
+    """Ids the tasks pick from, loaded once before the run."""
+
+    track_ids: list = field(default_factory=list)
+    emails: list = field(default_factory=list)
+    playlist_ids: list = field(default_factory=list)
+
+
+# Cada tarea es lo que hace un usuario en una visita: las mismas habilidades que en las pruebas E2E
+async def search_music(vu: VirtualUser, catalog: Catalog, rng):
+    """Load the catalogue (as the home page does) and open one song."""
+    songs = await vu.actor.ability_to(SearchMusic).songs()
+    if songs:
+        await vu.actor.ability_to(SearchMusic).song(rng.choice(songs)["trackId"])
+
+
+async def rate_song(vu: VirtualUser, catalog: Catalog, rng):
+    track_id = rng.choice(catalog.track_ids)
+    await vu.actor.ability_to(RateAndComment).rate(vu.username, track_id, rng.randint(1, 5))
+    await vu.actor.ability_to(RateAndComment).average(track_id)
+
+
+async def comment_song(vu: VirtualUser, catalog: Catalog, rng):
+    track_id = rng.choice(catalog.track_ids)
+    await vu.actor.ability_to(RateAndComment).comment(vu.username, track_id, "Comentario de carga")
+
+
+async def follow_user(vu: VirtualUser, catalog: Catalog, rng):
+    target = rng.choice(catalog.emails)
+    if target != vu.email:
+        await vu.actor.ability_to(FollowUsers).follow(vu.user["id"], target, rng.random() < 0.5)
+
+
+async def save_playlist(vu: VirtualUser, catalog: Catalog, rng):
+    if catalog.playlist_ids:
+        await vu.actor.ability_to(SavePlaylistToProfile).save(vu.email, rng.choice(catalog.playlist_ids))
+
+
+# Peso relativo de cada tarea
+STANDARD_MIX = [(search_music, 50), (rate_song, 20), (comment_song, 15), (follow_user, 15)]
+PREMIUM_MIX = [(search_music, 40), (rate_song, 20), (comment_song, 10), (follow_user, 10), (save_playlist, 20)]
+
+
+def pick_task(mix, rng):
+    tasks, weights = zip(*mix)
+    return rng.choices(tasks, weights=weights)[0]
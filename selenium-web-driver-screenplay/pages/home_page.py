@@ -3,6 +3,9 @@ from screenpy_selenium.actions import Click, Enter, Wait
 from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo, ContainsTheText
 
+from actions.actions import EnterText
+from actions.wait_for_element import WaitForElement
+from actions.wait_for_network_idle import WaitForNetworkIdle
 from questions.browser_url import BrowserURL
 from questions.element_is_visible import ElementIsVisible
 from questions.element_text import ElementText
@@ -43,9 +46,8 @@ class HomePage:
     def enter_search_term(term: str):
         """Open search (if collapsed) and enter a song title."""
         return [
-            Wait(5).for_the(HomePage.SEARCH_INPUT).to_appear(),
-            Click.on(HomePage.SEARCH_INPUT),
-            Enter.the_text(term).into(HomePage.SEARCH_INPUT),
+            WaitForElement(HomePage.SEARCH_INPUT, timeout=5),
+            EnterText(term, HomePage.SEARCH_INPUT),
         ]
 
     # @staticmethod
@@ -144,13 +146,22 @@ class HomePage:
     # @staticmethod
     # def has_songs_displayed():
     #     return See.the(ElementIsVisible(HomePage.SONG_CARD), IsEqualTo(True))
+    @staticmethod
+    def wait_for_songs():
+        """Wait for the song catalogue request to finish and the results to render."""
+        return [
+            WaitForNetworkIdle(),
+            Wait(15).for_the(HomePage.MUSIC_RESULTS).to_appear(),
+        ]
+
     @staticmethod
     def open_first_song():
-        """Click on the first visible song card."""
+        """Click on the first visible song card and wait for its ratings and comments."""
         return [
             Wait(10).for_the(HomePage.SONG_CARD).to_appear(),
             Click.on(HomePage.SONG_CARD),
             Wait(10).for_the(HomePage.SONG_MODAL).to_appear(),
+            WaitForNetworkIdle(),
         ]
 
     @staticmethod
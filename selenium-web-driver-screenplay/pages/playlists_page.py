@@ -6,6 +6,7 @@ from screenpy.resolutions import IsEqualTo, ContainsTheText
 from selenium.webdriver.common.by import By
 
 from questions.browser_url import BrowserURL
+from questions.card_snapshot import CardSnapshot
 from questions.element_is_visible import ElementIsVisible
 from questions.playlist_count import PlaylistCount
 from actions.scroll_to_element import ScrollToElement
@@ -37,6 +38,8 @@ class PlaylistsPage:
 )
 
     
+    PLAYLIST_CARDS = Target.the("playlist cards").located_by(".playlist-card")
+
     # Automatic Playlists Section
     AUTO_PLAYLIST_TITLE = Target.the("automatic playlists section title").located_by("h1.playlist-title:nth-of-type(2)")
     AUTO_PLAYLIST_CARD = Target.the("automatic playlist card").located_by(".playlist-grid:nth-of-type(2) .playlist-card")
@@ -126,7 +129,12 @@ class PlaylistsPage:
     @staticmethod
     def get_playlist_count():
         """Get the current number of playlists."""
-        return See.the(PlaylistCount())
+        return PlaylistCount()
+
+    @staticmethod
+    def get_playlist_names():
+        """Return the names of every playlist card, read in one round trip."""
+        return CardSnapshot.of(PlaylistsPage.PLAYLIST_CARDS).with_fields(name=".playlist-info h3").values_of("name")
     
     @staticmethod
     def get_first_playlist_name():
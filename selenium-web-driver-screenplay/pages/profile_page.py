@@ -5,9 +5,12 @@ from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo, ContainsTheText
 from selenium.webdriver.common.by import By
 
+from actions.click_and_forget_session import ClickAndForgetSession
 from questions.browser_url import BrowserURL
+from questions.card_snapshot import CardSnapshot
 from questions.element_is_visible import ElementIsVisible
 from questions.element_text import ElementText
+from questions.playlist_count import PlaylistCount
 from questions.user_role import UserRole
 from screenpy_selenium.questions import Text
 
@@ -53,13 +56,13 @@ class ProfilePage:
 
     @staticmethod
     def click_premium_button():
-        """Click the button to activate or cancel Premium."""
-        return Click.on(ProfilePage.PREMIUM_BUTTON)
+        """Click the button to activate or cancel Premium (the cached session becomes stale)."""
+        return ClickAndForgetSession.on(ProfilePage.PREMIUM_BUTTON)
 
     @staticmethod
     def click_logout_button():
-        """Click the 'Cerrar Sesión' button."""
-        return Click.on(ProfilePage.LOGOUT_BUTTON)
+        """Click the 'Cerrar Sesión' button and drop the cached session."""
+        return ClickAndForgetSession.on(ProfilePage.LOGOUT_BUTTON)
 
     @staticmethod
     def click_home_button():
@@ -89,6 +92,16 @@ class ProfilePage:
         """Return the text of the saved playlist names."""
         return Text.of(ProfilePage.SAVED_PLAYLIST_NAMES)
 
+    @staticmethod
+    def saved_playlist_names():
+        """Return the names of every saved playlist, read in one round trip."""
+        return CardSnapshot.of(ProfilePage.SAVED_PLAYLIST_CARDS).with_fields(name=".playlist-info h4").values_of("name")
+
+    @staticmethod
+    def saved_playlist_count():
+        """Return the number of saved playlist cards."""
+        return PlaylistCount(ProfilePage.SAVED_PLAYLIST_CARDS)
+
     @staticmethod
     def username_is(expected_username: str):
         """Verify that the displayed username matches the expected one."""
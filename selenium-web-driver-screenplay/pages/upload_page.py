@@ -5,6 +5,7 @@ from screenpy_selenium.questions import Text
 from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo, ContainsTheText
 
+from actions.wait_for_network_idle import WaitForNetworkIdle
 from questions.browser_url import BrowserURL
 from questions.element_is_visible import ElementIsVisible
 from questions.song_upload_confirmation import SongUploadConfirmation
@@ -62,6 +63,15 @@ class UploadPage:
     def click_upload_button():
         return Click.on(UploadPage.UPLOAD_BUTTON)
 
+    @staticmethod
+    def wait_for_upload_to_finish():
+        """Wait for the upload requests to settle, then for the result alert."""
+        return [
+            Wait(10).for_the(UploadPage.LOADER_ALERT).to_appear(),
+            WaitForNetworkIdle(timeout=30),
+            Wait(10).for_the(UploadPage.SWEET_ALERT).to_appear(),
+        ]
+
     # --- VALIDACIONES ---
     @staticmethod
     def title_contains(partial_text: str):
@@ -2,11 +2,14 @@ from screenpy import See
 from screenpy_selenium.actions import Enter
 from screenpy_selenium.questions import Text
 from screenpy_selenium.target import Target
-from screenpy.resolutions import IsEqualTo
+from screenpy.resolutions import ContainsTheItem, IsEqualTo
 from selenium.webdriver.common.by import By
 
-from questions.element_is_visible import ElementIsVisible
+from actions.click_and_forget_session import ClickAndForgetSession
+from questions.card_snapshot import CardSnapshot
 from questions.element_text import ElementText
+from questions.follow_list import FollowList
+from questions.is_following_user import IsFollowingUser
 
 
 class UserFollowsPage:
@@ -47,6 +50,11 @@ class UserFollowsPage:
         """Enter text into the search input (filters the list)."""
         return Enter.the_text(search_term).into(UserFollowsPage.SEARCH_INPUT)
 
+    @staticmethod
+    def click_follow_button_for(email: str):
+        """Toggle follow on a user; the cached session keeps the old 'following' count."""
+        return ClickAndForgetSession.on(UserFollowsPage.get_follow_button_for_email(email))
+
     # --- VALIDATIONS ---
     @staticmethod
     def no_users_message_is(expected_text: str):
@@ -56,15 +64,41 @@ class UserFollowsPage:
     @staticmethod
     def is_following_user(email: str):
         """Assert that the specific user's button shows the 'unfollow' state."""
-        return See.the(
-            ElementIsVisible(UserFollowsPage.get_unfollow_button_for_email(email)),
-            IsEqualTo(True),
-        )
+        return See.the(IsFollowingUser(email), IsEqualTo(True))
 
     @staticmethod
     def is_not_following_user(email: str):
         """Assert that the specific user's button shows the 'follow' state."""
-        return See.the(
-            ElementIsVisible(UserFollowsPage.get_follow_button_only_for_email(email)),
-            IsEqualTo(True),
-        )
+        return See.the(IsFollowingUser(email), IsEqualTo(False))
+
+    @staticmethod
+    def listed_emails():
+        """Return the email of every user card, read in one round trip."""
+        return CardSnapshot.of(UserFollowsPage.USER_CARD).with_fields(email="p").values_of("email")
+
+    # --- PAGINATED VIEW (API) ---
+    # La página carga todos los usuarios; estas preguntas leen los seguidores y seguidos
+    # página a página de GET /users/:id/followers|following. El actor necesita FollowUsers con API.
+    @staticmethod
+    def followers_of(user_id: str, page_size: int = None):
+        """Emails of the users following `user_id`, newest follow first."""
+        return FollowList.followers_of(user_id).in_pages_of(page_size)
+
+    @staticmethod
+    def following_of(user_id: str, page_size: int = None):
+        """Emails of the users `user_id` follows, newest follow first."""
+        return FollowList.following_of(user_id).in_pages_of(page_size)
+
+    @staticmethod
+    def backend_shows_following(follower_id: str, email: str):
+        """Assert the follow edge exists in the backend."""
+        return See.the(IsFollowingUser(email).according_to_the_api(follower_id), IsEqualTo(True))
+
+    @staticmethod
+    def backend_shows_not_following(follower_id: str, email: str):
+        return See.the(IsFollowingUser(email).according_to_the_api(follower_id), IsEqualTo(False))
+
+    @staticmethod
+    def following_list_contains(follower_id: str, email: str):
+        """Assert `email` appears in the paginated following list of `follower_id`."""
+        return See.the(UserFollowsPage.following_of(follower_id), ContainsTheItem(email))
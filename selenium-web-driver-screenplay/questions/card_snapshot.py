@@ -0,0 +1,37 @@
+from screenpy.protocols import Answerable
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from harness.dom_snapshot import snapshot_cards
+
+
+class CardSnapshot(Answerable):
+    """Every card matched by a locator, read in a single WebDriver round trip."""
+
+    def __init__(self, locator, fields: dict = None, only: str = None):
+        self.locator = locator
+        self.fields = dict(fields or {})
+        self.only = only
+
+    @staticmethod
+    def of(locator) -> "CardSnapshot":
+        return CardSnapshot(locator)
+
+    def with_fields(self, **fields) -> "CardSnapshot":
+        self.fields.update(fields)
+        return self
+
+    def values_of(self, field: str) -> "CardSnapshot":
+        """Answer with a plain list of one field instead of the full rows."""
+        self.only = field
+        return self
+
+    def answered_by(self, actor):
+        browser = actor.ability_to(BrowseTheWeb).browser
+        rows = snapshot_cards(browser, self.locator, self.fields)
+        if self.only:
+            return [row[self.only] for row in rows]
+        return rows
+
+    def __str__(self):
+        field = f" ({self.only})" if self.only else ""
+        return f"the cards{field} of {self.locator}"
@@ -2,15 +2,20 @@ from screenpy.protocols import Answerable
 from screenpy_selenium.abilities import BrowseTheWeb
 from selenium.webdriver.common.by import By
 
+from harness.dom_snapshot import snapshot_cards
+
+COMMENTS = (By.CSS_SELECTOR, "app-song-modal .comment")
+
+
 class CommentVisible(Answerable):
 
     def __init__(self, comment_text: str):
         self.comment_text = comment_text
 
     def answered_by(self, actor):
-        browser = actor.ability_to(BrowseTheWeb)
-        comments = browser.browser.find_elements(By.CLASS_NAME, "comment-text")
-        return any(self.comment_text in comment.text for comment in comments)
+        browser = actor.ability_to(BrowseTheWeb).browser
+        comments = snapshot_cards(browser, COMMENTS, {"body": "p"})
+        return any(comment["visible"] and self.comment_text in (comment["body"] or "") for comment in comments)
 
     def __str__(self):
         return f"whether the comment '{self.comment_text}' is visible"
@@ -0,0 +1,43 @@
+from screenpy.protocols import Answerable
+
+from abilities.follow_users import FollowUsers
+
+
+class FollowList(Answerable):
+    """Emails in a user's followers or following list, read page by page from the API."""
+
+    def __init__(self, user_id: str, direction: str, page_size: int = None, max_pages: int = None):
+        self.user_id = user_id
+        self.direction = direction  # "followers" o "following"
+        self.page_size = page_size
+        self.max_pages = max_pages
+
+    @staticmethod
+    def followers_of(user_id: str) -> "FollowList":
+        return FollowList(user_id, "followers")
+
+    @staticmethod
+    def following_of(user_id: str) -> "FollowList":
+        return FollowList(user_id, "following")
+
+    def in_pages_of(self, size: int) -> "FollowList":
+        self.page_size = size
+        return self
+
+    def up_to(self, pages: int) -> "FollowList":
+        """Stop after `pages` pages, e.g. to check only the most recent follows."""
+        self.max_pages = pages
+        return self
+
+    def answered_by(self, actor):
+        read_page = getattr(actor.ability_to(FollowUsers), self.direction)
+        emails, cursor, pages = [], None, 0
+        while True:
+            page = read_page(self.user_id, limit=self.page_size, cursor=cursor)
+            emails.extend(item["email"] for item in page["items"])
+            cursor, pages = page["nextCursor"], pages + 1
+            if not cursor or (self.max_pages and pages >= self.max_pages):
+                return emails
+
+    def __str__(self):
+        return f"the {self.direction} of user {self.user_id}"
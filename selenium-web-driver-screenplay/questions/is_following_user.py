@@ -1,32 +1,47 @@
 from screenpy.protocols import Answerable
 from screenpy_selenium.abilities import BrowseTheWeb
-from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 
+from abilities.follow_users import FollowUsers
+from harness.dom_snapshot import snapshot_cards
 
-class IsFollowingUser(Answerable):
+USER_CARDS = (By.CSS_SELECTOR, ".user-card")
+USER_CARD_FIELDS = {
+    "name": "h3",
+    "email": "p",
+    "button": "button.follow-button",
+    "button_class": "button.follow-button@class",
+}
 
-    def __init__(self, username: str):
-        self.username = username
 
-    def answered_by(self, actor):
-        browser = actor.ability_to(BrowseTheWeb)
+class IsFollowingUser(Answerable):
 
-        try:
+    def __init__(self, username: str, follower_id: str = None):
+        self.username = username  # nombre de usuario o correo (correo si se consulta la API)
+        self.follower_id = follower_id
 
-            user_cards = browser.browser.find_elements(By.CLASS_NAME, "user-card")
+    def according_to_the_api(self, follower_id: str) -> "IsFollowingUser":
+        """Ask the backend (one lookup in user_follows) instead of reading the user cards."""
+        self.follower_id = follower_id
+        return self
+
+    def answered_by(self, actor):
+        if self.follower_id is not None:
+            return actor.ability_to(FollowUsers).is_following(self.follower_id, self.username)["following"]
 
-            for card in user_cards:
-                name_element = card.find_element(By.CLASS_NAME, "user-name")
-                if self.username.lower() in name_element.text.lower():
-                    follow_button = card.find_element(By.CLASS_NAME, "follow-btn")
-                    button_text = follow_button.text.strip().lower()
-                    return button_text in ["siguiendo", "following"]
+        browser = actor.ability_to(BrowseTheWeb).browser
+        wanted = self.username.lower()
 
-            return False
+        for card in snapshot_cards(browser, USER_CARDS, USER_CARD_FIELDS):
+            name = (card["name"] or "").lower()
+            email = (card["email"] or "").lower()
+            if wanted == email or wanted in name:
+                return "unfollow" in (card["button_class"] or "").split()
 
-        except NoSuchElementException:
-            return False
+        # Ni True ni False: así "no lo sigue" tampoco se cumple si la tarjeta no está
+        return None
 
     def __str__(self):
+        if self.follower_id is not None:
+            return f"whether user {self.follower_id} follows '{self.username}' according to the API"
         return f"whether the actor is following the user '{self.username}'"
@@ -0,0 +1,12 @@
+from screenpy.protocols import Answerable
+
+from abilities.monitor_network import MonitorNetwork
+
+
+class PendingRequestCount(Answerable):
+
+    def answered_by(self, actor):
+        return actor.ability_to(MonitorNetwork).pending_requests()
+
+    def __str__(self):
+        return "the number of network requests in flight"
@@ -1,15 +1,20 @@
 from screenpy.protocols import Answerable
 from screenpy_selenium.abilities import BrowseTheWeb
+from selenium.webdriver.common.by import By
+
+from harness.dom_snapshot import snapshot_cards
+
+PLAYLIST_CARDS = (By.CSS_SELECTOR, ".playlist-card")
+
 
 class PlaylistCount(Answerable):
 
-    def __init__(self, locator: tuple):
+    def __init__(self, locator=PLAYLIST_CARDS):
         self.locator = locator  # locator que selecciona todas las playlists
 
     def answered_by(self, actor):
-        browser = actor.ability_to(BrowseTheWeb)
-        elements = browser.browser.find_elements(*self.locator)
-        return len(elements)
+        browser = actor.ability_to(BrowseTheWeb).browser
+        return len(snapshot_cards(browser, self.locator))
 
     def __str__(self):
         return "the number of playlists displayed"
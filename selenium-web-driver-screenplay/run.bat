@@ -3,4 +3,4 @@ python -m venv venv
 call venv\Scripts\activate
 pip install --upgrade pip
 pip install -r requirements.txt
-pytest --html=report.html --self-contained-html
\ No newline at end of file
+pytest --html=report.html --self-contained-html %*
\ No newline at end of file
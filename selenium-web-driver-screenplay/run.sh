@@ -3,4 +3,4 @@ python3 -m venv venv
 source venv/bin/activate
 pip install --upgrade pip
 pip install -r requirements.txt
-pytest --html=report.html --self-contained-html
\ No newline at end of file
+pytest --html=report.html --self-contained-html "$@"
\ No newline at end of file
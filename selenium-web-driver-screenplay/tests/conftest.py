@@ -1,65 +1,83 @@
+import html
+
 import pytest
 from screenpy import Actor
 from screenpy_selenium.abilities import BrowseTheWeb
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
+
+from abilities.cache_elements import CacheElements
+from abilities.monitor_network import MonitorNetwork
+from harness.report_properties import teardown_properties
 
-from pathlib import Path
-from datetime import datetime
+
+# Cada plugin trae sus opciones, fixtures y hooks junto al módulo de harness/ que usa
+pytest_plugins = [
+    "harness.retry_plugin",
+    "harness.fake_backend_plugin",
+    "harness.seeding_plugin",
+    "harness.cassette_plugin",
+    "harness.browser_pool_plugin",
+    "harness.resource_blocking_plugin",
+    "harness.screenshots_plugin",
+    "harness.flight_recorder_plugin",
+    "harness.step_recorder_plugin",
+]
 
 
 @pytest.fixture
-def actor(request):
+def actor(request, browser_pool, resource_blocker):
     """Provee un actor con capacidad de navegar con Selenium."""
-    options = Options()
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--headless=new")  # Comenta esta línea si deseas ver el navegador
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--incognito")  # evita usar cuenta de Google del perfil
-    options.add_argument("--disable-save-password-bubble")
-    options.add_argument("--disable-password-manager-reauthentication")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-popup-blocking")
-    options.add_experimental_option("prefs", {
-    "credentials_enable_service": False,
-    "profile.password_manager_enabled": False,
-    "profile.default_content_setting_values.notifications": 2
-    })
-    driver = webdriver.Chrome(service=Service(), options=options)
-    test_actor = Actor.named("User").who_can(BrowseTheWeb.using(driver))
+    driver = browser_pool.acquire()
+    allowed = request.node.get_closest_marker("allow_resources")
+    resource_blocker.apply(driver, allow=allowed.args if allowed else ())
+    test_actor = Actor.named("User").who_can(
+        BrowseTheWeb.using(driver),
+        MonitorNetwork.using(driver),
+        CacheElements.using(driver),
+    )
 
     yield test_actor
 
-    driver.quit()
-
+    cache = test_actor.ability_to(CacheElements)
+    request.node.user_properties.extend([
+        ("element_cache_hits", cache.hits), ("element_cache_misses", cache.misses), ("element_cache_stale", cache.stale),
+    ])
+    try:
+        blocked = resource_blocker.account(test_actor.ability_to(MonitorNetwork))
+        request.node.user_properties.extend([("blocked_requests", blocked.requests), ("bytes_saved", blocked.bytes_saved)])
+    except WebDriverException:
+        pass  # navegador caído: el pool lo reemplaza al devolverlo
+    # No se llama a actor.exit(): cerraría el navegador en lugar de devolverlo al pool
+    release = browser_pool.release(driver)
+    if release.memory is not None:
+        request.node.user_properties.extend([
+            ("browser_rss_mb", round(release.memory["rss"] / 2**20, 1)),
+            ("browser_pss_mb", round(release.memory["pss"] / 2**20, 1)),
+        ])
+    if release.recycled:
+        request.node.user_properties.append(("browser_recycled", release.recycled))
 
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    from screenpy_selenium.abilities import BrowseTheWeb
 
-    outcome = yield
-    rep = outcome.get_result()
+def _cache_summary(config):
+    cached = [test for test in teardown_properties(config).values() if "element_cache_hits" in test]
+    if not cached:
+        return []
+    hits = sum(test["element_cache_hits"] for test in cached)
+    misses = sum(test["element_cache_misses"] for test in cached)
+    lookups = hits + misses
+    return [
+        f"Caché de elementos: {hits} aciertos y {misses} fallos"
+        f"{f' ({hits / lookups:.0%} de aciertos)' if lookups else ''}, "
+        f"{sum(test['element_cache_stale'] for test in cached)} elementos obsoletos"
+    ]
 
-    if rep.when == "call" and "actor" in item.funcargs:
-        actor = item.funcargs["actor"]
-        try:
-            screenshot_dir = Path("screenshots")
-            screenshot_dir.mkdir(exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            status = "PASSED" if rep.passed else "FAILED"
-            screenshot_path = screenshot_dir / f"{item.name}_{status}_{timestamp}.png"
 
-            browser = actor.ability_to(BrowseTheWeb).browser
-            browser.save_screenshot(str(screenshot_path))
+def pytest_terminal_summary(terminalreporter, config):
+    for line in _cache_summary(config):
+        terminalreporter.write_line(line)
 
-            # Agregar imagen al reporte HTML si pytest-html está presente
-            pytest_html = item.config.pluginmanager.get_plugin("html")
-            if pytest_html:
-                extra = getattr(rep, "extras", [])
-                extra.append(pytest_html.extras.image(str(screenshot_path)))
-                rep.extras = extra
 
-        except Exception as e:
-            print(f"Error al capturar la pantalla: {e}")
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    for line in _cache_summary(session.config):
+        prefix.append(f"<p>{html.escape(line)}</p>")
@@ -1,46 +1,30 @@
-from screenpy_selenium.actions import Open, Wait
+import pytest
+from screenpy_selenium.actions import Wait
 from screenpy.resolutions import ContainsTheText
-from pages.login_page import LoginPage
+from actions.log_in_via_api import LogInViaApi
 from pages.home_page import HomePage
 from questions.browser_url import BrowserURL
 from screenpy import See
 
 
-def test_home_page_components(actor):
-    actor.attempts_to(
-        Open.browser_on("http://localhost:4200/log-in"),
-        LoginPage.enter_email("pol@correo.com"),
-        LoginPage.enter_password("pol123"),
-        LoginPage.click_login_button(),
-        Wait(10).for_the(LoginPage.SWEET_ALERT_OK_BUTTON).to_appear(),
-        LoginPage.click_sweet_alert_ok(),
-    )
+# Solo lee el catálogo: con --cassette replay no depende de la velocidad del backend
+pytestmark = pytest.mark.cassette
 
-    from time import sleep
-    sleep(2)
+def test_home_page_components(actor, accounts):
+    actor.attempts_to(LogInViaApi.as_(accounts.listener).and_open("/home"))
 
     actor.should(See.the(BrowserURL(), ContainsTheText("home")))
-    actor.attempts_to(Wait(15).for_the(HomePage.MUSIC_RESULTS).to_appear())
+    actor.attempts_to(*HomePage.wait_for_songs())
 
     for component_assertion in HomePage.components_are_visible():
         actor.should(component_assertion)
 
 
-def test_song_search_functionality(actor):
-    actor.attempts_to(
-        Open.browser_on("http://localhost:4200/log-in"),
-        LoginPage.enter_email("pol@correo.com"),
-        LoginPage.enter_password("pol123"),
-        LoginPage.click_login_button(),
-        Wait(10).for_the(LoginPage.SWEET_ALERT_OK_BUTTON).to_appear(),
-        LoginPage.click_sweet_alert_ok(),
-    )
-
-    from time import sleep
-    sleep(2)
+def test_song_search_functionality(actor, accounts):
+    actor.attempts_to(LogInViaApi.as_(accounts.listener).and_open("/home"))
 
     actor.should(See.the(BrowserURL(), ContainsTheText("home")))
-    actor.attempts_to(Wait(15).for_the(HomePage.MUSIC_RESULTS).to_appear())
+    actor.attempts_to(*HomePage.wait_for_songs())
 
     search_term = "lose yourself"
 
@@ -52,21 +36,11 @@ def test_song_search_functionality(actor):
     actor.should(HomePage.has_songs_displayed())
 
 
-def test_song_modal_interaction(actor):
-    actor.attempts_to(
-        Open.browser_on("http://localhost:4200/log-in"),
-        LoginPage.enter_email("pol@correo.com"),
-        LoginPage.enter_password("pol123"),
-        LoginPage.click_login_button(),
-        Wait(10).for_the(LoginPage.SWEET_ALERT_OK_BUTTON).to_appear(),
-        LoginPage.click_sweet_alert_ok(),
-    )
-
-    from time import sleep
-    sleep(2)
+def test_song_modal_interaction(actor, accounts):
+    actor.attempts_to(LogInViaApi.as_(accounts.listener).and_open("/home"))
 
     actor.should(See.the(BrowserURL(), ContainsTheText("home")))
-    actor.attempts_to(Wait(15).for_the(HomePage.MUSIC_RESULTS).to_appear())
+    actor.attempts_to(*HomePage.wait_for_songs())
 
     actor.attempts_to(
         *HomePage.open_first_song()
@@ -82,21 +56,11 @@ def test_song_modal_interaction(actor):
     )
 
 
-def test_song_filtering(actor):
-    actor.attempts_to(
-        Open.browser_on("http://localhost:4200/log-in"),
-        LoginPage.enter_email("pol@correo.com"),
-        LoginPage.enter_password("pol123"),
-        LoginPage.click_login_button(),
-        Wait(10).for_the(LoginPage.SWEET_ALERT_OK_BUTTON).to_appear(),
-        LoginPage.click_sweet_alert_ok(),
-    )
-
-    from time import sleep
-    sleep(2)
+def test_song_filtering(actor, accounts):
+    actor.attempts_to(LogInViaApi.as_(accounts.listener).and_open("/home"))
 
     actor.should(See.the(BrowserURL(), ContainsTheText("home")))
-    actor.attempts_to(Wait(15).for_the(HomePage.MUSIC_RESULTS).to_appear())
+    actor.attempts_to(*HomePage.wait_for_songs())
 
     actor.attempts_to(
         *HomePage.select_year("2024"),
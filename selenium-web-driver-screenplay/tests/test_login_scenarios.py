@@ -7,20 +7,23 @@ from pages.home_page import HomePage
 from questions.element_is_visible import ElementIsVisible
 from questions.browser_url import BrowserURL
 from questions.user_role import UserRole
+from actions.wait_for_route import WaitForRoute
+from actions.wait_for_sweet_alert_to_close import WaitForSweetAlertToClose
 
-def test_successful_login(actor):
+def test_successful_login(actor, accounts):
     actor.attempts_to(
         Open.browser_on("http://localhost:4200/log-in"),
-        LoginPage.enter_email("pol@correo.com"),
-        LoginPage.enter_password("pol123"),
+        LoginPage.enter_email(accounts.listener.email),
+        LoginPage.enter_password(accounts.listener.password),
         LoginPage.click_login_button(),
         Wait(10).for_the(LoginPage.SWEET_ALERT_OK_BUTTON).to_appear(),
-        LoginPage.click_sweet_alert_ok()
+        LoginPage.click_sweet_alert_ok(),
+        # El login navega a /home cuando el SweetAlert termina de cerrarse
+        WaitForSweetAlertToClose(),
     )
     
-    from time import sleep
-    sleep(2)
-    
+    actor.attempts_to(WaitForRoute.to("/home"))
+
     actor.should(
         See.the(BrowserURL(), ContainsTheText("home"))
     )
@@ -32,10 +35,10 @@ def test_successful_login(actor):
     for component_assertion in HomePage.components_are_visible():
         actor.should(component_assertion)
 
-def test_login_with_invalid_password(actor):
+def test_login_with_invalid_password(actor, accounts):
     actor.attempts_to(
         Open.browser_on("http://localhost:4200/log-in"),
-        LoginPage.enter_email("pol@correo.com"),
+        LoginPage.enter_email(accounts.listener.email),
         LoginPage.enter_password("wrongpassword"),
         LoginPage.click_login_button(),
         Wait.for_the(LoginPage.ERROR_MESSAGE).to_appear()
@@ -7,28 +7,17 @@ from screenpy_selenium import Target
 from pages.playlists_page import PlaylistsPage
 from pages.profile_page import ProfilePage
 from questions.browser_url import BrowserURL
-from pages.login_page import LoginPage
+from actions.log_in_via_api import LogInViaApi
+from actions.wait_for_angular_stable import WaitForAngularStable
+from actions.wait_for_network_idle import WaitForNetworkIdle
+from actions.wait_for_sweet_alert_to_close import WaitForSweetAlertToClose
 from questions.element_is_visible import ElementIsVisible
 
 @pytest.mark.usefixtures("actor")
-def test_save_playlist_to_profile(actor):
-    actor.attempts_to(
-        Open.browser_on("http://localhost:4200/log-in"),
-        LoginPage.enter_email("testuserplaylist3@correo.com"),
-        LoginPage.enter_password("testuserplaylist3"),
-        LoginPage.click_login_button(),
-        Wait(10).for_the(LoginPage.SWEET_ALERT_OK_BUTTON).to_appear(),
-        LoginPage.click_sweet_alert_ok(),
-    )
-
-    from time import sleep
-    sleep(2)
-
-    actor.should(See.the(BrowserURL(), ContainsTheText("home")))
-    actor.attempts_to(Open.browser_on("http://localhost:4200/playlist"))
+def test_save_playlist_to_profile(actor, accounts):
+    actor.attempts_to(LogInViaApi.as_(accounts.playlist_owner).and_open("/playlist"))
 
-    from time import sleep
-    sleep(8)
+    actor.attempts_to(WaitForNetworkIdle(), WaitForAngularStable())
 
     actor.should(See.the(BrowserURL(), ContainsTheText("playlist")))
 
@@ -43,7 +32,8 @@ def test_save_playlist_to_profile(actor):
 
     actor.attempts_to(
         Wait.for_the(OK_BUTTON).to_appear(),
-        Click.on(OK_BUTTON)
+        Click.on(OK_BUTTON),
+        WaitForSweetAlertToClose(),
     )
     actor.attempts_to(Open.browser_on("http://localhost:4200/profile"))
     actor.should(See.the(BrowserURL(), ContainsTheText("profile")))
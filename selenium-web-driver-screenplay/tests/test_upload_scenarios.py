@@ -1,36 +1,31 @@
 # tests/test_upload_scenarios.py
 import os
-import time
+
+import pytest
 from screenpy_selenium import Click
-from screenpy_selenium.actions import Open, Wait
-from screenpy.resolutions import ContainsTheText
+from screenpy_selenium.actions import Wait
+from screenpy.resolutions import ContainsTheText, IsEqualTo
 from screenpy import See
 
-from pages.login_page import LoginPage
+from actions.log_in_via_api import LogInViaApi
+from actions.wait_for_network_idle import WaitForNetworkIdle
+from actions.wait_for_sweet_alert_to_close import WaitForSweetAlertToClose
 from pages.upload_page import UploadPage
 from questions.browser_url import BrowserURL
 from questions.element_is_visible import ElementIsVisible
+from questions.pending_request_count import PendingRequestCount
 from questions.song_upload_confirmation import SongUploadConfirmation
 
 
-def login_and_go_to_upload(actor):
-    actor.attempts_to(
-        Open.browser_on("http://localhost:4200/log-in"),
-        LoginPage.enter_email("pol@correo.com"),
-        LoginPage.enter_password("pol123"),
-        LoginPage.click_login_button(),
-        Wait(10).for_the(LoginPage.SWEET_ALERT_OK_BUTTON).to_appear(),
-        LoginPage.click_sweet_alert_ok(),
-    )
-    time.sleep(2)
+def login_and_go_to_upload(actor, account):
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/upload"),
+        LogInViaApi.as_(account).and_open("/upload"),
         Wait(10).for_the(UploadPage.UPLOAD_FORM).to_appear(),
     )
 
 
-def test_upload_form_display(actor):
-    login_and_go_to_upload(actor)
+def test_upload_form_display(actor, accounts):
+    login_and_go_to_upload(actor, accounts.listener)
 
     actor.should(See.the(BrowserURL(), ContainsTheText("upload")))
 
@@ -39,8 +34,9 @@ def test_upload_form_display(actor):
 
 
 
-def test_upload_song_success(actor):
-    login_and_go_to_upload(actor)
+@pytest.mark.allow_resources("image")  # comprueba la vista previa de la carátula
+def test_upload_song_success(actor, accounts):
+    login_and_go_to_upload(actor, accounts.listener)
 
     cover_image_path = os.path.abspath(os.path.join("assets", "linkinparktest.jpg"))
 
@@ -56,24 +52,26 @@ def test_upload_song_success(actor):
     actor.should(UploadPage.cover_preview_is_visible())
 
     actor.attempts_to(
-    UploadPage.click_upload_button(),
-    Wait(10).for_the(UploadPage.LOADER_ALERT).to_appear(),
-    Wait(30).for_the(UploadPage.LOADER_ALERT).to_disappear(),
-    Wait(10).for_the(UploadPage.SWEET_ALERT).to_appear(),
-)
+        UploadPage.click_upload_button(),
+        *UploadPage.wait_for_upload_to_finish(),
+    )
+
+    actor.should(See.the(PendingRequestCount(), IsEqualTo(0)))
 
     actor.should(UploadPage.upload_successful("Test Track linkin park Title"))
 
     actor.attempts_to(
         Click.on(UploadPage.SWEET_ALERT_OK_BUTTON),
+        WaitForSweetAlertToClose(),
     )
     actor.should(
         See.the(BrowserURL(), ContainsTheText("home"))
     )
     
-def test_upload_missing_fields_shows_no_success(actor):
+@pytest.mark.allow_resources("image")
+def test_upload_missing_fields_shows_no_success(actor, accounts):
 
-    login_and_go_to_upload(actor)
+    login_and_go_to_upload(actor, accounts.listener)
 
     cover_image_path = os.path.abspath(os.path.join("assets", "linkinparktest.jpg"))  # <-- adjust to your env
     actor.attempts_to(
@@ -85,7 +83,7 @@ def test_upload_missing_fields_shows_no_success(actor):
 
     actor.attempts_to(UploadPage.click_upload_button())
 
-    time.sleep(2)
+    actor.attempts_to(WaitForNetworkIdle())
     try:
         actor.should(See.the(SongUploadConfirmation(), ContainsTheText("Test Track Title")))
         assert False, "Upload succeeded unexpectedly when required fields were missing."
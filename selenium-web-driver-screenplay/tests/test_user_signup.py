@@ -2,20 +2,27 @@ from screenpy import See
 from screenpy_selenium.actions import Open, Wait
 from screenpy.resolutions import ContainsTheText, IsEqualTo
 from screenpy_selenium.questions import Text
-from time import sleep
+from actions.wait_for_network_idle import WaitForNetworkIdle
+from actions.wait_for_route import WaitForRoute
+from actions.wait_for_sweet_alert_to_close import WaitForSweetAlertToClose
 from pages.signup_page import SignUpPage
 from questions.element_is_visible import ElementIsVisible
 from questions.browser_url import BrowserURL
-import random
-def test_successful_signup(actor):
+import uuid
+
+def test_successful_signup(actor, seed):
     # Perform the form submission and handle the two-step SweetAlert flow:
     # 1) confirmation ("No has activado el modo Premium...") -> click OK
     # 2) result modal (success) -> assert text and click OK
-    randomNumber = str(random.randint(1000, 9999))
+    # uuid en lugar de randint: evita colisiones entre workers en paralelo
+    randomNumber = uuid.uuid4().hex[:8]
+    email = "newuser"+randomNumber+"1234@example.com"
+    # El usuario lo crea el formulario; el seeder solo lo borra al terminar
+    seed.delete_user_afterwards(email)
     actor.attempts_to(
         Open.browser_on("http://localhost:4200/sign-up"),
         SignUpPage.enter_username("newuser"+randomNumber),
-        SignUpPage.enter_email("newuser"+randomNumber+"1234@example.com"),
+        SignUpPage.enter_email(email),
         SignUpPage.enter_password("Test1234!"),
         SignUpPage.enter_repeat_password("Test1234!"),
         SignUpPage.click_signup_button(),
@@ -24,9 +31,9 @@ def test_successful_signup(actor):
         SignUpPage.click_sweet_alert_ok(),
     )
 
-    # Wait briefly for the result modal to show up
-    sleep(0.5)
+    # Wait for the sign-up request to finish and the result modal to show up
     actor.attempts_to(
+        WaitForNetworkIdle(),
         Wait.for_the(SignUpPage.SWEET_ALERT_OK_BUTTON).to_appear()
     )
 
@@ -36,21 +43,22 @@ def test_successful_signup(actor):
     )
 
     actor.attempts_to(
-        SignUpPage.click_sweet_alert_ok()
+        SignUpPage.click_sweet_alert_ok(),
+        WaitForSweetAlertToClose(),
     )
 
     # Allow redirect after closing modal
-    sleep(1)
+    actor.attempts_to(WaitForRoute.to("/log-in"))
 
     actor.should(
         See.the(BrowserURL(), ContainsTheText("/log-in"))
     )
 
-def test_invalid_signup_existing_user(actor):
+def test_invalid_signup_existing_user(actor, accounts):
     actor.attempts_to(
         Open.browser_on("http://localhost:4200/sign-up"),
-        SignUpPage.enter_username("pol"),
-        SignUpPage.enter_email("pol@correo.com"),
+        SignUpPage.enter_username(accounts.listener.username),
+        SignUpPage.enter_email(accounts.listener.email),
         SignUpPage.enter_password("Test123!"),
         SignUpPage.enter_repeat_password("Test123!"),
         SignUpPage.click_signup_button(),
@@ -63,8 +71,8 @@ def test_invalid_signup_existing_user(actor):
     )
 
     # Wait for the result modal (error) to appear
-    sleep(0.5)
     actor.attempts_to(
+        WaitForNetworkIdle(),
         Wait.for_the(SignUpPage.SWEET_ALERT_OK_BUTTON).to_appear()
     )
 
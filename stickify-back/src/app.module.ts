@@ -13,10 +13,12 @@ import { RatingsModule } from './song-ratings/song-ratings.module';
 
 // Importa las CLASES de las entidades
 import { User } from './user/entities/user.entity';
+import { UserFollow } from './user/entities/user-follow.entity';
 import { Song } from './songs/entities/song.entity';
 import { Playlist } from './playlists/entities/playlist.entity';
 import { Comment } from './comments/entities/comment.entity';
 import { SongRating } from './song-ratings/entities/song-rating.entity';
+import { SongRatingAggregate } from './song-ratings/entities/song-rating-aggregate.entity';
 import { UserSavedPlaylist } from './user_saved_playlists/entities/user_saved_playlist.entity'; // <--- ¡IMPORTA LA ENTIDAD AQUÍ!
 
 import { UserSavedPlaylistsModule } from './user_saved_playlists/user_saved_playlists.module';
@@ -33,13 +35,16 @@ import { UserSavedPlaylistsModule } from './user_saved_playlists/user_saved_play
       database: 'postgres',
       entities: [
         User,
+        UserFollow,
         Song,
         Playlist,
         Comment,
         SongRating,
+        SongRatingAggregate,
         UserSavedPlaylist, // <--- ¡CORRECCIÓN: AÑADIDA LA CLASE DE LA ENTIDAD!
       ],
       synchronize: false,
+      // Los cambios de esquema se aplican aparte con `npm run migration:run` (src/data-source.ts)
       ssl: true,
       extra: {
         ssl: {
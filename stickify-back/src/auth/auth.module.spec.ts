@@ -7,6 +7,7 @@ import { UsersService } from '../user/user.service';
 import { JwtModule } from '@nestjs/jwt';
 import { getRepositoryToken } from '@nestjs/typeorm';
 import { User } from '../user/entities/user.entity';
+import { UserFollow } from '../user/entities/user-follow.entity';
 
 describe('AuthModule', () => {
   let module: TestingModule;
@@ -26,6 +27,8 @@ describe('AuthModule', () => {
       //Mock repositorio de usuarios 
       .overrideProvider(getRepositoryToken(User))
       .useValue({}) // mock vacío del repositorio
+      .overrideProvider(getRepositoryToken(UserFollow))
+      .useValue({})
       .compile();
   });
 
@@ -4,6 +4,7 @@ import { AuthController } from './auth.controller';
 import { JwtModule } from '@nestjs/jwt';
 import { UsersService } from '../user/user.service';
 import { User } from '../user/entities/user.entity';
+import { UserFollow } from '../user/entities/user-follow.entity';
 import { TypeOrmModule } from '@nestjs/typeorm';
 
 @Module({
@@ -15,7 +16,7 @@ import { TypeOrmModule } from '@nestjs/typeorm';
       secret: 'AABBCC',
       signOptions: { expiresIn: '1h' }
     }),
-    TypeOrmModule.forFeature([User])
+    TypeOrmModule.forFeature([User, UserFollow])
   ]
 })
 export class AuthModule {}
\ No newline at end of file
@@ -14,8 +14,8 @@ describe('AuthService - signUp', () => {
     password: 'hashedpassword123',
     username: 'NewUser',
     premium: false,
-    followers: [],
-    following: [],
+    followersCount: 0,
+    followingCount: 0,
   };
   //Mock servicio de usuarios (simula la lógica de creación de usuarios)
   const mockUserService = {
@@ -55,8 +55,6 @@ describe('AuthService - signUp', () => {
       email: 'newuser@example.com',
       password: 'password123',
       premium: false,
-      followers: [],
-      following: [],
     });
     //Assert resultado final
     expect(result).toEqual(mockUser);
@@ -18,8 +18,8 @@ describe('AuthService', () => {
     password: bcrypt.hashSync('password123', 10),
     username: 'TestUser',
     premium: false,
-    followers: [],
-    following: [],
+    followersCount: 0,
+    followingCount: 0,
   };
   //Mock repositorio de usuarios
   const mockUserRepository = {
@@ -59,9 +59,11 @@ describe('AuthService', () => {
       email: mockUser.email,
       username: mockUser.username,
       premium: mockUser.premium,
-      followers: [],
-      following: [],
+      followersCount: 0,
+      followingCount: 0,
     });
+    //El token no lleva listas de seguidores: solo el usuario sin contraseña
+    expect(mockUserService.getToken).toHaveBeenCalledWith(mockUser);
   });
 
   it('should throw NotFoundException if credentials are invalid', async () => {
@@ -38,9 +38,7 @@ export class AuthService {
             username: signUpDto.username, 
             email: signUpDto.email,
             password: signUpDto.password!,
-            premium: signUpDto.premium || false,
-            followers: [], 
-            following: []  
+            premium: signUpDto.premium || false
         });
     }
 }
\ No newline at end of file
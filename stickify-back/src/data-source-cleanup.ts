@@ -0,0 +1,14 @@
+// src/data-source-cleanup.ts
+// Paso posterior a migration:run, en un despliegue aparte: las migraciones que borran datos
+// antiguos, una vez comprobada la copia que hizo la migración anterior (ver cada una):
+//   npm run migration:cleanup:show | npm run migration:cleanup:run | npm run migration:cleanup:revert
+// Lleva también las de data-source.ts, así que migration:cleanup:run aplica antes las pendientes.
+import { DataSource } from 'typeorm';
+
+import { dataSourceOptions, MIGRATIONS } from './data-source';
+import { DropUserFollowArrays1792296000000 } from './migrations/1792296000000-DropUserFollowArrays';
+
+export default new DataSource({
+  ...dataSourceOptions,
+  migrations: [...MIGRATIONS, DropUserFollowArrays1792296000000],
+});
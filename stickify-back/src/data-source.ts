@@ -0,0 +1,47 @@
+// src/data-source.ts
+// Conexión del CLI de TypeORM para aplicar las migraciones como un paso aparte del despliegue
+// (la app ya no las ejecuta al arrancar, así varias instancias no compiten por ellas):
+//   npm run migration:show | npm run migration:run | npm run migration:revert
+// Las que borran datos antiguos van aparte, en data-source-cleanup.ts.
+import { existsSync } from 'fs';
+import { DataSource, DataSourceOptions } from 'typeorm';
+
+import { SongsSearchIndexes1792281600000 } from './migrations/1792281600000-SongsSearchIndexes';
+import { SongRatingAggregates1792285200000 } from './migrations/1792285200000-SongRatingAggregates';
+import { RatingsUpsertTrigger1792288800000 } from './migrations/1792288800000-RatingsUpsertTrigger';
+import { UserFollowsTable1792292400000 } from './migrations/1792292400000-UserFollowsTable';
+
+// Las mismas variables que lee ConfigModule en la app
+if (existsSync('.env')) {
+  process.loadEnvFile('.env');
+}
+
+export const MIGRATIONS = [
+  SongsSearchIndexes1792281600000,
+  SongRatingAggregates1792285200000,
+  RatingsUpsertTrigger1792288800000,
+  UserFollowsTable1792292400000,
+];
+
+export const dataSourceOptions: DataSourceOptions = {
+  type: 'postgres',
+  host: process.env.SUPABASE_HOST,
+  // Pooler en modo sesión (5432), no el de transacciones (6543) que usa la app:
+  // CREATE INDEX CONCURRENTLY y el bloqueo de la tabla de migraciones necesitan una sola conexión
+  port: Number(process.env.SUPABASE_MIGRATIONS_PORT ?? 5432),
+  username: 'postgres.txsacbfleedgdjofxowq',
+  password: process.env.SUPABASE_PASSWORD,
+  database: 'postgres',
+  entities: [__dirname + '/**/*.entity{.ts,.js}'],
+  migrations: MIGRATIONS,
+  // Cada migración en su propia transacción (las de CREATE INDEX CONCURRENTLY, sin ella)
+  migrationsTransactionMode: 'each',
+  ssl: true,
+  extra: {
+    ssl: {
+      rejectUnauthorized: false,
+    },
+  },
+};
+
+export default new DataSource(dataSourceOptions);
@@ -0,0 +1,48 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+// Índices para GET /songs paginado y filtrado (SongsService.findPage).
+// CONCURRENTLY no bloquea las escrituras en songs mientras se crean, pero no
+// puede ir dentro de una transacción.
+export class SongsSearchIndexes1792281600000 implements MigrationInterface {
+  name = 'SongsSearchIndexes1792281600000';
+  transaction = false;
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`CREATE EXTENSION IF NOT EXISTS pg_trgm`);
+    // Orden de la página: ORDER BY "isUserUpload" DESC, "trackId" DESC y el cursor (isUserUpload, trackId) < (...)
+    await queryRunner.query(
+      `CREATE INDEX CONCURRENTLY IF NOT EXISTS "IDX_songs_upload_track" ON "songs" ("isUserUpload" DESC, "trackId" DESC)`,
+    );
+    // ILIKE '%texto%' en título y artista
+    await queryRunner.query(
+      `CREATE INDEX CONCURRENTLY IF NOT EXISTS "IDX_songs_track_name_trgm" ON "songs" USING gin ("trackName" gin_trgm_ops)`,
+    );
+    await queryRunner.query(
+      `CREATE INDEX CONCURRENTLY IF NOT EXISTS "IDX_songs_artist_name_trgm" ON "songs" USING gin ("artistName" gin_trgm_ops)`,
+    );
+    // Filtros exactos por artista y género
+    await queryRunner.query(
+      `CREATE INDEX CONCURRENTLY IF NOT EXISTS "IDX_songs_artist_name" ON "songs" ("artistName")`,
+    );
+    await queryRunner.query(
+      `CREATE INDEX CONCURRENTLY IF NOT EXISTS "IDX_songs_genre" ON "songs" ("primaryGenreName")`,
+    );
+    // releaseDate es texto ISO ("2020-01-01T08:00:00Z"): el año son sus 4 primeros caracteres
+    await queryRunner.query(
+      `CREATE INDEX CONCURRENTLY IF NOT EXISTS "IDX_songs_release_year" ON "songs" ((LEFT("releaseDate", 4)))`,
+    );
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    for (const index of [
+      'IDX_songs_release_year',
+      'IDX_songs_genre',
+      'IDX_songs_artist_name',
+      'IDX_songs_artist_name_trgm',
+      'IDX_songs_track_name_trgm',
+      'IDX_songs_upload_track',
+    ]) {
+      await queryRunner.query(`DROP INDEX CONCURRENTLY IF EXISTS "${index}"`);
+    }
+  }
+}
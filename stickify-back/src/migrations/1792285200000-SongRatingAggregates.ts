@@ -0,0 +1,28 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+// Tabla de agregados por canción (SongRatingAggregate) y su carga inicial
+// desde las calificaciones que ya existen.
+export class SongRatingAggregates1792285200000 implements MigrationInterface {
+  name = 'SongRatingAggregates1792285200000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `CREATE TABLE IF NOT EXISTS "song_rating_aggregates" (
+        "trackId" integer PRIMARY KEY,
+        "ratingCount" integer NOT NULL DEFAULT 0,
+        "ratingSum" double precision NOT NULL DEFAULT 0
+      )`,
+    );
+    await queryRunner.query(
+      `INSERT INTO "song_rating_aggregates" ("trackId", "ratingCount", "ratingSum")
+       SELECT "trackId", COUNT(*), SUM("rating") FROM "song_ratings" GROUP BY "trackId"
+       ON CONFLICT ("trackId") DO UPDATE SET
+         "ratingCount" = EXCLUDED."ratingCount",
+         "ratingSum" = EXCLUDED."ratingSum"`,
+    );
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP TABLE IF EXISTS "song_rating_aggregates"`);
+  }
+}
@@ -0,0 +1,104 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+// Suma a cada canción los cambios (trackId, count, sum) de la consulta dada, con
+// las canciones en orden para que dos sentencias simultáneas no se bloqueen en cruz
+function addToAggregates(changes: string): string {
+  return `INSERT INTO "song_rating_aggregates" ("trackId", "ratingCount", "ratingSum")
+          SELECT "trackId", SUM("count"), SUM("sum") FROM (${changes}) AS changes
+          GROUP BY "trackId"
+          ORDER BY "trackId"
+          ON CONFLICT ("trackId") DO UPDATE SET
+            "ratingCount" = "song_rating_aggregates"."ratingCount" + EXCLUDED."ratingCount",
+            "ratingSum" = "song_rating_aggregates"."ratingSum" + EXCLUDED."ratingSum"`;
+}
+
+// - Índice único (userId, trackId) para INSERT ... ON CONFLICT en RatingsService
+//   (solo si la tabla no tiene ya una clave primaria o índice único con esas columnas).
+// - song_rating_aggregates pasa a mantenerlo la base: un trigger por sentencia con
+//   tablas de transición, así un lote de miles de filas hace un solo UPSERT por canción.
+export class RatingsUpsertTrigger1792288800000 implements MigrationInterface {
+  name = 'RatingsUpsertTrigger1792288800000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`
+      DO $$
+      BEGIN
+        IF NOT EXISTS (
+          SELECT 1
+          FROM pg_index i
+          WHERE i.indrelid = '"song_ratings"'::regclass
+            AND i.indisunique
+            AND i.indnatts = 2
+            AND (
+              SELECT array_agg(a.attname::text ORDER BY a.attname::text)
+              FROM pg_attribute a
+              WHERE a.attrelid = i.indrelid AND a.attnum = ANY (i.indkey)
+            ) = ARRAY['trackId', 'userId']
+        ) THEN
+          -- Calificaciones repetidas de antes del índice: queda la última escrita
+          DELETE FROM "song_ratings" older
+          USING "song_ratings" newer
+          WHERE older."userId" = newer."userId"
+            AND older."trackId" = newer."trackId"
+            AND older.ctid < newer.ctid;
+          CREATE UNIQUE INDEX "UQ_song_ratings_user_track" ON "song_ratings" ("userId", "trackId");
+        END IF;
+      END
+      $$;
+    `);
+
+    // Cada trigger solo ve sus tablas de transición: new_rows (INSERT), old_rows (DELETE) o ambas (UPDATE)
+    await queryRunner.query(`
+      CREATE OR REPLACE FUNCTION song_rating_aggregates_apply() RETURNS trigger
+      LANGUAGE plpgsql AS $$
+      BEGIN
+        IF TG_OP = 'INSERT' THEN
+          ${addToAggregates(`SELECT "trackId", 1 AS "count", "rating" AS "sum" FROM new_rows`)};
+        ELSIF TG_OP = 'DELETE' THEN
+          ${addToAggregates(`SELECT "trackId", -1 AS "count", -"rating" AS "sum" FROM old_rows`)};
+        ELSE
+          ${addToAggregates(
+            `SELECT "trackId", 1 AS "count", "rating" AS "sum" FROM new_rows
+             UNION ALL
+             SELECT "trackId", -1, -"rating" FROM old_rows`,
+          )};
+        END IF;
+        RETURN NULL;
+      END
+      $$;
+    `);
+    await queryRunner.query(`DROP TRIGGER IF EXISTS "song_ratings_aggregates_insert" ON "song_ratings"`);
+    await queryRunner.query(`DROP TRIGGER IF EXISTS "song_ratings_aggregates_update" ON "song_ratings"`);
+    await queryRunner.query(`DROP TRIGGER IF EXISTS "song_ratings_aggregates_delete" ON "song_ratings"`);
+    await queryRunner.query(`
+      CREATE TRIGGER "song_ratings_aggregates_insert" AFTER INSERT ON "song_ratings"
+      REFERENCING NEW TABLE AS new_rows
+      FOR EACH STATEMENT EXECUTE FUNCTION song_rating_aggregates_apply()
+    `);
+    await queryRunner.query(`
+      CREATE TRIGGER "song_ratings_aggregates_update" AFTER UPDATE ON "song_ratings"
+      REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+      FOR EACH STATEMENT EXECUTE FUNCTION song_rating_aggregates_apply()
+    `);
+    await queryRunner.query(`
+      CREATE TRIGGER "song_ratings_aggregates_delete" AFTER DELETE ON "song_ratings"
+      REFERENCING OLD TABLE AS old_rows
+      FOR EACH STATEMENT EXECUTE FUNCTION song_rating_aggregates_apply()
+    `);
+
+    // Recalcula los agregados: las filas repetidas borradas arriba ya no cuentan
+    await queryRunner.query(`DELETE FROM "song_rating_aggregates"`);
+    await queryRunner.query(
+      `INSERT INTO "song_rating_aggregates" ("trackId", "ratingCount", "ratingSum")
+       SELECT "trackId", COUNT(*), SUM("rating") FROM "song_ratings" GROUP BY "trackId"`,
+    );
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP TRIGGER IF EXISTS "song_ratings_aggregates_insert" ON "song_ratings"`);
+    await queryRunner.query(`DROP TRIGGER IF EXISTS "song_ratings_aggregates_update" ON "song_ratings"`);
+    await queryRunner.query(`DROP TRIGGER IF EXISTS "song_ratings_aggregates_delete" ON "song_ratings"`);
+    await queryRunner.query(`DROP FUNCTION IF EXISTS song_rating_aggregates_apply()`);
+    await queryRunner.query(`DROP INDEX IF EXISTS "UQ_song_ratings_user_track"`);
+  }
+}
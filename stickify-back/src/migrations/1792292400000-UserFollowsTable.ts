@@ -0,0 +1,116 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+// Grafo de seguidores en su propia tabla (UserFollow) en lugar de los arrays de correos
+// users.followers / users.following:
+// - user_follows con clave (followerId, followeeId) e índices por fecha para paginar.
+// - users.followersCount / followingCount, que mantiene un trigger por sentencia.
+// - Carga inicial desde los arrays (en su orden). Los arrays se quedan sin tocar: los borra
+//   DropUserFollowArrays en un despliegue posterior, una vez comprobada esta copia.
+export class UserFollowsTable1792292400000 implements MigrationInterface {
+  name = 'UserFollowsTable1792292400000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `CREATE TABLE IF NOT EXISTS "user_follows" (
+        "followerId" uuid NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE,
+        "followeeId" uuid NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE,
+        "createdAt" timestamptz NOT NULL DEFAULT now(),
+        CONSTRAINT "PK_user_follows" PRIMARY KEY ("followerId", "followeeId"),
+        CONSTRAINT "CHK_user_follows_not_self" CHECK ("followerId" <> "followeeId")
+      )`,
+    );
+    // Páginas de seguidos / seguidores: ORDER BY "createdAt" DESC, id DESC con cursor
+    await queryRunner.query(
+      `CREATE INDEX IF NOT EXISTS "IDX_user_follows_follower_created"
+       ON "user_follows" ("followerId", "createdAt" DESC, "followeeId" DESC)`,
+    );
+    await queryRunner.query(
+      `CREATE INDEX IF NOT EXISTS "IDX_user_follows_followee_created"
+       ON "user_follows" ("followeeId", "createdAt" DESC, "followerId" DESC)`,
+    );
+    await queryRunner.query(
+      `ALTER TABLE "users"
+       ADD COLUMN IF NOT EXISTS "followersCount" integer NOT NULL DEFAULT 0,
+       ADD COLUMN IF NOT EXISTS "followingCount" integer NOT NULL DEFAULT 0`,
+    );
+
+    // Los arrays se escribían por separado y pueden no coincidir: se unen ambos lados.
+    // El último correo del array es el seguimiento más reciente, así que se conserva el orden.
+    // Los autoseguimientos que hubiera en los arrays se descartan (CHK_user_follows_not_self).
+    await queryRunner.query(
+      `INSERT INTO "user_follows" ("followerId", "followeeId", "createdAt")
+       SELECT follower."id", followee."id",
+              now() - (cardinality(follower."following") - item.position) * interval '1 millisecond'
+       FROM "users" follower
+       CROSS JOIN LATERAL unnest(follower."following") WITH ORDINALITY AS item(email, position)
+       JOIN "users" followee ON followee."email" = item.email
+       WHERE follower."id" <> followee."id"
+       ON CONFLICT DO NOTHING`,
+    );
+    await queryRunner.query(
+      `INSERT INTO "user_follows" ("followerId", "followeeId", "createdAt")
+       SELECT follower."id", followee."id",
+              now() - (cardinality(followee."followers") - item.position) * interval '1 millisecond'
+       FROM "users" followee
+       CROSS JOIN LATERAL unnest(followee."followers") WITH ORDINALITY AS item(email, position)
+       JOIN "users" follower ON follower."email" = item.email
+       WHERE follower."id" <> followee."id"
+       ON CONFLICT DO NOTHING`,
+    );
+    await queryRunner.query(
+      `UPDATE "users" u SET
+         "followersCount" = (SELECT COUNT(*) FROM "user_follows" f WHERE f."followeeId" = u."id"),
+         "followingCount" = (SELECT COUNT(*) FROM "user_follows" f WHERE f."followerId" = u."id")`,
+    );
+
+    // Seguir / dejar de seguir tocan una arista; los contadores se suman en la misma sentencia,
+    // sin leer ni reescribir listas. También cuenta el borrado en cascada al eliminar un usuario.
+    await queryRunner.query(
+      `CREATE OR REPLACE FUNCTION user_follows_counts() RETURNS trigger
+       LANGUAGE plpgsql AS $$
+       BEGIN
+         IF TG_OP = 'INSERT' THEN
+           UPDATE "users" u SET "followingCount" = u."followingCount" + c.n
+           FROM (SELECT "followerId" AS id, COUNT(*) AS n FROM new_rows GROUP BY 1) c WHERE u."id" = c.id;
+           UPDATE "users" u SET "followersCount" = u."followersCount" + c.n
+           FROM (SELECT "followeeId" AS id, COUNT(*) AS n FROM new_rows GROUP BY 1) c WHERE u."id" = c.id;
+         ELSE
+           UPDATE "users" u SET "followingCount" = u."followingCount" - c.n
+           FROM (SELECT "followerId" AS id, COUNT(*) AS n FROM old_rows GROUP BY 1) c WHERE u."id" = c.id;
+           UPDATE "users" u SET "followersCount" = u."followersCount" - c.n
+           FROM (SELECT "followeeId" AS id, COUNT(*) AS n FROM old_rows GROUP BY 1) c WHERE u."id" = c.id;
+         END IF;
+         RETURN NULL;
+       END $$`,
+    );
+    await queryRunner.query(`DROP TRIGGER IF EXISTS "user_follows_counts_insert" ON "user_follows"`);
+    await queryRunner.query(`DROP TRIGGER IF EXISTS "user_follows_counts_delete" ON "user_follows"`);
+    await queryRunner.query(
+      `CREATE TRIGGER "user_follows_counts_insert" AFTER INSERT ON "user_follows"
+       REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION user_follows_counts()`,
+    );
+    await queryRunner.query(
+      `CREATE TRIGGER "user_follows_counts_delete" AFTER DELETE ON "user_follows"
+       REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION user_follows_counts()`,
+    );
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    // Los arrays siguen ahí, pero sin los seguimientos hechos desde la carga: se rehacen
+    // desde user_follows antes de borrarla
+    await queryRunner.query(
+      `UPDATE "users" u SET
+         "followers" = COALESCE((SELECT array_agg(other."email" ORDER BY f."createdAt")
+                                 FROM "user_follows" f JOIN "users" other ON other."id" = f."followerId"
+                                 WHERE f."followeeId" = u."id"), '{}'),
+         "following" = COALESCE((SELECT array_agg(other."email" ORDER BY f."createdAt")
+                                 FROM "user_follows" f JOIN "users" other ON other."id" = f."followeeId"
+                                 WHERE f."followerId" = u."id"), '{}')`,
+    );
+    await queryRunner.query(`DROP TABLE IF EXISTS "user_follows"`);
+    await queryRunner.query(`DROP FUNCTION IF EXISTS user_follows_counts()`);
+    await queryRunner.query(
+      `ALTER TABLE "users" DROP COLUMN IF EXISTS "followersCount", DROP COLUMN IF EXISTS "followingCount"`,
+    );
+  }
+}
@@ -0,0 +1,45 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+// Segundo paso de UserFollowsTable: borra users.followers / users.following, que la app ya no usa.
+// Solo está en data-source-cleanup.ts (npm run migration:cleanup:run): se aplica en un despliegue
+// posterior, cuando esta consulta (seguimientos de los arrays que faltan en user_follows,
+// sin contar los autoseguimientos) devuelva 0 filas tras la carga inicial:
+//
+//   SELECT u."id", item.email
+//   FROM "users" u CROSS JOIN LATERAL unnest(u."following") AS item(email)
+//   JOIN "users" followee ON followee."email" = item.email AND followee."id" <> u."id"
+//   LEFT JOIN "user_follows" f ON f."followerId" = u."id" AND f."followeeId" = followee."id"
+//   WHERE f."followerId" IS NULL;
+//
+// Aun así los arrays se copian a user_follow_arrays_backup antes de borrar las columnas.
+export class DropUserFollowArrays1792296000000 implements MigrationInterface {
+  name = 'DropUserFollowArrays1792296000000';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `CREATE TABLE IF NOT EXISTS "user_follow_arrays_backup" AS
+       SELECT "id", "followers", "following" FROM "users"`,
+    );
+    await queryRunner.query(
+      `ALTER TABLE "users" DROP COLUMN IF EXISTS "followers", DROP COLUMN IF EXISTS "following"`,
+    );
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(
+      `ALTER TABLE "users"
+       ADD COLUMN IF NOT EXISTS "followers" text[] NOT NULL DEFAULT '{}',
+       ADD COLUMN IF NOT EXISTS "following" text[] NOT NULL DEFAULT '{}'`,
+    );
+    // El estado actual está en user_follows (la copia de seguridad es la de antes del borrado)
+    await queryRunner.query(
+      `UPDATE "users" u SET
+         "followers" = COALESCE((SELECT array_agg(other."email" ORDER BY f."createdAt")
+                                 FROM "user_follows" f JOIN "users" other ON other."id" = f."followerId"
+                                 WHERE f."followeeId" = u."id"), '{}'),
+         "following" = COALESCE((SELECT array_agg(other."email" ORDER BY f."createdAt")
+                                 FROM "user_follows" f JOIN "users" other ON other."id" = f."followeeId"
+                                 WHERE f."followerId" = u."id"), '{}')`,
+    );
+  }
+}
@@ -0,0 +1,10 @@
+import { CreateRatingDto } from './create-song-rating.dto';
+
+export class RatingsBatchDto {
+  ratings: CreateRatingDto[];
+}
+
+export class RatingsBatchResultDto {
+  received: number;
+  upserted: number; // filas distintas (userId, trackId) tras descartar repetidas
+}
@@ -0,0 +1,5 @@
+export class TrackAverageDto {
+  trackId: number;
+  average: number; // 0 si nadie la calificó
+  count: number;
+}
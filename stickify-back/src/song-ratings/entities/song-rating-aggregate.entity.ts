@@ -0,0 +1,15 @@
+import { Entity, PrimaryColumn, Column } from 'typeorm';
+
+// Conteo y suma de las calificaciones de cada canción; los mantiene un trigger
+// de song_ratings (migración RatingsUpsertTrigger) en la misma sentencia que los cambia.
+@Entity('song_rating_aggregates')
+export class SongRatingAggregate {
+  @PrimaryColumn()
+  trackId: number;
+
+  @Column('integer', { default: 0 })
+  ratingCount: number;
+
+  @Column('double precision', { default: 0 })
+  ratingSum: number;
+}
@@ -2,6 +2,7 @@ import { Test, TestingModule } from '@nestjs/testing';
 import { RatingsController } from './song-ratings.controller';
 import { RatingsService } from './song-ratings.service';
 import { CreateRatingDto } from './dto/create-song-rating.dto';
+import { BadRequestException } from '@nestjs/common';
 
 describe('RatingsController', () => {
   let controller: RatingsController;
@@ -20,9 +21,12 @@ describe('RatingsController', () => {
           provide: RatingsService,
           useValue: {
             upsert: jest.fn(),
+            upsertMany: jest.fn(),
             findAll: jest.fn(),
             findByUserId: jest.fn(),
             getAverageRating: jest.fn(),
+            getAverageRatings: jest.fn(),
+            remove: jest.fn(),
           },
         },
       ],
@@ -45,6 +49,26 @@ describe('RatingsController', () => {
     });
   });
 
+  describe('upsertRatings', () => {
+    it('should upsert a batch of ratings in one call', async () => {
+      //Arrange
+      const ratings = [mockRating1, mockRating2, mockRating3].map(({ userId, trackId, rating }) => ({ userId, trackId, rating }));
+      service.upsertMany.mockResolvedValueOnce({ received: 3, upserted: 3 });
+      //Act
+      const result = await controller.upsertRatings({ ratings });
+      //Assert
+      expect(service.upsertMany).toHaveBeenCalledWith(ratings);
+      expect(result).toEqual({ received: 3, upserted: 3 });
+    });
+    it('should reject a body without a list of valid ratings', async () => {
+      await expect(controller.upsertRatings({} as any)).rejects.toBeInstanceOf(BadRequestException);
+      await expect(
+        controller.upsertRatings({ ratings: [{ userId: 'user1@mail.com', trackId: 'x', rating: 4 }] } as any),
+      ).rejects.toBeInstanceOf(BadRequestException);
+      expect(service.upsertMany).not.toHaveBeenCalled();
+    });
+  });
+
   describe('getAllRatings', () => {
     it('should return all ratings (3 times)', async () => {
       for (const arr of [
@@ -87,4 +111,35 @@ describe('RatingsController', () => {
       }
     });
   });
+
+  describe('getAverageRatings', () => {
+    it('should return the averages of many tracks in one call', async () => {
+      //Arrange
+      const averages = [
+        { trackId: 101, average: 4, count: 2 },
+        { trackId: 102, average: 0, count: 0 },
+      ];
+      service.getAverageRatings.mockResolvedValueOnce(averages);
+      //Assert los ids repetidos se piden una sola vez
+      expect(await controller.getAverageRatings('101,102,101')).toEqual(averages);
+      expect(service.getAverageRatings).toHaveBeenCalledWith([101, 102]);
+    });
+    it('should reject trackIds that are not integers', async () => {
+      await expect(controller.getAverageRatings('101,abc')).rejects.toBeInstanceOf(BadRequestException);
+      expect(service.getAverageRatings).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('removeRating', () => {
+    it('should delete the rating of a user for a track (3 times)', async () => {
+      for (const rating of [mockRating1, mockRating2, mockRating3]) {
+        //Arrange
+        service.remove.mockResolvedValueOnce(undefined);
+        //Act
+        await controller.removeRating(rating.userId, rating.trackId.toString());
+        //Assert
+        expect(service.remove).toHaveBeenCalledWith(rating.userId, rating.trackId);
+      }
+    });
+  });
 });
@@ -1,7 +1,14 @@
 // src/song-ratings/song-ratings.controller.ts
-import { Controller, Get, Post, Body, Query, Param } from '@nestjs/common'; // Add Param
+import { Controller, Get, Post, Delete, Body, Query, Param, HttpCode, HttpStatus, BadRequestException } from '@nestjs/common'; // Add Param
 import { RatingsService } from './song-ratings.service';
 import { CreateRatingDto } from './dto/create-song-rating.dto';
+import { TrackAverageDto } from './dto/track-average.dto';
+import { RatingsBatchDto, RatingsBatchResultDto } from './dto/ratings-batch.dto';
+
+// Tope de canciones por petición a /ratings/averages (una grilla de la home cabe de sobra)
+export const MAX_AVERAGE_TRACK_IDS = 500;
+// Tope de calificaciones por POST /ratings/batch
+export const MAX_BATCH_RATINGS = 10000;
 
 @Controller('ratings')
 export class RatingsController {
@@ -12,6 +19,25 @@ export class RatingsController {
     return this.ratingsService.upsert(dto);
   }
 
+  @Post('batch') // POST /api/ratings/batch { ratings: [{ userId, trackId, rating }, ...] }
+  async upsertRatings(@Body() body: RatingsBatchDto): Promise<RatingsBatchResultDto> {
+    const ratings = body?.ratings;
+    if (!Array.isArray(ratings)) {
+      throw new BadRequestException('Se esperaba { ratings: [...] }');
+    }
+    if (ratings.length > MAX_BATCH_RATINGS) {
+      throw new BadRequestException(`Como máximo ${MAX_BATCH_RATINGS} calificaciones por petición`);
+    }
+    const invalid = ratings.findIndex(
+      (rating) =>
+        typeof rating?.userId !== 'string' || !Number.isInteger(rating.trackId) || typeof rating.rating !== 'number',
+    );
+    if (invalid !== -1) {
+      throw new BadRequestException(`Calificación ${invalid} inválida: se espera { userId, trackId, rating }`);
+    }
+    return this.ratingsService.upsertMany(ratings);
+  }
+
   @Get()
   async getAllRatings() {
     return this.ratingsService.findAll();
@@ -28,4 +54,23 @@ export class RatingsController {
     const avg = await this.ratingsService.getAverageRating(+trackId);
     return { trackId, average: avg };
   }
+
+  // e.g., /ratings/averages?trackIds=101,102,103 -> [{ trackId, average, count }, ...]
+  @Get('averages')
+  async getAverageRatings(@Query('trackIds') trackIds: string = ''): Promise<TrackAverageDto[]> {
+    const ids = [...new Set(trackIds.split(',').filter((id) => id !== '').map(Number))];
+    if (ids.some((id) => !Number.isInteger(id))) {
+      throw new BadRequestException('trackIds debe ser una lista de enteros separados por comas');
+    }
+    if (ids.length > MAX_AVERAGE_TRACK_IDS) {
+      throw new BadRequestException(`Como máximo ${MAX_AVERAGE_TRACK_IDS} trackIds por petición`);
+    }
+    return this.ratingsService.getAverageRatings(ids);
+  }
+
+  @Delete(':userId/:trackId') // e.g., /ratings/john@example.com/42
+  @HttpCode(HttpStatus.NO_CONTENT)
+  async removeRating(@Param('userId') userId: string, @Param('trackId') trackId: string) {
+    await this.ratingsService.remove(userId, +trackId);
+  }
 }
\ No newline at end of file
@@ -5,6 +5,7 @@ import { RatingsService } from './song-ratings.service';
 import { RatingsController } from './song-ratings.controller';
 import { getRepositoryToken } from '@nestjs/typeorm';
 import { SongRating } from './entities/song-rating.entity';
+import { SongRatingAggregate } from './entities/song-rating-aggregate.entity';
 
 describe('RatingsModule', () => {
   let ratingsService: RatingsService;
@@ -18,6 +19,8 @@ describe('RatingsModule', () => {
       //Mock del repositorio de SongRating
       .overrideProvider(getRepositoryToken(SongRating)) // sobrescribimos el repo real
       .useValue({}) // mock vacío o se puede añadir métodos (find, save, etc.)
+      .overrideProvider(getRepositoryToken(SongRatingAggregate))
+      .useValue({})
       .compile();
     //Act obtiene el servicio y el controlador del modulo
     ratingsService = module.get<RatingsService>(RatingsService);
@@ -2,11 +2,12 @@
 import { Module } from '@nestjs/common';
 import { TypeOrmModule } from '@nestjs/typeorm';
 import { SongRating } from './entities/song-rating.entity';
+import { SongRatingAggregate } from './entities/song-rating-aggregate.entity';
 import { RatingsService } from './song-ratings.service';
 import { RatingsController } from './song-ratings.controller';
 
 @Module({
-  imports: [TypeOrmModule.forFeature([SongRating])],
+  imports: [TypeOrmModule.forFeature([SongRating, SongRatingAggregate])],
   providers: [RatingsService],
   controllers: [RatingsController],
 })
@@ -1,7 +1,8 @@
 import { Test, TestingModule } from '@nestjs/testing';
-import { RatingsService } from './song-ratings.service';
+import { RatingsService, RATINGS_BATCH_CHUNK } from './song-ratings.service';
 import { getRepositoryToken } from '@nestjs/typeorm';
 import { SongRating } from './entities/song-rating.entity';
+import { SongRatingAggregate } from './entities/song-rating-aggregate.entity';
 import { Repository } from 'typeorm';
 import { CreateRatingDto } from './dto/create-song-rating.dto';
 
@@ -14,12 +15,33 @@ describe('RatingsService', () => {
     trackId: 42,
     rating: 4,
   };
+  //Mock del QueryBuilder: insert().into().values().orUpdate().returning().execute()
+  const mockQueryBuilder = {
+    insert: jest.fn().mockReturnThis(),
+    into: jest.fn().mockReturnThis(),
+    values: jest.fn().mockReturnThis(),
+    orUpdate: jest.fn().mockReturnThis(),
+    returning: jest.fn().mockReturnThis(),
+    execute: jest.fn().mockResolvedValue({ raw: [mockRating] }),
+  };
   //Mock del repositorio TypeORM 
   const mockRepository = {
-    findOne: jest.fn(),
-    create: jest.fn().mockImplementation((dto) => ({ ...dto })),
-    save: jest.fn().mockResolvedValue(mockRating),
     find: jest.fn().mockResolvedValue([mockRating]),
+    delete: jest.fn().mockResolvedValue({ affected: 1 }),
+    createQueryBuilder: jest.fn().mockReturnValue(mockQueryBuilder),
+    //La transacción del lote usa el mismo QueryBuilder falso
+    manager: {
+      transaction: jest.fn(),
+    },
+  };
+  const mockManager = {
+    createQueryBuilder: jest.fn().mockReturnValue(mockQueryBuilder),
+  };
+  mockRepository.manager.transaction.mockImplementation((work) => work(mockManager));
+  //Mock del repositorio de agregados por canción
+  const mockAggregatesRepository = {
+    findOne: jest.fn(),
+    find: jest.fn(),
   };
 
   beforeEach(async () => {
@@ -29,47 +51,66 @@ describe('RatingsService', () => {
         RatingsService,
         //Mock para inyectar el repositorio falso
         { provide: getRepositoryToken(SongRating), useValue: mockRepository },
+        { provide: getRepositoryToken(SongRatingAggregate), useValue: mockAggregatesRepository },
       ],
     }).compile();
 
     service = module.get<RatingsService>(RatingsService);
     repository = module.get<Repository<SongRating>>(getRepositoryToken(SongRating));
+    jest.clearAllMocks();
   });
 
-  it('should insert a new rating if none exists', async () => {
-    mockRepository.findOne.mockResolvedValue(null);
+  it('should upsert a rating with a single INSERT ... ON CONFLICT', async () => {
     //Arrange
     const dto: CreateRatingDto = {
       userId: 'user123',
       trackId: 42,
-      rating: 5,
+      rating: 4,
     };
     //Act
     const result = await service.upsert(dto);
-    //Assert
-    expect(mockRepository.findOne).toHaveBeenCalledWith({
-      where: { userId: dto.userId, trackId: dto.trackId },
-    });
-    expect(mockRepository.create).toHaveBeenCalledWith(dto);
-    expect(mockRepository.save).toHaveBeenCalledWith(dto);
+    //Assert una sola sentencia, sin lectura previa
+    expect(mockQueryBuilder.into).toHaveBeenCalledWith(SongRating);
+    expect(mockQueryBuilder.values).toHaveBeenCalledWith(dto);
+    expect(mockQueryBuilder.orUpdate).toHaveBeenCalledWith(['rating'], ['userId', 'trackId']);
+    expect(mockQueryBuilder.execute).toHaveBeenCalledTimes(1);
     expect(result).toEqual(mockRating);
   });
 
-  it('should update existing rating if found', async () => {
-    const existing = { ...mockRating, rating: 3 };
-    mockRepository.findOne.mockResolvedValue(existing);
+  it('should upsert a batch keeping the last rating of each user and track', async () => {
     //Arrange
-    const dto: CreateRatingDto = {
+    const ratings: CreateRatingDto[] = [
+      { userId: 'b', trackId: 43, rating: 1 },
+      { userId: 'a', trackId: 42, rating: 2 },
+      { userId: 'b', trackId: 43, rating: 5 },
+    ];
+    //Act
+    const result = await service.upsertMany(ratings);
+    //Assert las filas van sin repetir y ordenadas por canción
+    expect(mockRepository.manager.transaction).toHaveBeenCalledTimes(1);
+    expect(mockQueryBuilder.values).toHaveBeenCalledWith([
+      { userId: 'a', trackId: 42, rating: 2 },
+      { userId: 'b', trackId: 43, rating: 5 },
+    ]);
+    expect(result).toEqual({ received: 3, upserted: 2 });
+  });
+
+  it('should split a large batch into chunks', async () => {
+    //Arrange
+    const ratings: CreateRatingDto[] = Array.from({ length: RATINGS_BATCH_CHUNK * 2 + 1 }, (_, i) => ({
       userId: 'user123',
-      trackId: 42,
-      rating: 5,
-    };
+      trackId: i,
+      rating: 3,
+    }));
     //Act
-    const result = await service.upsert(dto);
+    await service.upsertMany(ratings);
     //Assert
-    expect(existing.rating).toBe(5);
-    expect(mockRepository.save).toHaveBeenCalledWith(existing);
-    expect(result).toEqual(mockRating);
+    expect(mockQueryBuilder.execute).toHaveBeenCalledTimes(3);
+    expect(mockQueryBuilder.values.mock.calls.map(([rows]) => rows.length)).toEqual([
+      RATINGS_BATCH_CHUNK,
+      RATINGS_BATCH_CHUNK,
+      1,
+    ]);
   });
 
   it('should return all ratings', async () => {
@@ -96,25 +137,47 @@ describe('RatingsService', () => {
     expect(result).toEqual([mockRating]);
   });
 
-  it('should return average rating for a track', async () => {
+  it('should return average rating for a track from its aggregate', async () => {
     //Arrange
-    mockRepository.find.mockResolvedValue([
-      { userId: 'u1', trackId: 42, rating: 4 },
-      { userId: 'u2', trackId: 42, rating: 5 },
-      { userId: 'u3', trackId: 42, rating: 3 },
-    ]);
+    mockAggregatesRepository.findOne.mockResolvedValue({ trackId: 42, ratingCount: 3, ratingSum: 12 });
     //Act
     const result = await service.getAverageRating(42);
     //Assert
+    expect(mockAggregatesRepository.findOne).toHaveBeenCalledWith({ where: { trackId: 42 } });
+    expect(mockRepository.find).not.toHaveBeenCalledWith({ where: { trackId: 42 } });
     expect(result).toBeCloseTo(4);
   });
 
   it('should return 0 if no ratings found for track', async () => {
     //Arrange
-    mockRepository.find.mockResolvedValue([]);
+    mockAggregatesRepository.findOne.mockResolvedValue(null);
     //Act
     const result = await service.getAverageRating(999);
     //Assert
     expect(result).toBe(0);
   });
+
+  it('should return averages for many tracks in the requested order', async () => {
+    //Arrange
+    mockAggregatesRepository.find.mockResolvedValue([
+      { trackId: 43, ratingCount: 2, ratingSum: 9 },
+      { trackId: 42, ratingCount: 1, ratingSum: 3 },
+    ]);
+    //Act
+    const result = await service.getAverageRatings([42, 43, 44]);
+    //Assert
+    expect(mockAggregatesRepository.find).toHaveBeenCalledTimes(1);
+    expect(result).toEqual([
+      { trackId: 42, average: 3, count: 1 },
+      { trackId: 43, average: 4.5, count: 2 },
+      { trackId: 44, average: 0, count: 0 },
+    ]);
+  });
+
+  it('should delete a rating by userId and trackId', async () => {
+    //Act
+    await service.remove('user123', 42);
+    //Assert
+    expect(mockRepository.delete).toHaveBeenCalledWith({ userId: 'user123', trackId: 42 });
+  });
 });
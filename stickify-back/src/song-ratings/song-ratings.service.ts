@@ -1,32 +1,69 @@
 // src/song-ratings/song-ratings.service.ts
 import { Injectable } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Repository } from 'typeorm';
+import { In, Repository } from 'typeorm';
 import { SongRating } from './entities/song-rating.entity';
+import { SongRatingAggregate } from './entities/song-rating-aggregate.entity';
 import { CreateRatingDto } from './dto/create-song-rating.dto';
+import { TrackAverageDto } from './dto/track-average.dto';
+import { RatingsBatchResultDto } from './dto/ratings-batch.dto';
+
+export const RATINGS_BATCH_CHUNK = 1000;
 
 @Injectable()
 export class RatingsService {
   constructor(
     @InjectRepository(SongRating)
     private readonly ratingsRepository: Repository<SongRating>,
+    @InjectRepository(SongRatingAggregate)
+    private readonly aggregatesRepository: Repository<SongRatingAggregate>,
   ) {}
 
+  // Una sola sentencia INSERT ... ON CONFLICT sobre la clave (userId, trackId):
+  // sin lectura previa, y dos calificaciones simultáneas del mismo usuario no chocan.
+  // El agregado de la canción lo actualiza el trigger de song_ratings en la misma sentencia.
   async upsert(createRatingDto: CreateRatingDto): Promise<SongRating> {
-    const existing = await this.ratingsRepository.findOne({
-      where: {
+    const result = await this.ratingsRepository
+      .createQueryBuilder()
+      .insert()
+      .into(SongRating)
+      .values({
         userId: createRatingDto.userId,
         trackId: createRatingDto.trackId,
-      },
-    });
+        rating: createRatingDto.rating,
+      })
+      .orUpdate(['rating'], ['userId', 'trackId'])
+      .returning(['userId', 'trackId', 'rating'])
+      .execute();
+    return result.raw[0];
+  }
 
-    if (existing) {
-      existing.rating = createRatingDto.rating;
-      return this.ratingsRepository.save(existing);
+  // Miles de calificaciones por petición, en INSERTs de RATINGS_BATCH_CHUNK filas
+  // (cada fila usa 3 de los 65535 parámetros que admite una sentencia) dentro de
+  // una transacción: o entran todas o ninguna.
+  async upsertMany(ratings: CreateRatingDto[]): Promise<RatingsBatchResultDto> {
+    // Un INSERT ... ON CONFLICT no puede tocar dos veces la misma fila: gana la última
+    const unique = new Map<string, CreateRatingDto>();
+    for (const rating of ratings) {
+      unique.set(JSON.stringify([rating.userId, rating.trackId]), rating);
     }
+    // Mismo orden en todos los lotes para que dos lotes simultáneos no se bloqueen en cruz
+    const rows = [...unique.values()]
+      .map(({ userId, trackId, rating }) => ({ userId, trackId, rating }))
+      .sort((a, b) => a.trackId - b.trackId || (a.userId < b.userId ? -1 : a.userId > b.userId ? 1 : 0));
 
-    const newRating = this.ratingsRepository.create(createRatingDto);
-    return this.ratingsRepository.save(newRating);
+    await this.ratingsRepository.manager.transaction(async (manager) => {
+      for (let start = 0; start < rows.length; start += RATINGS_BATCH_CHUNK) {
+        await manager
+          .createQueryBuilder()
+          .insert()
+          .into(SongRating)
+          .values(rows.slice(start, start + RATINGS_BATCH_CHUNK))
+          .orUpdate(['rating'], ['userId', 'trackId'])
+          .execute();
+      }
+    });
+    return { received: ratings.length, upserted: rows.length };
   }
 
   async findAll(): Promise<SongRating[]> {
@@ -43,9 +80,26 @@ export class RatingsService {
   }
 
   async getAverageRating(trackId: number): Promise<number> {
-    const ratings = await this.findByTrackId(trackId);
-    if (!ratings.length) return 0;
-    const total = ratings.reduce((sum, r) => sum + r.rating, 0);
-    return total / ratings.length;
+    const aggregate = await this.aggregatesRepository.findOne({ where: { trackId } });
+    return averageOf(aggregate);
+  }
+
+  // Promedios de varias canciones con una sola consulta, en el orden pedido
+  async getAverageRatings(trackIds: number[]): Promise<TrackAverageDto[]> {
+    if (!trackIds.length) return [];
+    const aggregates = await this.aggregatesRepository.find({ where: { trackId: In(trackIds) } });
+    const byTrack = new Map(aggregates.map((aggregate) => [aggregate.trackId, aggregate]));
+    return trackIds.map((trackId) => {
+      const aggregate = byTrack.get(trackId);
+      return { trackId, average: averageOf(aggregate), count: aggregate?.ratingCount ?? 0 };
+    });
   }
-}
\ No newline at end of file
+
+  async remove(userId: string, trackId: number): Promise<void> {
+    await this.ratingsRepository.delete({ userId, trackId });
+  }
+}
+
+function averageOf(aggregate?: SongRatingAggregate | null): number {
+  return aggregate && aggregate.ratingCount > 0 ? aggregate.ratingSum / aggregate.ratingCount : 0;
+}
@@ -0,0 +1,64 @@
+import { BadRequestException } from '@nestjs/common';
+import { Song } from '../entities/song.entity';
+
+export const DEFAULT_PAGE_SIZE = 50;
+export const MAX_PAGE_SIZE = 200;
+
+// Parámetros que activan la respuesta paginada de GET /songs
+export const PAGE_QUERY_PARAMS = ['limit', 'cursor', 'q', 'artist', 'genre', 'year', 'ids'];
+
+export class FindSongsDto {
+  limit: number;
+  cursor?: string;
+  q?: string; // título o artista, sin distinguir mayúsculas
+  artists: string[];
+  genres: string[];
+  year?: string;
+  trackIds: number[]; // ?ids=1,2,3: canciones concretas (playlists, valoraciones, perfil)
+  isUserUpload?: boolean;
+
+  // ?artist=A&artist=B llega como arreglo; ?artist=A como texto
+  static fromQuery(query: Record<string, any>): FindSongsDto {
+    const dto = new FindSongsDto();
+    const limit = query.limit === undefined ? DEFAULT_PAGE_SIZE : Number(query.limit);
+    if (!Number.isInteger(limit) || limit < 1) {
+      throw new BadRequestException('limit debe ser un entero positivo');
+    }
+    dto.limit = Math.min(limit, MAX_PAGE_SIZE);
+    if (query.year !== undefined && !/^\d{4}$/.test(query.year)) {
+      throw new BadRequestException('year debe tener cuatro dígitos');
+    }
+    dto.year = query.year;
+    dto.cursor = query.cursor || undefined;
+    dto.q = query.q?.trim() || undefined;
+    dto.artists = toList(query.artist);
+    dto.genres = toList(query.genre);
+    dto.trackIds = toList(query.ids).flatMap((ids) => ids.split(',')).filter((id) => id !== '').map(Number);
+    if (dto.trackIds.some((id) => !Number.isInteger(id))) {
+      throw new BadRequestException('ids debe ser una lista de enteros separados por comas');
+    }
+    if (dto.trackIds.length > MAX_PAGE_SIZE) {
+      throw new BadRequestException(`ids admite como máximo ${MAX_PAGE_SIZE} canciones`);
+    }
+    if (query.isUserUpload !== undefined) {
+      dto.isUserUpload = query.isUserUpload === 'true';
+    }
+    return dto;
+  }
+}
+
+export interface SongsPage {
+  items: Song[];
+  nextCursor: string | null; // null en la última página
+}
+
+// GET /songs/facets: opciones de los filtros del menú sin descargar el catálogo
+export interface SongFacets {
+  genres: string[];
+  artists: string[];
+}
+
+function toList(value: string | string[] | undefined): string[] {
+  if (value === undefined) return [];
+  return (Array.isArray(value) ? value : [value]).filter((item) => item !== '');
+}
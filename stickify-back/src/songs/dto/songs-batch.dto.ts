@@ -0,0 +1,30 @@
+import { Song } from '../entities/song.entity';
+
+// Canciones por INSERT: 10 columnas por fila, lejos del tope de 65535 parámetros de Postgres
+export const SONGS_BATCH_CHUNK = 500;
+
+export interface SongsChunkSummary {
+  chunk: number; // posición del bloque, desde 0
+  received: number;
+  inserted: number;
+  skipped: number; // el trackId ya existía
+  error?: string; // el bloque entero falló y no se guardó
+}
+
+export interface SongsBatchSummary {
+  received: number;
+  inserted: number;
+  skipped: number;
+  failed: number; // canciones de bloques que fallaron
+  invalid: number; // líneas NDJSON que no son JSON (solo en POST /songs/import)
+  chunks: SongsChunkSummary[];
+}
+
+export interface SongsBatchResult {
+  songs: Song[]; // las nuevas y las que ya existían, en el orden pedido
+  summary: SongsBatchSummary;
+}
+
+export function emptyBatchSummary(): SongsBatchSummary {
+  return { received: 0, inserted: 0, skipped: 0, failed: 0, invalid: 0, chunks: [] };
+}
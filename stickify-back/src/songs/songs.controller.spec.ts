@@ -3,7 +3,8 @@ import { SongsController } from './songs.controller';
 import { SongsService } from './songs.service';
 import { CreateSongDto } from './dto/create-song.dto';
 import { UpdateSongDto } from './dto/update-song.dto';
-import { ConflictException, InternalServerErrorException } from '@nestjs/common';
+import { BadRequestException, ConflictException, InternalServerErrorException, UnsupportedMediaTypeException } from '@nestjs/common';
+import { Readable } from 'stream';
 
 //Mock de canciones
 const mockSong1 = {
@@ -58,8 +59,11 @@ describe('SongsController', () => {
           useValue: {
             create: jest.fn(),
             findAll: jest.fn(),
+            findPage: jest.fn(),
+            findFacets: jest.fn(),
             findOne: jest.fn(),
             createBatch: jest.fn(),
+            importNdjson: jest.fn(),
             update: jest.fn(),
             remove: jest.fn(),
           },
@@ -122,6 +126,39 @@ describe('SongsController', () => {
       //Assert
       await expect(controller.findAll()).rejects.toBeInstanceOf(InternalServerErrorException);
     });
+    it('should return a page when limit or a filter is given', async () => {
+      //Act
+      const page = { items: [mockSong2], nextCursor: 'abc' };
+      service.findPage.mockResolvedValue(page as any);
+      //Assert
+      expect(await controller.findAll(undefined, { limit: '1', genre: 'Rock' })).toEqual(page);
+      expect(service.findPage).toHaveBeenCalledWith(
+        expect.objectContaining({ limit: 1, genres: ['Rock'], artists: [] }),
+      );
+      expect(service.findAll).not.toHaveBeenCalled();
+    });
+    it('should reject invalid paging parameters with BadRequestException', async () => {
+      await expect(controller.findAll(undefined, { limit: '0' })).rejects.toBeInstanceOf(BadRequestException);
+      await expect(controller.findAll(undefined, { year: '20' })).rejects.toBeInstanceOf(BadRequestException);
+      await expect(controller.findAll(undefined, { ids: '1,x' })).rejects.toBeInstanceOf(BadRequestException);
+    });
+    it('should return the songs of the given ids as a page', async () => {
+      //Act
+      service.findPage.mockResolvedValue({ items: [mockSong1, mockSong3], nextCursor: null } as any);
+      await controller.findAll(undefined, { ids: '1,3' });
+      //Assert
+      expect(service.findPage).toHaveBeenCalledWith(expect.objectContaining({ trackIds: [1, 3] }));
+    });
+  });
+
+  describe('findFacets', () => {
+    it('should return the genres and artists of the catalogue', async () => {
+      //Act
+      const facets = { genres: ['Pop'], artists: ['Artist 1'] };
+      service.findFacets.mockResolvedValue(facets);
+      //Assert
+      expect(await controller.findFacets()).toEqual(facets);
+    });
   });
 
   describe('findOne', () => {
@@ -145,13 +182,15 @@ describe('SongsController', () => {
         [mockSong1, mockSong2, mockSong3],
       ]) {
         //Act
-        service.createBatch.mockResolvedValueOnce(arr);
+        const summary = { received: arr.length, inserted: arr.length, skipped: 0, failed: 0, invalid: 0, chunks: [] };
+        service.createBatch.mockResolvedValueOnce({ songs: arr, summary });
         const body = { songs: arr };
         //Assert
         expect(await controller.createBatch(body)).toEqual({
           success: true,
           message: 'Songs batch processed successfully',
           data: arr,
+          summary,
         });
       }
     });
@@ -167,6 +206,30 @@ describe('SongsController', () => {
     });
   });
 
+  describe('importSongs', () => {
+    it('should pass the NDJSON body to the service line by line', async () => {
+      //Arrange un request que es un stream con dos canciones
+      const req: any = Object.assign(Readable.from([`${JSON.stringify(mockSong1)}\n${JSON.stringify(mockSong2)}\n`]), {
+        is: jest.fn().mockReturnValue('application/x-ndjson'),
+      });
+      const lines: string[] = [];
+      service.importNdjson.mockImplementation(async (input) => {
+        for await (const line of input) lines.push(line);
+        return { received: 2, inserted: 2, skipped: 0, failed: 0, invalid: 0, chunks: [] };
+      });
+      //Act
+      const summary = await controller.importSongs(req);
+      //Assert
+      expect(lines).toEqual([JSON.stringify(mockSong1), JSON.stringify(mockSong2)]);
+      expect(summary.inserted).toBe(2);
+    });
+    it('should reject a body that is not NDJSON', async () => {
+      const req: any = { is: jest.fn().mockReturnValue(false) };
+      await expect(controller.importSongs(req)).rejects.toBeInstanceOf(UnsupportedMediaTypeException);
+      expect(service.importNdjson).not.toHaveBeenCalled();
+    });
+  });
+
   describe('update', () => {
     it('should update a song (3 times)', async () => {
       //Arrange para probar los 3 mocks
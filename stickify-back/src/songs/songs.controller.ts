@@ -1,8 +1,12 @@
-import { Controller, Get, Post, Body, Param, Put, Delete, Query, InternalServerErrorException, ConflictException } from '@nestjs/common';
+import { Controller, Get, Post, Body, Param, Put, Delete, Query, Req, InternalServerErrorException, ConflictException, BadRequestException, UnsupportedMediaTypeException } from '@nestjs/common';
+import { Request } from 'express';
+import { createInterface } from 'readline';
 import { SongsService } from './songs.service';
 import { CreateSongDto } from './dto/create-song.dto';
 import { UpdateSongDto } from './dto/update-song.dto';
 import { Song } from './entities/song.entity';
+import { FindSongsDto, PAGE_QUERY_PARAMS, SongFacets, SongsPage } from './dto/find-songs.dto';
+import { SongsBatchSummary } from './dto/songs-batch.dto';
 
 @Controller('songs')
 export class SongsController {
@@ -22,17 +26,34 @@ export class SongsController {
     }
   }
 
+  // Sin limit/cursor/filtros devuelve todo el catálogo (como antes); con alguno de ellos,
+  // una página { items, nextCursor }: GET /songs?limit=50&q=love&genre=Pop&year=2020
   @Get()
-  async findAll(@Query('isUserUpload') isUserUpload?: string): Promise<Song[]> {
+  async findAll(
+    @Query('isUserUpload') isUserUpload?: string,
+    @Query() query: Record<string, any> = {},
+  ): Promise<Song[] | SongsPage> {
     try {
+      if (PAGE_QUERY_PARAMS.some((param) => query[param] !== undefined)) {
+        return await this.songsService.findPage(FindSongsDto.fromQuery(query));
+      }
       const filter = isUserUpload ? { isUserUpload: isUserUpload === 'true' } : {};
       return await this.songsService.findAll(filter); // Now sorting is handled internally
     } catch (error) {
+      if (error instanceof BadRequestException) {
+        throw error;
+      }
       console.error('Error fetching songs:', error);
       throw new InternalServerErrorException('Failed to fetch songs');
     }
   }
   
+  // Antes de ':trackId' para que "facets" no se tome como un id
+  @Get('facets')
+  findFacets(): Promise<SongFacets> {
+    return this.songsService.findFacets();
+  }
+
   @Get(':trackId')
   findOne(@Param('trackId') trackId: number): Promise<Song | null> {
     return this.songsService.findOne(+trackId);
@@ -45,7 +66,8 @@ export class SongsController {
       return {
         success: true,
         message: 'Songs batch processed successfully',
-        data: result
+        data: result.songs,
+        summary: result.summary, // inserted / skipped / failed por bloque
       };
     } catch (error) {
       return {
@@ -56,6 +78,17 @@ export class SongsController {
     }
   }
 
+  // POST /api/songs/import con Content-Type: application/x-ndjson, una canción por línea.
+  // Express no parsea ese tipo, así que el cuerpo se lee como stream a medida que llega
+  // y no choca con el límite de tamaño del body JSON.
+  @Post('import')
+  async importSongs(@Req() req: Request): Promise<SongsBatchSummary> {
+    if (!req.is('application/x-ndjson')) {
+      throw new UnsupportedMediaTypeException('Se esperaba Content-Type: application/x-ndjson');
+    }
+    return this.songsService.importNdjson(createInterface({ input: req, crlfDelay: Infinity }));
+  }
+
   @Put(':trackId')
   update(
     @Param('trackId') trackId: number,
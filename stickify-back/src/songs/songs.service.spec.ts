@@ -1,5 +1,8 @@
 import { Test, TestingModule } from '@nestjs/testing';
-import { SongsService } from './songs.service';
+import { SongsService, decodeCursor, encodeCursor } from './songs.service';
+import { BadRequestException } from '@nestjs/common';
+import { FindSongsDto } from './dto/find-songs.dto';
+import { SONGS_BATCH_CHUNK } from './dto/songs-batch.dto';
 import { getRepositoryToken } from '@nestjs/typeorm';
 import { Song } from './entities/song.entity';
 import { Repository } from 'typeorm';
@@ -61,6 +64,7 @@ describe('SongsService', () => {
             find: jest.fn(),
             update: jest.fn(),
             delete: jest.fn(),
+            createQueryBuilder: jest.fn(),
           },
         },
       ],
@@ -104,32 +108,76 @@ describe('SongsService', () => {
   });
 
   describe('createBatch', () => {
-    it('should create all songs in batch', async () => {
-      //Arrange simula que create funcione para todas las canciones
-      jest.spyOn(service, 'create').mockImplementation(song => Promise.resolve(song));
+    //Mock encadenable del INSERT ... ON CONFLICT DO NOTHING RETURNING
+    let qb: any;
+    beforeEach(() => {
+      qb = {
+        insert: jest.fn().mockReturnThis(),
+        into: jest.fn().mockReturnThis(),
+        values: jest.fn().mockReturnThis(),
+        orIgnore: jest.fn().mockReturnThis(),
+        returning: jest.fn().mockReturnThis(),
+        execute: jest.fn(),
+      };
+      repo.createQueryBuilder.mockReturnValue(qb);
+    });
+
+    it('should insert the batch in one statement and return new and existing songs', async () => {
+      //Arrange la canción 2 ya existía
+      qb.execute.mockResolvedValue({ raw: [mockSong1, mockSong3] });
+      repo.find.mockResolvedValue([mockSong2]);
       //Act
       const result = await service.createBatch([mockSong1, mockSong2, mockSong3]);
       //Assert
-      expect(result).toEqual([mockSong1, mockSong2, mockSong3]);
-    });
-    it('should handle partial failures in batch', async () => {
-      //Arrange simula que create falle para la segunda canción
-      jest.spyOn(service, 'create')
-        .mockResolvedValueOnce(mockSong1)
-        .mockRejectedValueOnce(new Error('fail'))
-        .mockResolvedValueOnce(mockSong3);
+      expect(qb.execute).toHaveBeenCalledTimes(1);
+      expect(qb.orIgnore).toHaveBeenCalled();
+      expect(repo.save).not.toHaveBeenCalled();
+      expect(repo.find).toHaveBeenCalledTimes(1);
+      expect(result.songs).toEqual([mockSong1, mockSong2, mockSong3]);
+      expect(result.summary).toMatchObject({ received: 3, inserted: 2, skipped: 1, failed: 0 });
+    });
+    it('should split a large batch into chunks', async () => {
+      //Arrange
+      const songs = Array.from({ length: SONGS_BATCH_CHUNK * 2 + 1 }, (_, i) => ({ ...mockSong1, trackId: i }));
+      qb.execute.mockImplementation(async () => ({ raw: qb.values.mock.calls[qb.values.mock.calls.length - 1][0] }));
       //Act
-      const result = await service.createBatch([mockSong1, mockSong2, mockSong3]);
+      const result = await service.createBatch(songs);
       //Assert
-      expect(result).toEqual([mockSong1, mockSong3]);
+      expect(qb.execute).toHaveBeenCalledTimes(3);
+      expect(result.summary.chunks.map((chunk) => chunk.received)).toEqual([SONGS_BATCH_CHUNK, SONGS_BATCH_CHUNK, 1]);
+      expect(result.songs).toHaveLength(songs.length);
+      expect(repo.find).not.toHaveBeenCalled();
     });
-    it('should return empty array if all fail', async () => {
-      //Arrange simula que create falle para todas las canciones
-      jest.spyOn(service, 'create').mockRejectedValue(new Error('fail'));
+    it('should report a failed chunk and leave its songs out', async () => {
+      //Arrange
+      qb.execute.mockRejectedValue(new Error('fail'));
       //Act
       const result = await service.createBatch([mockSong1, mockSong2, mockSong3]);
       //Assert
-      expect(result).toEqual([]);
+      expect(result.songs).toEqual([]);
+      expect(result.summary.failed).toBe(3);
+      expect(result.summary.chunks[0].error).toBe('fail');
+    });
+  });
+
+  describe('importNdjson', () => {
+    it('should insert the valid lines and count the invalid ones', async () => {
+      //Arrange
+      const qb: any = {
+        insert: jest.fn().mockReturnThis(),
+        into: jest.fn().mockReturnThis(),
+        values: jest.fn().mockReturnThis(),
+        orIgnore: jest.fn().mockReturnThis(),
+        returning: jest.fn().mockReturnThis(),
+        execute: jest.fn().mockResolvedValue({ raw: [mockSong1] }),
+      };
+      repo.createQueryBuilder.mockReturnValue(qb);
+      const lines = [JSON.stringify(mockSong1), '', '{no es json', JSON.stringify(mockSong2)];
+      //Act
+      const summary = await service.importNdjson(lines);
+      //Assert
+      expect(qb.values).toHaveBeenCalledWith([mockSong1, mockSong2]);
+      expect(summary).toMatchObject({ received: 2, inserted: 1, skipped: 1, invalid: 1 });
     });
   });
 
@@ -148,6 +196,102 @@ describe('SongsService', () => {
     });
   });
 
+  describe('findPage', () => {
+    //Mock encadenable del QueryBuilder
+    let qb: any;
+    beforeEach(() => {
+      qb = {
+        orderBy: jest.fn().mockReturnThis(),
+        addOrderBy: jest.fn().mockReturnThis(),
+        limit: jest.fn().mockReturnThis(),
+        andWhere: jest.fn().mockReturnThis(),
+        getMany: jest.fn(),
+      };
+      repo.createQueryBuilder.mockReturnValue(qb);
+    });
+
+    it('should return one page and a cursor when there are more songs', async () => {
+      //Arrange se piden 2 y el repositorio devuelve 3 (limit + 1)
+      qb.getMany.mockResolvedValue([mockSong2, mockSong3, mockSong1]);
+      //Act
+      const page = await service.findPage(FindSongsDto.fromQuery({ limit: '2' }));
+      //Assert
+      expect(qb.limit).toHaveBeenCalledWith(3);
+      expect(page.items).toEqual([mockSong2, mockSong3]);
+      expect(decodeCursor(page.nextCursor as string)).toEqual([false, 3]);
+    });
+
+    it('should return a null cursor on the last page', async () => {
+      qb.getMany.mockResolvedValue([mockSong1]);
+      const page = await service.findPage(FindSongsDto.fromQuery({ limit: '2' }));
+      expect(page).toEqual({ items: [mockSong1], nextCursor: null });
+    });
+
+    it('should continue after the cursor and apply the filters', async () => {
+      qb.getMany.mockResolvedValue([]);
+      //Act
+      await service.findPage(
+        FindSongsDto.fromQuery({
+          cursor: encodeCursor(mockSong2),
+          q: '50%',
+          artist: ['Artist 1', 'Artist 3'],
+          genre: 'Pop',
+          year: '2020',
+        }),
+      );
+      //Assert
+      expect(qb.andWhere).toHaveBeenCalledWith('(song.trackName ILIKE :q OR song.artistName ILIKE :q)', { q: '%50\\%%' });
+      expect(qb.andWhere).toHaveBeenCalledWith('song.artistName IN (:...artists)', { artists: ['Artist 1', 'Artist 3'] });
+      expect(qb.andWhere).toHaveBeenCalledWith('song.primaryGenreName IN (:...genres)', { genres: ['Pop'] });
+      expect(qb.andWhere).toHaveBeenCalledWith('LEFT(song.releaseDate, 4) = :year', { year: '2020' });
+      expect(qb.andWhere).toHaveBeenCalledWith(
+        '(song.isUserUpload, song.trackId) < (:cursorUpload, :cursorTrackId)',
+        { cursorUpload: true, cursorTrackId: 2 },
+      );
+    });
+
+    it('should reject an invalid cursor', async () => {
+      await expect(service.findPage(FindSongsDto.fromQuery({ cursor: 'no-es-un-cursor' }))).rejects.toBeInstanceOf(
+        BadRequestException,
+      );
+    });
+
+    it('should look up the songs of a list of trackIds', async () => {
+      qb.getMany.mockResolvedValue([mockSong1, mockSong3]);
+      //Act
+      const page = await service.findPage(FindSongsDto.fromQuery({ ids: '1,3', limit: '2' }));
+      //Assert
+      expect(qb.andWhere).toHaveBeenCalledWith('song.trackId IN (:...trackIds)', { trackIds: [1, 3] });
+      expect(page.items).toEqual([mockSong1, mockSong3]);
+    });
+
+    it('should reject ids that are not integers', () => {
+      expect(() => FindSongsDto.fromQuery({ ids: '1,abc' })).toThrow(BadRequestException);
+    });
+  });
+
+  describe('findFacets', () => {
+    it('should return the distinct genres and artists', async () => {
+      //Arrange un QueryBuilder por columna
+      const queryBuilder = (values: string[]) => ({
+        select: jest.fn().mockReturnThis(),
+        distinct: jest.fn().mockReturnThis(),
+        where: jest.fn().mockReturnThis(),
+        orderBy: jest.fn().mockReturnThis(),
+        getRawMany: jest.fn().mockResolvedValue(values.map((value) => ({ value }))),
+      });
+      const genresQb = queryBuilder(['Pop', 'Rock']);
+      const artistsQb = queryBuilder(['Artist 1', 'Artist 2']);
+      repo.createQueryBuilder.mockReturnValueOnce(genresQb as any).mockReturnValueOnce(artistsQb as any);
+      //Act
+      const facets = await service.findFacets();
+      //Assert
+      expect(genresQb.select).toHaveBeenCalledWith('song.primaryGenreName', 'value');
+      expect(artistsQb.select).toHaveBeenCalledWith('song.artistName', 'value');
+      expect(facets).toEqual({ genres: ['Pop', 'Rock'], artists: ['Artist 1', 'Artist 2'] });
+    });
+  });
+
   describe('findOne', () => {
     it('should return a song by trackId (3 times)', async () => {
       //Arrange para probar los 3 mocks
@@ -1,8 +1,37 @@
-import { Injectable } from '@nestjs/common';
+import { BadRequestException, Injectable } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Repository } from 'typeorm';
+import { In, Repository } from 'typeorm';
 import { Song } from './entities/song.entity';
 import { CreateSongDto } from './dto/create-song.dto'; // Import your DTO
+import { FindSongsDto, SongFacets, SongsPage } from './dto/find-songs.dto';
+import {
+  SONGS_BATCH_CHUNK,
+  SongsBatchResult,
+  SongsBatchSummary,
+  SongsChunkSummary,
+  emptyBatchSummary,
+} from './dto/songs-batch.dto';
+
+// El cursor es la clave de orden de la última canción de la página: (isUserUpload, trackId)
+export function encodeCursor(song: Song): string {
+  return Buffer.from(JSON.stringify([song.isUserUpload, song.trackId])).toString('base64url');
+}
+
+export function decodeCursor(cursor: string): [boolean, number] {
+  try {
+    const [isUserUpload, trackId] = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    if (typeof isUserUpload === 'boolean' && Number.isInteger(trackId)) {
+      return [isUserUpload, trackId];
+    }
+  } catch {
+    // se responde igual que a un cursor con otra forma
+  }
+  throw new BadRequestException('Cursor inválido');
+}
+
+function escapeLike(text: string): string {
+  return text.replace(/[\\%_]/g, (char) => `\\${char}`);
+}
 
 @Injectable()
 export class SongsService {
@@ -25,21 +54,81 @@ export class SongsService {
     }
   }
 
-  async createBatch(songs: CreateSongDto[]): Promise<Song[]> { // Accept CreateSongDto[]
-    const creationPromises = songs.map(songDto => this.create(songDto));
-    const results = await Promise.allSettled(creationPromises);
-
-    const createdSongs: Song[] = [];
-    results.forEach(result => {
-      if (result.status === 'fulfilled' && result.value !== null) {
-        createdSongs.push(result.value);
-      } else if (result.status === 'rejected') {
-        console.error('Failed to create a song in batch:', result.reason);
-        // Optionally, you might want to log the specific song that failed
+  // Un INSERT de varias filas por bloque en lugar de un INSERT por canción: un catálogo
+  // grande ya no agota el pool de conexiones. Las que ya existían se buscan con una sola
+  // consulta por bloque para devolverlas igual que antes.
+  async createBatch(songs: CreateSongDto[]): Promise<SongsBatchResult> {
+    const summary = emptyBatchSummary();
+    const stored = new Map<number, Song>();
+    for (let start = 0; start < songs.length; start += SONGS_BATCH_CHUNK) {
+      const chunk = songs.slice(start, start + SONGS_BATCH_CHUNK);
+      const inserted = await this.insertChunk(chunk, summary);
+      if (inserted === null) continue;
+      inserted.forEach((song) => stored.set(song.trackId, song));
+      const existingIds = chunk.map((song) => Number(song.trackId)).filter((trackId) => !stored.has(trackId));
+      if (existingIds.length) {
+        const existing = await this.songsRepository.find({ where: { trackId: In(existingIds) } });
+        existing.forEach((song) => stored.set(song.trackId, song));
       }
-    });
+    }
+    const trackIds = new Set(songs.map((song) => Number(song.trackId)));
+    return {
+      songs: [...trackIds].filter((trackId) => stored.has(trackId)).map((trackId) => stored.get(trackId) as Song),
+      summary,
+    };
+  }
 
-    return createdSongs;
+  // Importación de catálogos grandes: una canción JSON por línea, insertada por bloques
+  // a medida que se lee, sin guardar el catálogo entero en memoria ni devolverlo.
+  async importNdjson(lines: AsyncIterable<string> | Iterable<string>): Promise<SongsBatchSummary> {
+    const summary = emptyBatchSummary();
+    let chunk: CreateSongDto[] = [];
+    for await (const line of lines) {
+      if (!line.trim()) continue;
+      try {
+        chunk.push(JSON.parse(line));
+      } catch {
+        summary.invalid++;
+        continue;
+      }
+      if (chunk.length === SONGS_BATCH_CHUNK) {
+        await this.insertChunk(chunk, summary);
+        chunk = [];
+      }
+    }
+    if (chunk.length) {
+      await this.insertChunk(chunk, summary);
+    }
+    return summary;
+  }
+
+  // INSERT ... ON CONFLICT DO NOTHING RETURNING *: trackId es la única clave única de songs,
+  // así que solo se saltan las repetidas. Devuelve las insertadas, o null si el bloque falló.
+  private async insertChunk(chunk: CreateSongDto[], summary: SongsBatchSummary): Promise<Song[] | null> {
+    const report: SongsChunkSummary = { chunk: summary.chunks.length, received: chunk.length, inserted: 0, skipped: 0 };
+    summary.chunks.push(report);
+    summary.received += chunk.length;
+    try {
+      const result = await this.songsRepository
+        .createQueryBuilder()
+        .insert()
+        .into(Song)
+        .values(chunk)
+        .orIgnore()
+        .returning('*')
+        .execute();
+      const inserted: Song[] = result.raw;
+      report.inserted = inserted.length;
+      report.skipped = chunk.length - inserted.length;
+      summary.inserted += report.inserted;
+      summary.skipped += report.skipped;
+      return inserted;
+    } catch (error: any) {
+      console.error(`Failed to insert songs chunk ${report.chunk}:`, error);
+      report.error = error.message;
+      summary.failed += chunk.length;
+      return null;
+    }
   }
 
   findAll(filter: any = {}): Promise<Song[]> {
@@ -52,6 +141,70 @@ export class SongsService {
     });
   }
 
+  // Paginación por clave (keyset): cada página sigue donde terminó la anterior,
+  // sin OFFSET, así que cuesta lo mismo la primera que la página 100.
+  // Los filtros usan los índices de la migración SongsSearchIndexes.
+  async findPage(query: FindSongsDto): Promise<SongsPage> {
+    const qb = this.songsRepository
+      .createQueryBuilder('song')
+      .orderBy('song.isUserUpload', 'DESC')
+      .addOrderBy('song.trackId', 'DESC')
+      .limit(query.limit + 1);
+
+    if (query.isUserUpload !== undefined) {
+      qb.andWhere('song.isUserUpload = :isUserUpload', { isUserUpload: query.isUserUpload });
+    }
+    if (query.q) {
+      qb.andWhere('(song.trackName ILIKE :q OR song.artistName ILIKE :q)', { q: `%${escapeLike(query.q)}%` });
+    }
+    if (query.artists.length) {
+      qb.andWhere('song.artistName IN (:...artists)', { artists: query.artists });
+    }
+    if (query.genres.length) {
+      qb.andWhere('song.primaryGenreName IN (:...genres)', { genres: query.genres });
+    }
+    if (query.year) {
+      qb.andWhere('LEFT(song.releaseDate, 4) = :year', { year: query.year });
+    }
+    if (query.trackIds.length) {
+      qb.andWhere('song.trackId IN (:...trackIds)', { trackIds: query.trackIds });
+    }
+    if (query.cursor) {
+      const [isUserUpload, trackId] = decodeCursor(query.cursor);
+      qb.andWhere('(song.isUserUpload, song.trackId) < (:cursorUpload, :cursorTrackId)', {
+        cursorUpload: isUserUpload,
+        cursorTrackId: trackId,
+      });
+    }
+
+    const songs = await qb.getMany();
+    const items = songs.slice(0, query.limit);
+    return {
+      items,
+      nextCursor: songs.length > query.limit ? encodeCursor(items[items.length - 1]) : null,
+    };
+  }
+
+  // Géneros y artistas distintos del catálogo, en orden alfabético
+  async findFacets(): Promise<SongFacets> {
+    const [genres, artists] = await Promise.all([
+      this.distinctValues('primaryGenreName'),
+      this.distinctValues('artistName'),
+    ]);
+    return { genres, artists };
+  }
+
+  private async distinctValues(column: 'primaryGenreName' | 'artistName'): Promise<string[]> {
+    const rows = await this.songsRepository
+      .createQueryBuilder('song')
+      .select(`song.${column}`, 'value')
+      .distinct(true)
+      .where(`song.${column} IS NOT NULL`)
+      .orderBy('value', 'ASC')
+      .getRawMany<{ value: string }>();
+    return rows.map((row) => row.value);
+  }
+
   findOne(trackId: number): Promise<Song | null> {
     return this.songsRepository.findOne({ where: { trackId } });
   }
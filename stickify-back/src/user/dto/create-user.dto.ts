@@ -3,6 +3,4 @@ export class CreateUserDto {
   password: string;
   email: string;
   premium?: boolean;
-  followers?: string[];
-  following?: string[];
 }
\ No newline at end of file
@@ -0,0 +1,42 @@
+import { BadRequestException } from '@nestjs/common';
+import { User } from '../entities/user.entity';
+
+export const DEFAULT_FOLLOWS_PAGE_SIZE = 50;
+export const MAX_FOLLOWS_PAGE_SIZE = 200;
+
+export class FollowsPageDto {
+  limit: number;
+  cursor?: string;
+
+  static fromQuery(query: Record<string, any>): FollowsPageDto {
+    const dto = new FollowsPageDto();
+    const limit = query.limit === undefined ? DEFAULT_FOLLOWS_PAGE_SIZE : Number(query.limit);
+    if (!Number.isInteger(limit) || limit < 1) {
+      throw new BadRequestException('limit debe ser un entero positivo');
+    }
+    dto.limit = Math.min(limit, MAX_FOLLOWS_PAGE_SIZE);
+    dto.cursor = query.cursor || undefined;
+    return dto;
+  }
+}
+
+export interface FollowListItem {
+  id: string;
+  username: string;
+  email: string;
+  premium: boolean;
+  followersCount: number;
+  followingCount: number;
+  followedAt: string;
+}
+
+export interface FollowsPage {
+  items: FollowListItem[]; // del seguimiento más reciente al más antiguo
+  nextCursor: string | null; // null en la última página
+}
+
+// Respuesta de PUT /users/:id/follow: el usuario (con sus contadores) y el estado de la arista
+export interface FollowToggleResult extends Pick<User, 'id' | 'username' | 'email' | 'premium' | 'followersCount' | 'followingCount'> {
+  targetEmail: string;
+  isFollowing: boolean;
+}
@@ -3,6 +3,4 @@ export class UpdateUserDto {
   password?: string;
   email?: string;
   premium?: boolean;
-  followers?: string[];
-  following?: string[];
 }
\ No newline at end of file
@@ -0,0 +1,18 @@
+import { Entity, PrimaryColumn, CreateDateColumn, Index, Check } from 'typeorm';
+
+// Una arista del grafo de seguidores: followerId sigue a followeeId.
+// La clave primaria (followerId, followeeId) resuelve "¿lo sigue?" y hace idempotente seguir.
+@Entity('user_follows')
+@Check('CHK_user_follows_not_self', '"followerId" <> "followeeId"')
+@Index('IDX_user_follows_follower_created', ['followerId', 'createdAt'])
+@Index('IDX_user_follows_followee_created', ['followeeId', 'createdAt'])
+export class UserFollow {
+  @PrimaryColumn('uuid')
+  followerId: string;
+
+  @PrimaryColumn('uuid')
+  followeeId: string;
+
+  @CreateDateColumn({ type: 'timestamptz' })
+  createdAt: Date;
+}
@@ -17,9 +17,10 @@ export class User {
   @Column({ default: false })
   premium: boolean;
 
-  @Column('text', { array: true, default: [] })
-  followers: string[];
+  // Los mantiene el trigger de user_follows (migración UserFollowsTable)
+  @Column({ default: 0 })
+  followersCount: number;
 
-  @Column('text', { array: true, default: [] })
-  following: string[];
-}
\ No newline at end of file
+  @Column({ default: 0 })
+  followingCount: number;
+}
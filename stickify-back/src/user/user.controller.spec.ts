@@ -4,6 +4,8 @@ import { UsersService } from './user.service';
 import { CreateUserDto } from './dto/create-user.dto';
 import { UpdateUserDto } from './dto/update-user.dto';
 import { User } from './entities/user.entity';
+import { MAX_FOLLOWS_PAGE_SIZE } from './dto/follows-page.dto';
+import { BadRequestException } from '@nestjs/common';
 
 //Mock de usuarios
 const mockUser1: User = {
@@ -12,8 +14,8 @@ const mockUser1: User = {
   email: 'user1@mail.com',
   password: 'pass1',
   premium: false,
-  followers: [],
-  following: [],
+  followersCount: 0,
+  followingCount: 0,
 };
 const mockUser2: User = {
   id: '2',
@@ -21,8 +23,8 @@ const mockUser2: User = {
   email: 'user2@mail.com',
   password: 'pass2',
   premium: true,
-  followers: ['user1@mail.com'],
-  following: [],
+  followersCount: 1,
+  followingCount: 0,
 };
 const mockUser3: User = {
   id: '3',
@@ -30,8 +32,8 @@ const mockUser3: User = {
   email: 'user3@mail.com',
   password: 'pass3',
   premium: false,
-  followers: [],
-  following: ['user1@mail.com'],
+  followersCount: 0,
+  followingCount: 1,
 };
 
 describe('UsersController', () => {
@@ -53,6 +55,9 @@ describe('UsersController', () => {
             findByEmail: jest.fn(),
             remove: jest.fn(),
             toggleFollow: jest.fn(),
+            followers: jest.fn(),
+            following: jest.fn(),
+            isFollowing: jest.fn(),
           },
         },
       ],
@@ -142,12 +147,41 @@ describe('UsersController', () => {
         [mockUser2, mockUser3],
         [mockUser3, mockUser1],
       ]) {
+        //Arrange respuesta con los contadores y el estado de la arista
+        const { password, ...publicUser } = user;
+        const result = { ...publicUser, targetEmail: target.email, isFollowing: true };
         //Act 
-        service.toggleFollow.mockResolvedValueOnce(user);
+        service.toggleFollow.mockResolvedValueOnce(result);
         const body = { targetEmail: target.email, follow: true };
         //Assert
-        expect(await controller.toggleFollow(user.id, body)).toEqual(user);
+        expect(await controller.toggleFollow(user.id, body)).toEqual(result);
       }
     });
   });
+
+  describe('followers / following', () => {
+    it('should return a page of followers with the requested limit', async () => {
+      //Arrange
+      const page = { items: [], nextCursor: null };
+      service.followers.mockResolvedValueOnce(page);
+      //Act
+      const result = await controller.followers(mockUser1.id, { limit: '10' });
+      //Assert
+      expect(result).toEqual(page);
+      expect(service.followers).toHaveBeenCalledWith(mockUser1.id, expect.objectContaining({ limit: 10 }));
+    });
+    it('should cap the page size and pass the cursor of the following list', async () => {
+      service.following.mockResolvedValueOnce({ items: [], nextCursor: null });
+      await controller.following(mockUser1.id, { limit: '5000', cursor: 'abc' });
+      expect(service.following).toHaveBeenCalledWith(mockUser1.id, { limit: MAX_FOLLOWS_PAGE_SIZE, cursor: 'abc' });
+    });
+    it('should reject a limit that is not a positive integer', async () => {
+      await expect(controller.followers(mockUser1.id, { limit: '0' })).rejects.toBeInstanceOf(BadRequestException);
+      expect(service.followers).not.toHaveBeenCalled();
+    });
+    it('should tell whether a user follows another', async () => {
+      service.isFollowing.mockResolvedValueOnce(true);
+      expect(await controller.isFollowing(mockUser3.id, mockUser1.email)).toEqual({ following: true });
+    });
+  });
 });
@@ -1,8 +1,9 @@
-import { Controller, Get, Post, Body, Param, Put, Delete } from '@nestjs/common';
+import { Controller, Get, Post, Body, Param, Put, Delete, Query } from '@nestjs/common';
 import { UsersService } from './user.service';
 import { CreateUserDto } from './dto/create-user.dto';
 import { UpdateUserDto } from './dto/update-user.dto';
 import { User } from './entities/user.entity'; // <--- ADD THIS LINE
+import { FollowsPage, FollowsPageDto } from './dto/follows-page.dto';
 @Controller('users')
 export class UsersController {
   constructor(private readonly usersService: UsersService) {}
@@ -53,4 +54,20 @@ export class UsersController {
   ) {
     return this.usersService.toggleFollow(id, body.targetEmail, body.follow);
   }
+
+  // e.g., /users/:id/followers?limit=50&cursor=... -> { items, nextCursor }
+  @Get(':id/followers')
+  async followers(@Param('id') id: string, @Query() query: Record<string, any> = {}): Promise<FollowsPage> {
+    return this.usersService.followers(id, FollowsPageDto.fromQuery(query));
+  }
+
+  @Get(':id/following')
+  async following(@Param('id') id: string, @Query() query: Record<string, any> = {}): Promise<FollowsPage> {
+    return this.usersService.following(id, FollowsPageDto.fromQuery(query));
+  }
+
+  @Get(':id/following/:email') // e.g., /users/:id/following/john@example.com -> { following: true }
+  async isFollowing(@Param('id') id: string, @Param('email') email: string) {
+    return { following: await this.usersService.isFollowing(id, email) };
+  }
 }
\ No newline at end of file
@@ -4,11 +4,12 @@ import { TypeOrmModule } from '@nestjs/typeorm';
 import { UsersService } from './user.service';
 import { UsersController } from './user.controller';
 import { User } from './entities/user.entity';
+import { UserFollow } from './entities/user-follow.entity';
 import { AuthModule } from '../auth/auth.module';
 
 @Module({
   imports: [
-    TypeOrmModule.forFeature([User]),
+    TypeOrmModule.forFeature([User, UserFollow]),
     forwardRef(() => AuthModule),
   ],
   controllers: [UsersController],
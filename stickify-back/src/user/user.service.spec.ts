@@ -1,5 +1,8 @@
 import { Test, TestingModule } from '@nestjs/testing';
-import { UsersService } from './user.service';
+import { UsersService, decodeFollowCursor, encodeFollowCursor } from './user.service';
+import { BadRequestException } from '@nestjs/common';
+import { UserFollow } from './entities/user-follow.entity';
+import { FollowsPageDto } from './dto/follows-page.dto';
 import { getRepositoryToken } from '@nestjs/typeorm';
 import { JwtService } from '@nestjs/jwt';
 import { User } from './entities/user.entity';
@@ -13,8 +16,8 @@ const mockUser1: User = {
   email: 'user1@mail.com',
   password: 'pass1',
   premium: false,
-  followers: [],
-  following: [],
+  followersCount: 0,
+  followingCount: 0,
 };
 const mockUser2: User = {
   id: '2',
@@ -22,8 +25,8 @@ const mockUser2: User = {
   email: 'user2@mail.com',
   password: 'pass2',
   premium: true,
-  followers: ['user1@mail.com'],
-  following: [],
+  followersCount: 1,
+  followingCount: 0,
 };
 const mockUser3: User = {
   id: '3',
@@ -31,19 +34,45 @@ const mockUser3: User = {
   email: 'user3@mail.com',
   password: 'pass3',
   premium: false,
-  followers: [],
-  following: ['user1@mail.com'],
+  followersCount: 0,
+  followingCount: 1,
 };
 
 describe('UsersService', () => {
   let service: UsersService;
   let repo: jest.Mocked<Repository<User>>;
   let jwt: JwtService;
+  //Mock encadenable del QueryBuilder de user_follows
+  let followsQb: any;
+  let followsRepo: any;
 
   beforeEach(async () => {
+    followsQb = {
+      insert: jest.fn().mockReturnThis(),
+      into: jest.fn().mockReturnThis(),
+      values: jest.fn().mockReturnThis(),
+      orIgnore: jest.fn().mockReturnThis(),
+      execute: jest.fn().mockResolvedValue({ raw: [] }),
+      innerJoin: jest.fn().mockReturnThis(),
+      select: jest.fn().mockReturnThis(),
+      addSelect: jest.fn().mockReturnThis(),
+      where: jest.fn().mockReturnThis(),
+      andWhere: jest.fn().mockReturnThis(),
+      orderBy: jest.fn().mockReturnThis(),
+      addOrderBy: jest.fn().mockReturnThis(),
+      limit: jest.fn().mockReturnThis(),
+      getRawMany: jest.fn().mockResolvedValue([]),
+      getExists: jest.fn(),
+    };
+    followsRepo = {
+      createQueryBuilder: jest.fn().mockReturnValue(followsQb),
+      delete: jest.fn().mockResolvedValue({ affected: 1 }),
+    };
     const module: TestingModule = await Test.createTestingModule({
       providers: [
         UsersService,
+        //Mock del repositorio de aristas de seguimiento
+        { provide: getRepositoryToken(UserFollow), useValue: followsRepo },
         {
           //Mock del repositorio de usuarios TypeORM
           provide: getRepositoryToken(User),
@@ -111,8 +140,13 @@ describe('UsersService', () => {
       for (const user of [mockUser1, mockUser2, mockUser3]) {
         //Act
         repo.findOne.mockResolvedValue(user);
-        //Assert
+        //Assert solo los campos públicos y los contadores, sin leer user_follows
         expect(await service.findOne(user.id)).toEqual(user);
+        expect(repo.findOne).toHaveBeenCalledWith({
+          where: { id: user.id },
+          select: ['id', 'username', 'email', 'premium', 'followersCount', 'followingCount'],
+        });
+        expect(followsRepo.createQueryBuilder).not.toHaveBeenCalled();
       }
     });
   });
@@ -155,34 +189,109 @@ describe('UsersService', () => {
   });
 
   describe('toggleFollow', () => {
-    it('should follow and unfollow users (3 times)', async () => {
-    for (const [origUser, origTarget] of [
-        [mockUser1, mockUser2],
-        [mockUser2, mockUser3],
-        [mockUser3, mockUser1],
-    ]) {
-        //Arrange
-        // Clonar para evitar efectos colaterales
-        const user = { ...origUser, followers: [...origUser.followers], following: [...origUser.following] };
-        const target = { ...origTarget, followers: [...origTarget.followers], following: [...origTarget.following] };
-        // Mockear findOne para devolver user y luego target
-        repo.findOne.mockImplementationOnce(() => Promise.resolve(user))
-                    .mockImplementationOnce(() => Promise.resolve(target));
-        repo.save.mockResolvedValue(user);
-        //Act Follow
-        user.following = [];
-        target.followers = [];
-        //Assert
-        expect(await service.toggleFollow(user.id, target.email, true)).toEqual(user);
-        //Act  Unfollow
-        user.following = [target.email];
-        target.followers = [user.email];
-        // Mockear de nuevo para la segunda llamada
-        repo.findOne.mockImplementationOnce(() => Promise.resolve(user))
-                    .mockImplementationOnce(() => Promise.resolve(target));
-        //Assert
-        expect(await service.toggleFollow(user.id, target.email, false)).toEqual(user);
-    }
+    it('should follow with a single insert that ignores repeated follows', async () => {
+      //Arrange findOne devuelve el usuario, el objetivo y al final el usuario actualizado
+      repo.findOne
+        .mockResolvedValueOnce(mockUser1)
+        .mockResolvedValueOnce(mockUser2)
+        .mockResolvedValueOnce({ ...mockUser1, followingCount: 1 });
+      //Act
+      const result = await service.toggleFollow(mockUser1.id, mockUser2.email, true);
+      //Assert sin reescribir filas de usuarios
+      expect(followsQb.into).toHaveBeenCalledWith(UserFollow);
+      expect(followsQb.values).toHaveBeenCalledWith({ followerId: mockUser1.id, followeeId: mockUser2.id });
+      expect(followsQb.orIgnore).toHaveBeenCalled();
+      expect(repo.save).not.toHaveBeenCalled();
+      //Assert la respuesta lleva los contadores y el estado de la arista, no las listas
+      expect(followsQb.getRawMany).not.toHaveBeenCalled();
+      expect(result).toEqual({ ...mockUser1, followingCount: 1, targetEmail: mockUser2.email, isFollowing: true });
+    });
+    it('should unfollow by deleting the edge', async () => {
+      //Arrange
+      repo.findOne
+        .mockResolvedValueOnce(mockUser3)
+        .mockResolvedValueOnce(mockUser1)
+        .mockResolvedValueOnce({ ...mockUser3, followingCount: 0 });
+      //Act
+      const result = await service.toggleFollow(mockUser3.id, mockUser1.email, false);
+      //Assert
+      expect(result).toMatchObject({ followingCount: 0, targetEmail: mockUser1.email, isFollowing: false });
+      expect(followsRepo.delete).toHaveBeenCalledWith({ followerId: mockUser3.id, followeeId: mockUser1.id });
+      expect(followsQb.insert).not.toHaveBeenCalled();
+    });
+    it('should throw BadRequestException if a user does not exist', async () => {
+      repo.findOne.mockResolvedValueOnce(mockUser1).mockResolvedValueOnce(null);
+      await expect(service.toggleFollow(mockUser1.id, 'nadie@mail.com', true)).rejects.toBeInstanceOf(BadRequestException);
+      expect(followsQb.execute).not.toHaveBeenCalled();
+    });
+    it('should throw BadRequestException when a user tries to follow themselves', async () => {
+      repo.findOne.mockResolvedValueOnce(mockUser1).mockResolvedValueOnce(mockUser1);
+      await expect(service.toggleFollow(mockUser1.id, mockUser1.email, true)).rejects.toBeInstanceOf(BadRequestException);
+      expect(followsQb.execute).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('isFollowing', () => {
+    it('should look up a single edge', async () => {
+      //Arrange
+      followsQb.getExists.mockResolvedValue(true);
+      //Act
+      const result = await service.isFollowing(mockUser3.id, mockUser1.email);
+      //Assert
+      expect(followsQb.where).toHaveBeenCalledWith('follow.followerId = :userId', { userId: mockUser3.id });
+      expect(followsQb.andWhere).toHaveBeenCalledWith('followee.email = :targetEmail', { targetEmail: mockUser1.email });
+      expect(result).toBe(true);
+    });
+  });
+
+  describe('followers / following', () => {
+    const row = (user: User, cursorAt: string) => ({
+      id: user.id,
+      username: user.username,
+      email: user.email,
+      premium: user.premium,
+      followersCount: user.followersCount,
+      followingCount: user.followingCount,
+      followedAt: new Date(cursorAt),
+      cursorAt,
+    });
+
+    it('should return one page of followers and a cursor when there are more', async () => {
+      //Arrange se piden 2 y el repositorio devuelve 3 (limit + 1)
+      const otherId = 'a1b2c3d4-e5f6-7890-abcd-1234567890ef';
+      followsQb.getRawMany.mockResolvedValue([
+        row(mockUser2, '2026-01-03 10:00:00.000001+00'),
+        row({ ...mockUser3, id: otherId }, '2026-01-02 10:00:00+00'),
+        row(mockUser1, '2026-01-01 10:00:00+00'),
+      ]);
+      //Act
+      const page = await service.followers('u1', FollowsPageDto.fromQuery({ limit: '2' }));
+      //Assert
+      expect(followsQb.where).toHaveBeenCalledWith('follow.followeeId = :userId', { userId: 'u1' });
+      expect(followsQb.limit).toHaveBeenCalledWith(3);
+      expect(page.items.map((item) => item.email)).toEqual([mockUser2.email, mockUser3.email]);
+      expect(page.items[0]).not.toHaveProperty('cursorAt');
+      expect(decodeFollowCursor(page.nextCursor as string)).toEqual(['2026-01-02 10:00:00+00', otherId]);
+    });
+
+    it('should continue the following list after the cursor', async () => {
+      //Arrange
+      const cursor = encodeFollowCursor('2026-01-02 10:00:00+00', 'a1b2c3d4-e5f6-7890-abcd-1234567890ef');
+      //Act
+      const page = await service.following('u1', FollowsPageDto.fromQuery({ cursor }));
+      //Assert
+      expect(followsQb.where).toHaveBeenCalledWith('follow.followerId = :userId', { userId: 'u1' });
+      expect(followsQb.andWhere).toHaveBeenCalledWith(
+        '(follow.createdAt, follow.followeeId) < (CAST(:followedAt AS timestamptz), CAST(:otherId AS uuid))',
+        { followedAt: '2026-01-02 10:00:00+00', otherId: 'a1b2c3d4-e5f6-7890-abcd-1234567890ef' },
+      );
+      expect(page).toEqual({ items: [], nextCursor: null });
+    });
+
+    it('should reject an invalid cursor', async () => {
+      await expect(service.following('u1', FollowsPageDto.fromQuery({ cursor: 'no-es-un-cursor' }))).rejects.toBeInstanceOf(
+        BadRequestException,
+      );
     });
   });
 
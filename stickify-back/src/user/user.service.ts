@@ -7,12 +7,39 @@ import * as bcrypt from 'bcrypt';
 import { CreateUserDto } from './dto/create-user.dto';
 import { UpdateUserDto } from './dto/update-user.dto';
 import { User } from './entities/user.entity';
+import { UserFollow } from './entities/user-follow.entity';
+import { FollowListItem, FollowToggleResult, FollowsPage, FollowsPageDto } from './dto/follows-page.dto';
+
+const PUBLIC_FIELDS: (keyof User)[] = ['id', 'username', 'email', 'premium', 'followersCount', 'followingCount'];
+
+// El cursor es la clave de orden de la última arista de la página: (createdAt, id del otro usuario).
+// createdAt va como texto de Postgres para no perder los microsegundos de timestamptz.
+const CURSOR_TIMESTAMP = /^\d{4}-\d{2}-\d{2}[ T][\d:.]+(Z|[+-]\d{2}(:?\d{2})?)?$/;
+const UUID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+
+export function encodeFollowCursor(followedAt: string, userId: string): string {
+  return Buffer.from(JSON.stringify([followedAt, userId])).toString('base64url');
+}
+
+export function decodeFollowCursor(cursor: string): [string, string] {
+  try {
+    const [followedAt, userId] = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    if (CURSOR_TIMESTAMP.test(followedAt) && UUID.test(userId)) {
+      return [followedAt, userId];
+    }
+  } catch {
+    // se responde igual que a un cursor con otra forma
+  }
+  throw new BadRequestException('Cursor inválido');
+}
 
 @Injectable()
 export class UsersService {
   constructor(
     @InjectRepository(User)
     private readonly userRepository: Repository<User>,
+    @InjectRepository(UserFollow)
+    private readonly followsRepository: Repository<UserFollow>,
     private readonly jwtService: JwtService 
   ) {}
 
@@ -38,10 +65,7 @@ export class UsersService {
   }
 
   async findOne(id: string): Promise<User | null> {
-    return this.userRepository.findOne({
-      where: { id },
-      select: ['id', 'username', 'email', 'premium', 'followers', 'following']
-    });
+    return this.userRepository.findOne({ where: { id }, select: PUBLIC_FIELDS });
   }
 
   async update(id: string, updateUserDto: UpdateUserDto): Promise<User | null> {
@@ -62,35 +86,98 @@ export class UsersService {
     return this.userRepository.findOne({ where: { email } });
   }
 
-  async toggleFollow(userId: string, targetEmail: string, follow: boolean): Promise<User> {
-    const user = await this.userRepository.findOne({ where: { id: userId } });
-    const targetUser = await this.userRepository.findOne({ where: { email: targetEmail } });
+  // Seguir es insertar una arista (ON CONFLICT DO NOTHING si ya existía) y dejar de seguir
+  // es borrarla: una sola sentencia indexada, sin leer ni reescribir listas, así que dos
+  // seguimientos simultáneos no se pisan. Los contadores los actualiza el trigger de user_follows.
+  async toggleFollow(userId: string, targetEmail: string, follow: boolean): Promise<FollowToggleResult> {
+    const user = await this.userRepository.findOne({ where: { id: userId }, select: ['id'] });
+    const targetUser = await this.userRepository.findOne({ where: { email: targetEmail }, select: ['id'] });
 
     if (!user || !targetUser) {
       throw new BadRequestException('Usuario no encontrado');
     }
+    if (user.id === targetUser.id) {
+      throw new BadRequestException('Un usuario no puede seguirse a sí mismo');
+    }
 
     if (follow) {
-      // Agregar a seguidores/siguiendo
-      if (!user.following.includes(targetUser.email)) {
-        user.following.push(targetUser.email);
-      }
-      if (!targetUser.followers.includes(user.email)) {
-        targetUser.followers.push(user.email);
-      }
+      await this.followsRepository
+        .createQueryBuilder()
+        .insert()
+        .into(UserFollow)
+        .values({ followerId: userId, followeeId: targetUser.id })
+        .orIgnore()
+        .execute();
     } else {
-      // Remover de seguidores/siguiendo
-      user.following = user.following.filter(email => email !== targetUser.email);
-      targetUser.followers = targetUser.followers.filter(email => email !== user.email);
+      await this.followsRepository.delete({ followerId: userId, followeeId: targetUser.id });
     }
 
-    await this.userRepository.save([user, targetUser]);
-    return user;
+    // Tras el INSERT / DELETE la arista existe exactamente si follow es true; los contadores
+    // ya incluyen el cambio. Nada de listas: la respuesta no crece con los seguidores.
+    const updated = (await this.findOne(userId)) as User;
+    return { ...updated, targetEmail, isFollowing: follow };
+  }
+
+  async isFollowing(userId: string, targetEmail: string): Promise<boolean> {
+    return this.followsRepository
+      .createQueryBuilder('follow')
+      .innerJoin(User, 'followee', 'followee.id = follow.followeeId')
+      .where('follow.followerId = :userId', { userId })
+      .andWhere('followee.email = :targetEmail', { targetEmail })
+      .getExists();
   }
+
+  // Quienes siguen a userId, del más reciente al más antiguo
+  followers(userId: string, query: FollowsPageDto): Promise<FollowsPage> {
+    return this.followsPage('followeeId', 'followerId', userId, query);
+  }
+
+  // A quienes sigue userId, del más reciente al más antiguo
+  following(userId: string, query: FollowsPageDto): Promise<FollowsPage> {
+    return this.followsPage('followerId', 'followeeId', userId, query);
+  }
+
+  // Paginación por clave sobre los índices (usuario, createdAt DESC, otro DESC): sin OFFSET
+  private async followsPage(
+    ownColumn: 'followerId' | 'followeeId',
+    otherColumn: 'followerId' | 'followeeId',
+    userId: string,
+    query: FollowsPageDto,
+  ): Promise<FollowsPage> {
+    const qb = this.followsRepository
+      .createQueryBuilder('follow')
+      .innerJoin(User, 'other', `other.id = follow.${otherColumn}`)
+      .select('follow.createdAt', 'followedAt')
+      .addSelect('CAST(follow.createdAt AS text)', 'cursorAt')
+      .where(`follow.${ownColumn} = :userId`, { userId })
+      .orderBy('follow.createdAt', 'DESC')
+      .addOrderBy(`follow.${otherColumn}`, 'DESC')
+      .limit(query.limit + 1);
+    PUBLIC_FIELDS.forEach((field) => qb.addSelect(`other.${field}`, field));
+
+    if (query.cursor) {
+      const [followedAt, otherId] = decodeFollowCursor(query.cursor);
+      qb.andWhere(
+        `(follow.createdAt, follow.${otherColumn}) < (CAST(:followedAt AS timestamptz), CAST(:otherId AS uuid))`,
+        { followedAt, otherId },
+      );
+    }
+
+    const rows = await qb.getRawMany();
+    const page = rows.slice(0, query.limit);
+    const last = page[page.length - 1];
+    return {
+      items: page.map(({ cursorAt, followedAt, ...user }): FollowListItem => ({
+        ...user,
+        followedAt: new Date(followedAt).toISOString(),
+      })),
+      nextCursor: rows.length > query.limit ? encodeFollowCursor(last.cursorAt, last.id) : null,
+    };
+  }
+
   async findAll(): Promise<User[]> {
-    return this.userRepository.find({
-      select: ['id', 'username', 'email', 'premium', 'followers', 'following']
-    });
+    // Solo los contadores: las listas completas de cada usuario no caben en un listado
+    return this.userRepository.find({ select: PUBLIC_FIELDS });
   }
 
   getToken(user: User): string {
@@ -8,9 +8,9 @@ import { Repository } from 'typeorm';
 import { ConflictException, NotFoundException } from '@nestjs/common';
 
 //Mocks de usuarios
-const mockUser1: User = { id: 'u1', email: 'user1@mail.com', username: 'user1', password: '', premium: false, followers: [], following: [] };
-const mockUser2: User = { id: 'u2', email: 'user2@mail.com', username: 'user2', password: '', premium: false, followers: [], following: [] };
-const mockUser3: User = { id: 'u3', email: 'user3@mail.com', username: 'user3', password: '', premium: false, followers: [], following: [] };
+const mockUser1: User = { id: 'u1', email: 'user1@mail.com', username: 'user1', password: '', premium: false, followersCount: 0, followingCount: 0 };
+const mockUser2: User = { id: 'u2', email: 'user2@mail.com', username: 'user2', password: '', premium: false, followersCount: 0, followingCount: 0 };
+const mockUser3: User = { id: 'u3', email: 'user3@mail.com', username: 'user3', password: '', premium: false, followersCount: 0, followingCount: 0 };
 
 //Mocks de playlists
 const mockPlaylist1: Playlist = { id: 'p1', name: 'Playlist 1', trackIds: [], type: 'user', createdAt: new Date(), createdBy: 'user1' } as any;
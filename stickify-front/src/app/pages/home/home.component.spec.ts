@@ -1,4 +1,4 @@
-import { ComponentFixture, TestBed } from '@angular/core/testing';
+import { ComponentFixture, TestBed, fakeAsync, tick } from '@angular/core/testing';
 import { HomeComponent } from './home.component';
 import { MusicService } from '../../services/music.service';
 import { RatingService } from '../../services/rating.service';
@@ -24,6 +24,9 @@ describe('HomeComponent', () => {
     // Mocks de servicios
     const musicServiceMock = {
       songs$: of(MOCK_SONGS),
+      catalogueChanged$: of(),
+      findSongs: () => of({ items: MOCK_SONGS, nextCursor: null }),
+      getSongsByIds: () => of(MOCK_SONGS),
       addSong: () => of(MOCK_SONGS[0]),
       generateUniqueId: () => 999,
     };
@@ -72,52 +75,62 @@ describe('HomeComponent', () => {
     expect(component).toBeTruthy();
   });
 
-  it('should filter songs by year', () => {
+  it('should load the first page of songs from the backend', () => {
+    // Assert
+    expect(component.filteredSongs).toEqual(MOCK_SONGS);
+    expect(component.totalFilteredSongs).toBe(MOCK_SONGS.length);
+  });
+
+  it('should send the filters to the backend', () => {
     // Arrange
-    component.allSongs = [...MOCK_SONGS];
-    component.filteredSongs = [...MOCK_SONGS];
-    component.totalFilteredSongs = MOCK_SONGS.length;
-    const filters = { year: '2023', genres: [], artists: [] };
+    const songs2023 = MOCK_SONGS.filter(song => song.releaseDate.startsWith('2023'));
+    spyOn(musicService, 'findSongs').and.returnValue(of({ items: songs2023, nextCursor: null }));
+    component.currentPage = 2;
+    const filters = { year: '2023', genres: ['Pop'], artists: ['Artist A'] };
 
     // Act
     component.onFilterChange(filters);
 
-    const expectedSongs = MOCK_SONGS.filter(song =>
-      new Date(song.releaseDate).getFullYear().toString() === filters.year
-    );
-
     // Assert
-    expect(component.filteredSongs.length).toBe(expectedSongs.length);
-    expect(component.filteredSongs).toEqual(expectedSongs);
+    expect(musicService.findSongs).toHaveBeenCalledWith(
+      jasmine.objectContaining({ year: '2023', genres: ['Pop'], artists: ['Artist A'] })
+    );
+    expect(component.filteredSongs).toEqual(songs2023);
     expect(component.currentPage).toBe(1);
-    expect(component.totalFilteredSongs).toBe(expectedSongs.length);
+    expect(component.totalFilteredSongs).toBe(songs2023.length);
   });
 
-  it('should filter songs by genre and artist', () => {
+  it('should send the search term to the backend after the debounce', fakeAsync(() => {
     // Arrange
-    component.allSongs = [...MOCK_SONGS];
-    const filters = { year: '', genres: ['Pop'], artists: ['Artist A'] };
+    spyOn(musicService, 'findSongs').and.returnValue(of({ items: [MOCK_SONGS[0]], nextCursor: null }));
 
     // Act
-    component.onFilterChange(filters);
-    const expectedSongs = MOCK_SONGS.filter(song =>
-      filters.genres.includes(song.primaryGenreName) && filters.artists.includes(song.artistName)
-    );
+    component.onSearchTermChanged('Song');
+    component.onSearchTermChanged('Song 1');
+    tick(300);
 
     // Assert
-    expect(component.filteredSongs).toEqual(expectedSongs);
-  });
+    expect(musicService.findSongs).toHaveBeenCalledTimes(1);
+    expect(musicService.findSongs).toHaveBeenCalledWith(jasmine.objectContaining({ q: 'Song 1' }));
+    expect(component.filteredSongs.length).toBe(1);
+    expect(component.filteredSongs[0].trackName).toBe('Song 1');
+  }));
 
-  it('should search songs by term', () => {
+  it('should ask for the next page when paging past the loaded songs', () => {
     // Arrange
-    component.allSongs = [...MOCK_SONGS];
+    const findSongs = spyOn(musicService, 'findSongs');
+    findSongs.and.returnValue(of({ items: MOCK_SONGS.slice(0, 2), nextCursor: 'abc' }));
+    component.itemsPerPage = 2;
+    component.onFilterChange({ year: '', genres: [], artists: [] });
+    findSongs.and.returnValue(of({ items: MOCK_SONGS.slice(2), nextCursor: null }));
 
     // Act
-    component.onSearchTermChanged('Song 1');
+    component.onPageChange(2);
 
     // Assert
-    expect(component.filteredSongs.length).toBe(1);
-    expect(component.filteredSongs[0].trackName).toBe('Song 1');
+    expect(musicService.findSongs).toHaveBeenCalledWith(jasmine.any(Object), 'abc');
+    expect(component.filteredSongs).toEqual(MOCK_SONGS);
+    expect(component.totalFilteredSongs).toBe(MOCK_SONGS.length);
   });
 
   it('should open and close modal', () => {
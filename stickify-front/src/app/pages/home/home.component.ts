@@ -1,6 +1,8 @@
-import { Component, OnInit, inject } from '@angular/core';
+import { Component, OnDestroy, OnInit, inject } from '@angular/core';
+import { Subject, Subscription, of } from 'rxjs';
+import { catchError, debounceTime, distinctUntilChanged, switchMap } from 'rxjs/operators';
 import { MusicService } from '../../services/music.service';
-import { Song } from '../../shared/interfaces/song.interface';
+import { Song, SongSearch, SongsPage } from '../../shared/interfaces/song.interface';
 import { HeaderComponent } from '../../shared/components/header/header.component';
 import { NavComponent } from '../../shared/components/nav/nav.component';
 import { AsideComponent } from '../../shared/components/aside/aside.component';
@@ -30,8 +32,8 @@ import { CommentService } from '../../services/comment.service';
   ],
   styleUrls: ['./home.component.css']
 })
-export class HomeComponent implements OnInit {
-  allSongs: Song[] = [];
+export class HomeComponent implements OnInit, OnDestroy {
+  // Resultados ya descargados de la búsqueda actual; el resto se pide al backend al paginar
   filteredSongs: Song[] = [];
   selectedSong: Song | null = null;
   showModal: boolean = false;
@@ -42,6 +44,13 @@ export class HomeComponent implements OnInit {
   itemsPerPage: number = 20;
   totalFilteredSongs: number = 0;
 
+  private search: SongSearch = {};
+  private nextCursor: string | null = null;
+  private loadingMore = false;
+  private readonly searches = new Subject<SongSearch>();
+  private readonly searchTerms = new Subject<string>();
+  private readonly subscriptions = new Subscription();
+
   constructor(
     private readonly musicService: MusicService,
     private readonly ratingService: RatingService,
@@ -56,23 +65,51 @@ export class HomeComponent implements OnInit {
       this.songComments = map;
     });
 
-    this.ratingService.userRatings$.subscribe(() => {
-      if (this.allSongs.length > 0) {
-        this.ratingService.updateTopRatedSongs(this.allSongs);
-      }
-    });
+    // Las mejor valoradas se buscan por id: no tienen por qué estar en las páginas descargadas
+    this.subscriptions.add(this.ratingService.userRatings$.pipe(
+      switchMap(ratings => this.musicService.getSongsByIds(Object.keys(ratings).map(Number)))
+    ).subscribe(ratedSongs => this.ratingService.updateTopRatedSongs(ratedSongs)));
+  }
+
+  ngOnDestroy(): void {
+    this.subscriptions.unsubscribe();
   }
 
   private loadSongs(): void {
-    this.musicService.songs$.subscribe({
-      next: (songs) => {
-        this.allSongs = songs;
-        this.filteredSongs = [...this.allSongs];
-        this.totalFilteredSongs = this.filteredSongs.length;
-        this.ratingService.updateTopRatedSongs(this.allSongs);
-      },
-      error: (err) => console.error('Error loading songs:', err)
-    });
+    // Cada búsqueda cancela la anterior; solo se muestra la respuesta de la última
+    this.subscriptions.add(this.searches.pipe(
+      switchMap(search => this.musicService.findSongs(search).pipe(
+        catchError(err => {
+          console.error('Error loading songs:', err);
+          return of<SongsPage>({ items: [], nextCursor: null });
+        })
+      ))
+    ).subscribe(page => {
+      this.filteredSongs = page.items;
+      this.nextCursor = page.nextCursor;
+      this.currentPage = 1;
+      this.updateTotal();
+    }));
+
+    this.subscriptions.add(this.searchTerms.pipe(
+      debounceTime(300),
+      distinctUntilChanged()
+    ).subscribe(q => this.runSearch({ ...this.search, q })));
+
+    // Tras importar canciones de iTunes se repite la búsqueda actual
+    this.subscriptions.add(this.musicService.catalogueChanged$.subscribe(() => this.runSearch(this.search)));
+
+    this.runSearch({});
+  }
+
+  private runSearch(search: SongSearch): void {
+    this.search = search;
+    this.searches.next(search);
+  }
+
+  // Si quedan resultados en el backend se cuenta una página más para que la paginación la ofrezca
+  private updateTotal(): void {
+    this.totalFilteredSongs = this.filteredSongs.length + (this.nextCursor ? this.itemsPerPage : 0);
   }
 
   private getCurrentUser(): void {
@@ -93,43 +130,22 @@ export class HomeComponent implements OnInit {
   onFilterChange(filters: any): void {
     console.log('[Cualitativa] Filtros recibidos:', filters);
 
-    const startTime = performance.now(); // Cuantitativa: medir duración
-
-    let filtered = this.allSongs.filter(song => {
-      const yearMatch = !filters.year ||
-        new Date(song.releaseDate).getFullYear().toString() === filters.year;
-      const genreMatch = filters.genres.length === 0 ||
-        filters.genres.includes(song.primaryGenreName);
-      const artistMatch = filters.artists.length === 0 ||
-        filters.artists.includes(song.artistName);
-
-      return yearMatch && genreMatch && artistMatch;
-    });
-
-    const duration = performance.now() - startTime;
-    console.log(`[Cuantitativa] Tiempo de filtrado: ${duration.toFixed(2)} ms`);
-    console.log(`[Cuantitativa] Total canciones filtradas: ${filtered.length}`);
-
     // Cualitativa: análisis de filtros activos
     if (filters.year) console.log(`[Cualitativa] Filtro por año activo: ${filters.year}`);
     if (filters.genres.length > 0) console.log(`[Cualitativa] Filtro por géneros: ${filters.genres.join(', ')}`);
     if (filters.artists.length > 0) console.log(`[Cualitativa] Filtro por artistas: ${filters.artists.join(', ')}`);
 
-    this.filteredSongs = filtered;
-    this.currentPage = 1;
-    this.totalFilteredSongs = this.filteredSongs.length;
-
-    console.log('[Cualitativa] Página reiniciada a 1');
+    // El filtrado lo hace el backend con GET /songs?artist=&genre=&year=
+    this.runSearch({
+      ...this.search,
+      artists: filters.artists,
+      genres: filters.genres,
+      year: filters.year || undefined
+    });
   }
 
   onSearchTermChanged(searchTerm: string): void {
-    const lowerSearchTerm = searchTerm.toLowerCase();
-    this.filteredSongs = this.allSongs.filter(song =>
-      song.trackName.toLowerCase().includes(lowerSearchTerm) ||
-      song.artistName.toLowerCase().includes(lowerSearchTerm)
-    );
-    this.currentPage = 1;
-    this.totalFilteredSongs = this.filteredSongs.length;
+    this.searchTerms.next(searchTerm.trim());
   }
 
   getAverageRatingForSong(trackId: number): number {
@@ -185,6 +201,33 @@ export class HomeComponent implements OnInit {
 
   onPageChange(newPage: number): void {
     this.currentPage = newPage;
+    if (newPage * this.itemsPerPage > this.filteredSongs.length) {
+      this.loadMoreResults();
+    }
+  }
+
+  // Siguiente página de la búsqueda actual; se descarta si entretanto cambió la búsqueda
+  private loadMoreResults(): void {
+    if (this.loadingMore || !this.nextCursor) {
+      return;
+    }
+    const search = this.search;
+    this.loadingMore = true;
+    this.musicService.findSongs(search, this.nextCursor).subscribe({
+      next: page => {
+        this.loadingMore = false;
+        if (search !== this.search) {
+          return;
+        }
+        this.filteredSongs = [...this.filteredSongs, ...page.items];
+        this.nextCursor = page.nextCursor;
+        this.updateTotal();
+      },
+      error: err => {
+        this.loadingMore = false;
+        console.error('Error loading more songs:', err);
+      }
+    });
   }
 
   addNewSong(newSongData: any): void {
@@ -202,7 +245,10 @@ export class HomeComponent implements OnInit {
     };
 
     this.musicService.addSong(newSong).subscribe({
-      next: () => console.log('Canción añadida con éxito'),
+      next: () => {
+        console.log('Canción añadida con éxito');
+        this.runSearch(this.search);
+      },
       error: (err) => console.error('Error al añadir canción:', err)
     });
   }
@@ -44,7 +44,7 @@ describe('PlaylistComponent', () => {
     username: 'testuser',
     password: 'testpass', // Agregado para cumplir con la interfaz User
     premium: false,
-    following: []
+    followingCount: 0
   };
 
   beforeEach(async () => {
@@ -56,7 +56,15 @@ describe('PlaylistComponent', () => {
       imports: [PlaylistComponent],
       providers: [
         // Mock del MusicService
-        { provide: MusicService, useValue: { songs$: of([mockSong]) } },
+        {
+          provide: MusicService,
+          useValue: {
+            songs$: of([mockSong]),
+            getSongsByIds: () => of([mockSong]),
+            hasMoreSongs: () => true,
+            loadMoreSongs: () => of([])
+          }
+        },
         // Mock del PlaylistService
         {
           provide: PlaylistService,
@@ -394,6 +402,31 @@ describe('PlaylistComponent', () => {
     );
   });
 
+  it('should load the next page of songs for the picker', () => {
+    // Arrange
+    const musicService = TestBed.inject(MusicService);
+    spyOn(musicService, 'loadMoreSongs').and.returnValue(of([]));
+    // Act
+    component.loadMoreSongs();
+    // Assert
+    expect(component.canLoadMoreSongs()).toBeTrue();
+    expect(musicService.loadMoreSongs).toHaveBeenCalled();
+  });
+
+  it('should look up the songs of the loaded playlists by id', () => {
+    // Arrange
+    const musicService = TestBed.inject(MusicService);
+    const playlistApi = TestBed.inject(PlaylistApiService) as jasmine.SpyObj<PlaylistApiService>;
+    spyOn(musicService, 'getSongsByIds').and.returnValue(of([mockSong]));
+    playlistApi.getAllPlaylists.and.returnValue(of([
+      { id: 'p1', name: 'Mix', trackIds: ['1', '2'], type: 'user', createdAt: new Date(), createdBy: 'testuser' }
+    ]));
+    // Act
+    component.loadAllPlaylistsFromBackend();
+    // Assert
+    expect(musicService.getSongsByIds).toHaveBeenCalledWith([1, 2]);
+  });
+
   it('should close modal', () => {
     // Arrange
     component.showModal = true;
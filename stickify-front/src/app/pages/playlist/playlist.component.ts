@@ -66,6 +66,8 @@ export class PlaylistComponent implements OnInit {
         );
         
         console.log('Todas las playlists (excepto automáticas):', this.userPlaylists);
+        // Las canciones de las playlists se piden por id: el caché solo tiene las páginas cargadas
+        this.musicService.getSongsByIds(this.userPlaylists.flatMap(p => p.trackIds.map(Number))).subscribe();
       },
       error: (err) => {
         console.error('Error al cargar las playlists:', err);
@@ -120,6 +122,15 @@ export class PlaylistComponent implements OnInit {
     return Promise.all(saveRequests);
   }
 
+  canLoadMoreSongs(): boolean {
+    return this.musicService.hasMoreSongs();
+  }
+
+  // Siguiente página del catálogo para el selector de canciones
+  loadMoreSongs(): void {
+    this.musicService.loadMoreSongs().subscribe();
+  }
+
   getPlaylistSongs(playlist: Playlist): Song[] {
     return this.playlistService.getPlaylistSongs(playlist, this.allSongs);
   }
@@ -27,10 +27,23 @@ describe('ProfileComponent', () => {
     username: 'testuser',
     password: 'testpass',
     premium: false,
-    followers: ['a@example.com', 'b@example.com'],
-    following: ['c@example.com']
+    followersCount: 2,
+    followingCount: 1
   };
 
+  const followPage = (...usernames: string[]) => ({
+    items: usernames.map(username => ({
+      id: username,
+      username,
+      email: `${username}@example.com`,
+      premium: false,
+      followersCount: 0,
+      followingCount: 0,
+      followedAt: '2026-01-01T00:00:00.000Z'
+    })),
+    nextCursor: null
+  });
+
   const mockSongs: Song[] = [
     {
       trackId: 1,
@@ -60,9 +73,11 @@ describe('ProfileComponent', () => {
 
 
   beforeEach(() => {
-    const authSpy = jasmine.createSpyObj('AuthService', ['getAllOtherUsers', 'updateUserPremiumStatus', 'logOut'], { currentUser: mockUser });
-    authSpy.getAllOtherUsers.and.returnValue(of([]));
-    const musicSpy = jasmine.createSpyObj('MusicService', [], { songs$: of(mockSongs) });
+    const authSpy = jasmine.createSpyObj('AuthService', ['findOne', 'getFollowPage', 'updateUserPremiumStatus', 'logOut'], { currentUser: mockUser });
+    authSpy.findOne.and.returnValue(of(mockUser));
+    authSpy.getFollowPage.and.returnValue(of(followPage()));
+    const musicSpy = jasmine.createSpyObj('MusicService', ['getSongsByIds'], { songs$: of(mockSongs) });
+    musicSpy.getSongsByIds.and.returnValue(of(mockSongs));
     const playlistSpy = jasmine.createSpyObj('PlaylistApiService', ['getUserSavedPlaylists']);
 
     TestBed.configureTestingModule({
@@ -103,7 +118,7 @@ describe('ProfileComponent', () => {
     const songSub = new Subject<Song[]>().subscribe();
     const userSub = new Subject<User[]>().subscribe();
     (component as any).songsSubscription = songSub;
-    (component as any).usersSubscription = userSub;
+    (component as any).followSubscription = userSub;
     spyOn(songSub, 'unsubscribe');
     spyOn(userSub, 'unsubscribe');
     // Act
@@ -178,13 +193,15 @@ describe('ProfileComponent', () => {
 
   it('should update follow data correctly', () => {
     // Arrange
-    (component as any).allUsersMap.set('a@example.com', 'UserA');
-    (component as any).allUsersMap.set('b@example.com', 'UserB');
-    (component as any).allUsersMap.set('c@example.com', 'UserC');
+    authServiceSpy.getFollowPage.and.callFake((_id: string, list: 'followers' | 'following') =>
+      of(list === 'followers' ? followPage('UserB', 'UserA') : followPage('UserC')));
+    component.currentUser = { ...mockUser };
     // Act
-    (component as any).updateFollowData();
+    (component as any).loadFollowData();
     // Assert
+    expect(authServiceSpy.getFollowPage).toHaveBeenCalledWith(mockUser.id, 'followers', 3);
     expect(component.followersCount).toBe(2);
+    expect(component.followingCount).toBe(1);
     expect(component.latestFollowersNames).toEqual(['UserB', 'UserA']);
     expect(component.latestFollowingNames).toEqual(['UserC']);
   });
@@ -221,17 +238,18 @@ describe('ProfileComponent', () => {
   expect(Swal.fire).toHaveBeenCalledWith(jasmine.objectContaining({ title: 'Pago cancelado' }));
   }));
 
-  it('should handle error in loadAllUsersForMapping', fakeAsync(() => {
+  it('should handle error in loadFollowData', fakeAsync(() => {
   // Arrange
     spyOn(console, 'error');
-    authServiceSpy.getAllOtherUsers.and.returnValue(throwError(() => new Error('fail')));
+    authServiceSpy.getFollowPage.and.returnValue(throwError(() => new Error('fail')));
     
   // Act
     component.ngOnInit();
     tick();
     
   // Assert
-    expect(console.error).toHaveBeenCalledWith('Error loading all users for mapping:', jasmine.any(Error));
+    expect(console.error).toHaveBeenCalledWith('Error loading follow data:', jasmine.any(Error));
+    expect(component.latestFollowersNames).toEqual([]);
   }));
 
   it('should handle error in loadAllProfileData', fakeAsync(() => {
@@ -259,6 +277,21 @@ describe('ProfileComponent', () => {
     }));
   }));
 
+  it('should load only the songs named in the profile', () => {
+    // Arrange
+    const playlist: Playlist = { id: 'p1', name: 'Mix', trackIds: ['2', '1'], type: 'user', createdAt: new Date() };
+    playlistApiSpy.getUserSavedPlaylists.and.returnValue(of([playlist]));
+    component.currentUser = { ...mockUser };
+    // Act
+    (component as any).loadAllProfileData();
+    httpMock.expectOne(req => req.url.endsWith('/ratings/user/testuser')).flush([{ trackId: 1, rating: 4, userId: '1' }]);
+    httpMock.expectOne(req => req.url.endsWith('/comments/user/testuser')).flush([]);
+    // Assert
+    expect(musicServiceSpy.getSongsByIds).toHaveBeenCalledWith([1, 2]);
+    expect(component.userRatings).toEqual([{ songName: 'Song One', rating: 4 }]);
+    expect(component.getPlaylistCoverForProfile(playlist)).toBe('cover2.jpg');
+  });
+
   it('should not load profile data if email missing', () => {
     // Arrange
     spyOn(console, 'error');
@@ -7,6 +7,7 @@ import { Song } from '../../shared/interfaces/song.interface';
 import { BackendComment } from '../../shared/interfaces/backend-comment.interface';
 import { MusicService } from '../../services/music.service';
 import { Subscription, forkJoin } from 'rxjs';
+import { map, switchMap } from 'rxjs/operators';
 import { Playlist } from '../../shared/interfaces/playlist.interface';
 import { User } from '../../shared/interfaces/user.interface';
 import { UserRating } from '../../shared/interfaces/user-rating.interface';
@@ -37,26 +38,22 @@ export class ProfileComponent implements OnInit, OnDestroy {
   allSongs: Song[] = [];
   showPremiumModal: boolean = false;
 
-  private readonly allUsersMap: Map<string, string> = new Map();
   followersCount: number = 0;
   followingCount: number = 0;
   latestFollowersNames: string[] = [];
   latestFollowingNames: string[] = [];
 
   private songsSubscription: Subscription | undefined;
-  private usersSubscription: Subscription | undefined;
+  private followSubscription: Subscription | undefined;
 
   constructor(private readonly http: HttpClient) {}
 
   ngOnInit(): void {
     this.loadUserData();
-    this.loadAllUsersForMapping();
+    this.loadFollowData();
 
     if (this.currentUser) {
-      this.songsSubscription = this.musicService.songs$.subscribe(songs => {
-        this.allSongs = songs;
-        this.loadAllProfileData();
-      });
+      this.loadAllProfileData();
     } else {
       console.warn('No current user found on profile initialization. User might not be logged in.');
     }
@@ -64,28 +61,31 @@ export class ProfileComponent implements OnInit, OnDestroy {
 
   ngOnDestroy(): void {
     this.songsSubscription?.unsubscribe();
-    this.usersSubscription?.unsubscribe();
+    this.followSubscription?.unsubscribe();
   }
 
   private loadUserData(): void {
     this.currentUser = this.authService.currentUser;
   }
 
-  private loadAllUsersForMapping(): void {
-    this.usersSubscription = this.authService.getAllOtherUsers('dummyId').subscribe({
-      next: (users) => {
-        if (this.currentUser) {
-          this.allUsersMap.set(this.currentUser.email, this.currentUser.username);
-        }
-        users.forEach(user => {
-          if (user.email && user.username) {
-            this.allUsersMap.set(user.email, user.username);
-          }
-        });
-        this.updateFollowData();
+  // Contadores del usuario y los 3 últimos seguidores / seguidos: una página de 3 de cada lista
+  private loadFollowData(): void {
+    if (!this.currentUser?.id) {
+      this.updateFollowData();
+      return;
+    }
+    const userId = this.currentUser.id;
+    this.followSubscription = forkJoin({
+      user: this.authService.findOne(userId),
+      followers: this.authService.getFollowPage(userId, 'followers', 3),
+      following: this.authService.getFollowPage(userId, 'following', 3)
+    }).subscribe({
+      next: ({ user, followers, following }) => {
+        this.updateFollowData(user, followers.items.map(item => item.username), following.items.map(item => item.username));
       },
       error: (err) => {
-        console.error('Error loading all users for mapping:', err);
+        console.error('Error loading follow data:', err);
+        this.updateFollowData();
       }
     });
   }
@@ -99,12 +99,20 @@ export class ProfileComponent implements OnInit, OnDestroy {
     const userId = this.currentUser.email;
     const userName = this.currentUser.username;
 
-    forkJoin({
+    this.songsSubscription = forkJoin({
       playlists: this.playlistApiService.getUserSavedPlaylists(userId),
       ratings: this.http.get<BackendSongRating[]>(`${environment.backendUrl}/ratings/user/${userName}`),
       comments: this.http.get<BackendComment[]>(`${environment.backendUrl}/comments/user/${userName}`)
-    }).subscribe({
-      next: ({ playlists, ratings, comments }) => {
+    }).pipe(
+      // Solo las canciones que el perfil nombra (valoradas, comentadas y portadas), no el catálogo
+      switchMap(data => this.musicService.getSongsByIds([
+        ...data.ratings.map(rating => rating.trackId),
+        ...data.comments.map(comment => Number(comment.trackId)),
+        ...data.playlists.filter(playlist => playlist.trackIds?.length > 0).map(playlist => parseInt(playlist.trackIds[0], 10))
+      ]).pipe(map(songs => ({ ...data, songs }))))
+    ).subscribe({
+      next: ({ playlists, ratings, comments, songs }) => {
+        this.allSongs = songs;
         this.savedPlaylists = playlists;
         this.userRatings = this.processFetchedRatings(ratings);
         this.userComments = this.processFetchedComments(comments);
@@ -154,28 +162,11 @@ export class ProfileComponent implements OnInit, OnDestroy {
     this.authService.logOut();
   }
 
-  private updateFollowData(): void {
-    this.currentUser = this.authService.currentUser;
-
-    if (this.currentUser) {
-      const followers = this.currentUser.followers || [];
-      const following = this.currentUser.following || [];
-
-      this.followersCount = followers.length;
-      this.followingCount = following.length;
-
-      this.latestFollowersNames = followers.slice(-3).reverse().map(email => this.getUsernameByEmail(email));
-      this.latestFollowingNames = following.slice(-3).reverse().map(email => this.getUsernameByEmail(email));
-    } else {
-      this.followersCount = 0;
-      this.followingCount = 0;
-      this.latestFollowersNames = [];
-      this.latestFollowingNames = [];
-    }
-  }
-
-  private getUsernameByEmail(email: string): string {
-    return this.allUsersMap.get(email) || email;
+  private updateFollowData(user: User | null = this.currentUser, latestFollowers: string[] = [], latestFollowing: string[] = []): void {
+    this.followersCount = user?.followersCount ?? 0;
+    this.followingCount = user?.followingCount ?? 0;
+    this.latestFollowersNames = latestFollowers;
+    this.latestFollowingNames = latestFollowing;
   }
 
   private updatePremiumStatus(email: string, enable: boolean, successMsg: string, errorMsg: string): void {
@@ -14,8 +14,8 @@ const mockUser: User = {
   username: 'testuser',
   password: 'testpass',
   premium: false,
-  followers: [],
-  following: []
+  followersCount: 0,
+  followingCount: 0
 };
 
 const mockOtherUsers: User[] = [
@@ -28,8 +28,9 @@ describe('UserFollowsComponent', () => {
   let authServiceSpy: jasmine.SpyObj<AuthService>;
 
   beforeEach(async () => {
-    const spy = jasmine.createSpyObj('AuthService', ['getAllOtherUsers'], { currentUser: mockUser });
+    const spy = jasmine.createSpyObj('AuthService', ['getAllOtherUsers', 'getFollowingEmails'], { currentUser: mockUser });
     spy.getAllOtherUsers.and.returnValue(of(mockOtherUsers));
+    spy.getFollowingEmails.and.returnValue(of(new Set<string>()));
 
     await TestBed.configureTestingModule({
       imports: [UserFollowsComponent, HttpClientTestingModule, RouterTestingModule],
@@ -87,9 +88,20 @@ describe('UserFollowsComponent', () => {
     expect(component.filteredUsers[0].username).toBe('otheruser');
   });
 
+  it('should load the followed emails on init', () => {
+    // Arrange
+    authServiceSpy.getFollowingEmails.and.returnValue(of(new Set(['other@example.com'])));
+    // Act
+    component.ngOnInit();
+    // Assert
+    expect(authServiceSpy.getFollowingEmails).toHaveBeenCalledWith(mockUser.id!);
+    expect(component.isFollowing(mockOtherUsers[0])).toBeTrue();
+  });
+
   it('should return true if currentUser is following user', () => {
     // Arrange
-    component.currentUser = { ...mockUser, following: ['other@example.com'] };
+    component.currentUser = mockUser;
+    component.followingEmails = new Set(['other@example.com']);
     // Act
     const user = { ...mockUser, email: 'other@example.com' };
     // Assert
@@ -98,7 +110,8 @@ describe('UserFollowsComponent', () => {
 
   it('should return false if currentUser is not following user', () => {
     // Arrange
-    component.currentUser = { ...mockUser, following: [] };
+    component.currentUser = mockUser;
+    component.followingEmails = new Set();
     // Act
     const user = { ...mockUser, email: 'other@example.com' };
     // Assert
@@ -191,12 +204,14 @@ describe('UserFollowsComponent', () => {
       title: 'Éxito',
       text: 'Ahora sigues a otheruser'
     }));
+    expect(component.followingEmails.has('other@example.com')).toBeTrue();
   });
 
   it('should show success Swal when unfollowing a user', () => {
     // Arrange
     authServiceSpy.toggleFollow = jasmine.createSpy().and.returnValue(of(true));
-    component.currentUser = { ...mockUser, following: ['other@example.com'] };
+    component.currentUser = mockUser;
+    component.followingEmails = new Set(['other@example.com']);
     // Act
     component.toggleFollow(mockOtherUsers[0]);
     // Assert
@@ -204,6 +219,7 @@ describe('UserFollowsComponent', () => {
       icon: 'success',
       text: 'Has dejado de seguir a otheruser'
     }));
+    expect(component.followingEmails.has('other@example.com')).toBeFalse();
   });
 
   it('should show error Swal when toggleFollow returns false', () => {
@@ -280,7 +296,8 @@ describe('UserFollowsComponent', () => {
 
   it('should return false in isFollowing for invalid user', () => {
     // Arrange
-    component.currentUser = { ...mockUser, following: ['other@example.com'] };
+    component.currentUser = mockUser;
+    component.followingEmails = new Set(['other@example.com']);
     // Act
     const invalidUser = null as unknown as User; // Simular usuario inválido
     // Assert
@@ -21,6 +21,8 @@ export class UserFollowsComponent implements OnInit, OnDestroy {
   allUsers: User[] = [];
   filteredUsers: User[] = [];
   currentUser: User | null = null;
+  followingEmails: Set<string> = new Set(); // Emails the current user follows (GET /users/:id/following)
+  private followingSubscription: Subscription | undefined;
   private usersSubscription: Subscription | undefined; // To manage getAllOtherUsers subscription
   private toggleFollowSubscription: Subscription | undefined; // To manage toggleFollow subscription
 
@@ -29,6 +31,7 @@ export class UserFollowsComponent implements OnInit, OnDestroy {
     this.currentUser = this.authService.currentUser;
     if (this.currentUser?.id) { // Use id for backend calls
       this.loadAllOtherUsers(); // Load all other users (excluding the current one)
+      this.loadFollowing();
     } else {
       console.warn('No user logged in or user ID is missing. Cannot display follow page.');
       // Optionally, redirect to signin page if no user is logged in
@@ -38,6 +41,7 @@ export class UserFollowsComponent implements OnInit, OnDestroy {
 
   ngOnDestroy(): void {
     this.usersSubscription?.unsubscribe();
+    this.followingSubscription?.unsubscribe();
     this.toggleFollowSubscription?.unsubscribe();
   }
 
@@ -64,6 +68,13 @@ export class UserFollowsComponent implements OnInit, OnDestroy {
     });
   }
 
+  private loadFollowing(): void {
+    this.followingSubscription = this.authService.getFollowingEmails(this.currentUser!.id!).subscribe({
+      next: (emails) => this.followingEmails = emails,
+      error: (err) => console.error('Error loading followed users:', err)
+    });
+  }
+
   applyFilter(): void {
     const lowerCaseSearchTerm = this.searchTerm.toLowerCase().trim();
     if (lowerCaseSearchTerm === '') {
@@ -77,10 +88,10 @@ export class UserFollowsComponent implements OnInit, OnDestroy {
   }
 
   isFollowing(user: User | null): boolean {
-    if (!user || !this.currentUser || !this.currentUser.following) {
-      return false; // Manejar usuarios nulos o currentUser nulo o sin following
+    if (!user || !this.currentUser) {
+      return false; // Manejar usuarios nulos o currentUser nulo
     }
-    return this.currentUser.following.includes(user.email);
+    return this.followingEmails.has(user.email);
   }
 
   toggleFollow(userToToggle: User): void {
@@ -95,6 +106,11 @@ export class UserFollowsComponent implements OnInit, OnDestroy {
     this.toggleFollowSubscription = this.authService.toggleFollow(targetUserEmail, !currentlyFollowing).subscribe({
       next: (success) => {
         if (success) {
+          if (currentlyFollowing) {
+            this.followingEmails.delete(targetUserEmail);
+          } else {
+            this.followingEmails.add(targetUserEmail);
+          }
           // Re-load current user and all users to ensure UI reflects the latest state
           this.currentUser = this.authService.currentUser; // Refresh currentUser from service
           if (this.currentUser?.id) {
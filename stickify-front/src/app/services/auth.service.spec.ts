@@ -21,7 +21,8 @@ describe('AuthService', () => {
     email: 'test@example.com',
     password: 'password123',
     premium: false,
-    following: ['user2@example.com']
+    followersCount: 0,
+    followingCount: 1
   } as User;
 
   beforeEach(() => {
@@ -342,7 +343,27 @@ describe('AuthService', () => {
         targetEmail,
         follow: true
       });
-      req.flush({ ...mockUser, following: [...(mockUser.following || []), targetEmail] });
+      const { password, ...publicUser } = mockUser;
+      req.flush({ ...publicUser, followersCount: 0, followingCount: 2, targetEmail, isFollowing: true });
+      //Assert la sesión guarda los contadores nuevos
+      expect(service.currentUser?.followingCount).toBe(2);
+    });
+
+    it('should walk every page of the following list', () => {
+      //Arrange
+      const item = (email: string) => ({
+        id: email, username: email, email, premium: false, followersCount: 0, followingCount: 0, followedAt: '2026-01-01T00:00:00.000Z'
+      });
+      let emails: Set<string> | undefined;
+
+      service.getFollowingEmails('1').subscribe(result => emails = result); //Act
+
+      httpMock.expectOne(`${environment.backendUrl}/users/1/following?limit=200`)
+        .flush({ items: [item('a@example.com')], nextCursor: 'next' });
+      httpMock.expectOne(`${environment.backendUrl}/users/1/following?limit=200&cursor=next`)
+        .flush({ items: [item('b@example.com')], nextCursor: null });
+      //Assert
+      expect(emails).toEqual(new Set(['a@example.com', 'b@example.com']));
     });
 
     it('should not toggle follow without current user', () => {
@@ -2,9 +2,10 @@ import { Injectable } from '@angular/core';
 import { Router } from '@angular/router';
 import Swal from 'sweetalert2';
 import { User } from '../shared/interfaces/user.interface';
-import { HttpClient } from '@angular/common/http'; // Import HttpClient
+import { FollowsPage, FollowToggleResult } from '../shared/interfaces/follow.interface';
+import { HttpClient, HttpParams } from '@angular/common/http'; // Import HttpClient
 import { environment } from '../../environments/environment'; // Import environment for backend URL
-import { Observable, tap, catchError, of, map } from 'rxjs'; // Import RxJS operators
+import { Observable, tap, catchError, of, map, expand, reduce, EMPTY } from 'rxjs'; // Import RxJS operators
 
 @Injectable({
   providedIn: 'root'
@@ -214,19 +215,37 @@ export class AuthService {
       return of(false);
     }
 
-    return this.http.put<User>(`${environment.backendUrl}/users/${this.currentUser.id}/follow`, {
+    return this.http.put<FollowToggleResult>(`${environment.backendUrl}/users/${this.currentUser.id}/follow`, {
       targetEmail: targetUserEmail,
       follow: shouldFollow
     }).pipe(
-      tap(updatedUser => {
-        // Update the current user's following list in local storage
-        this.currentUser = updatedUser;
+      tap(result => {
+        // The response carries the updated counters (no follow lists): refresh them in local storage
+        this.currentUser = { ...this.currentUser!, followersCount: result.followersCount, followingCount: result.followingCount };
       }),
-      map(user => !!user), // Map to true if API call was successful
+      map(result => !!result), // Map to true if API call was successful
       catchError(error => {
         console.error('Error toggling follow status:', error);
         throw error; // Re-throw to be handled by components
       })
     );
   }
-}
\ No newline at end of file
+
+  // One page of a user's followers or followed users, newest follow first
+  getFollowPage(userId: string, list: 'followers' | 'following', limit: number = 50, cursor?: string): Observable<FollowsPage> {
+    let params = new HttpParams().set('limit', limit);
+    if (cursor) {
+      params = params.set('cursor', cursor);
+    }
+    return this.http.get<FollowsPage>(`${environment.backendUrl}/users/${userId}/${list}`, { params });
+  }
+
+  // Emails of everyone the user follows, walking the pages of GET /users/:id/following
+  getFollowingEmails(userId: string): Observable<Set<string>> {
+    return this.getFollowPage(userId, 'following', 200).pipe(
+      expand(page => page.nextCursor ? this.getFollowPage(userId, 'following', 200, page.nextCursor) : EMPTY),
+      reduce((emails: string[], page) => emails.concat(page.items.map(item => item.email)), []),
+      map(emails => new Set(emails))
+    );
+  }
+}
@@ -4,6 +4,7 @@ import { HttpClientTestingModule, HttpTestingController } from '@angular/common/
 import { environment } from '../../environments/environment';
 import { Song } from '../shared/interfaces/song.interface';
 import { RouterTestingModule } from '@angular/router/testing';
+import { throwError } from 'rxjs';
 
 const mockSongs: Song[] = [
   {
@@ -29,23 +30,15 @@ describe('MusicService', () => {
       imports: [HttpClientTestingModule, RouterTestingModule],
       providers: [MusicService]
     });
-    // Stub loadAllSongs on prototype to prevent automatic HTTP calls in constructor
-    const originalLoadAllSongs = (MusicService.prototype as any).loadAllSongs;
-    spyOn(MusicService.prototype as any, 'loadAllSongs').and.stub();
+    // Stub loadCatalogue on prototype to prevent automatic HTTP calls in constructor
+    const originalLoadCatalogue = (MusicService.prototype as any).loadCatalogue;
+    spyOn(MusicService.prototype as any, 'loadCatalogue').and.stub();
 
     service = TestBed.inject(MusicService);
     httpMock = TestBed.inject(HttpTestingController);
 
     // Attach original method for tests that need to call it explicitly
-    (service as any).__originalLoadAllSongs = originalLoadAllSongs;
-
-    // Consumir cualquier petición automática que haya quedado abierta
-    const pendingBackend = httpMock.match(`${environment.backendUrl}/songs`);
-    pendingBackend.forEach(req => req.flush([]));
-    const pendingItunes = httpMock.match('https://itunes.apple.com/search?term=music&limit=100');
-    pendingItunes.forEach(req => req.flush({ results: [] }));
-    const pendingBatch = httpMock.match(`${environment.backendUrl}/songs/batch`);
-    pendingBatch.forEach(req => req.flush({ success: true, data: [] }));
+    (service as any).__originalLoadCatalogue = originalLoadCatalogue;
   });
 
   afterEach(() => {
@@ -57,65 +50,36 @@ describe('MusicService', () => {
     expect(service).toBeTruthy();
   });
 
-  it('debería cargar todas las canciones del backend', (done) => {
+  it('debería cargar la primera página, los filtros y las canciones de iTunes', () => {
     //Arrange
-    service['songsSubject'].next([]);
-    service['allGenresSubject'].next([]);
-    service['allArtistsSubject'].next([]);
-    (service as any).__originalLoadAllSongs.call(service);
-    
+    const itunesSong = { ...mockSongs[0], trackId: 2 };
+    let changes = 0;
+    service.catalogueChanged$.subscribe(() => changes++);
     //Act
-    // Primera petición al backend
-    const req = httpMock.expectOne(`${environment.backendUrl}/songs`);
-    //Assert
-    expect(req.request.method).toBe('GET');
-    req.flush(mockSongs);
-    
-    // Dar tiempo para que se procesen las respuestas
-    setTimeout(() => {
-      // Consumir la petición a iTunes
-      const itunesReq = httpMock.expectOne('https://itunes.apple.com/search?term=music&limit=100');
-      itunesReq.flush({ results: [] });
-      
-      // Y la petición batch
-      const batchReq = httpMock.expectOne(`${environment.backendUrl}/songs/batch`);
-      batchReq.flush({ success: true, data: [] });
-      
-      // Consumir cualquier petición adicional al backend
-      const pendingBackend = httpMock.match(`${environment.backendUrl}/songs`);
-      pendingBackend.forEach(req => req.flush([]));
-      done();
-    });
+    (service as any).__originalLoadCatalogue.call(service);
+    httpMock.expectOne(`${environment.backendUrl}/songs?limit=100`).flush({ items: mockSongs, nextCursor: 'abc' });
+    httpMock.expectOne(`${environment.backendUrl}/songs/facets`).flush({ genres: ['Rock', 'Pop'], artists: ['Artista 1'] });
+    httpMock.expectOne('https://itunes.apple.com/search?term=music&limit=100').flush({ results: [] });
+    httpMock.expectOne(`${environment.backendUrl}/songs/batch`).flush({ success: true, data: [itunesSong] });
+    httpMock.expectOne(`${environment.backendUrl}/songs/facets`).flush({ genres: ['Rock', 'Pop'], artists: ['Artista 1'] });
+    //Assert solo la primera página: el resto se pide bajo demanda
+    expect(service['songsSubject'].getValue().map(song => song.trackId)).toEqual([2, 1]);
+    expect(service.getGenres()).toEqual(['Pop', 'Rock']);
+    expect(service.hasMoreSongs()).toBeTrue();
+    expect(changes).toBe(1);
   });
 
-  it('debería manejar error al cargar canciones del backend', (done) => {
+  it('debería seguir con iTunes si falla la primera página del backend', () => {
     //Arrange
-    service['songsSubject'].next([]);
-    service['allGenresSubject'].next([]);
-    service['allArtistsSubject'].next([]);
-    (service as any).__originalLoadAllSongs.call(service);
-    
+    (service as any).__originalLoadCatalogue.call(service);
     //Act
-    // Primera petición al backend que fallará
-    const req = httpMock.expectOne(`${environment.backendUrl}/songs`);
-    req.error(new ErrorEvent('Error')); // Simula error
-    
-    // Dar tiempo para que se procesen los errores
-    setTimeout(() => {
-      // Aún necesitamos consumir la petición a iTunes
-      const itunesReq = httpMock.expectOne('https://itunes.apple.com/search?term=music&limit=100');
-      itunesReq.flush({ results: [] });
-      
-      // Y la petición batch
-      const batchReq = httpMock.expectOne(`${environment.backendUrl}/songs/batch`);
-      batchReq.flush({ success: true, data: [] });
-      
-      // Consumir cualquier petición adicional al backend
-      const pendingBackend = httpMock.match(`${environment.backendUrl}/songs`);
-      pendingBackend.forEach(req => req.flush([]));
-
-      done();
-    });
+    httpMock.expectOne(`${environment.backendUrl}/songs?limit=100`).error(new ErrorEvent('Error'));
+    httpMock.expectOne(`${environment.backendUrl}/songs/facets`).error(new ErrorEvent('Error'));
+    httpMock.expectOne('https://itunes.apple.com/search?term=music&limit=100').flush({ results: [] });
+    httpMock.expectOne(`${environment.backendUrl}/songs/batch`).flush({ success: true, data: [] });
+    httpMock.expectOne(`${environment.backendUrl}/songs/facets`).flush({ genres: [], artists: [] });
+    //Assert
+    expect(service['songsSubject'].getValue()).toEqual([]);
   });
 
   it('debería cargar canciones de iTunes', () => {
@@ -135,17 +99,79 @@ describe('MusicService', () => {
     batchReq.flush({ success: true, data: [] });
   });
 
-  it('debería manejar error en _loadAllSongsFromBackend y devolver []', (done) => {
+  it('debería devolver [] si loadMoreSongs falla', (done) => {
     //Arrange
-    service['_loadAllSongsFromBackend']().subscribe(songs => { //Act
+    service.loadMoreSongs().subscribe(songs => { //Act
       //Assert
       expect(songs).toEqual([]);
       done();
     });
-    const req = httpMock.expectOne(`${environment.backendUrl}/songs`);
+    const req = httpMock.expectOne(`${environment.backendUrl}/songs?limit=100`);
     req.error(new ErrorEvent('fail'));
   });
 
+  it('debería pedir la siguiente página con el cursor y parar en nextCursor null', () => {
+    //Arrange
+    const second = { ...mockSongs[0], trackId: 2 };
+    //Act
+    service.loadMoreSongs().subscribe();
+    httpMock.expectOne(`${environment.backendUrl}/songs?limit=100`).flush({ items: mockSongs, nextCursor: 'abc' });
+    service.loadMoreSongs().subscribe();
+    httpMock.expectOne(`${environment.backendUrl}/songs?limit=100&cursor=abc`).flush({ items: [second], nextCursor: null });
+    service.loadMoreSongs().subscribe();
+    //Assert no hay tercera petición
+    expect(service.hasMoreSongs()).toBeFalse();
+    expect(service['songsSubject'].getValue().map(song => song.trackId)).toEqual([1, 2]);
+  });
+
+  it('debería enviar la búsqueda y los filtros a GET /songs', () => {
+    //Act
+    service.findSongs({ q: ' amor ', artists: ['A', 'B'], genres: ['Pop'], year: '2020' }, 'abc').subscribe(page => {
+      //Assert
+      expect(page.items).toEqual(mockSongs);
+    });
+    const req = httpMock.expectOne(request => request.url === `${environment.backendUrl}/songs`);
+    //Assert
+    expect(req.request.params.get('q')).toBe('amor');
+    expect(req.request.params.getAll('artist')).toEqual(['A', 'B']);
+    expect(req.request.params.getAll('genre')).toEqual(['Pop']);
+    expect(req.request.params.get('year')).toBe('2020');
+    expect(req.request.params.get('cursor')).toBe('abc');
+    req.flush({ items: mockSongs, nextCursor: null });
+  });
+
+  it('debería pedir por id solo las canciones que no están en caché', () => {
+    //Arrange
+    const second = { ...mockSongs[0], trackId: 2 };
+    service['songsSubject'].next(mockSongs);
+    let found: Song[] = [];
+    //Act
+    service.getSongsByIds([2, 1, 2]).subscribe(songs => found = songs);
+    httpMock.expectOne(`${environment.backendUrl}/songs?ids=2&limit=1`).flush({ items: [second], nextCursor: null });
+    //Assert en el orden pedido y sin repetir
+    expect(found).toEqual([second, mockSongs[0]]);
+  });
+
+  it('debería devolver las del caché sin peticiones si ya están todas', () => {
+    //Arrange
+    service['songsSubject'].next(mockSongs);
+    let found: Song[] = [];
+    //Act
+    service.getSongsByIds([1]).subscribe(songs => found = songs);
+    //Assert
+    expect(found).toEqual(mockSongs);
+  });
+
+  it('debería añadir las páginas al final del caché', () => {
+    //Arrange
+    const second = { ...mockSongs[0], trackId: 2 };
+    service['songsSubject'].next([mockSongs[0]]);
+    //Act
+    service['appendSongsToCache']([mockSongs[0], second]);
+    //Assert
+    expect(service['songsSubject'].getValue().map(song => song.trackId)).toEqual([1, 2]);
+  });
+
   it('debería guardar canciones en el backend con éxito', (done) => {
     //Arrange
     const mock = [mockSongs[0]];
@@ -298,8 +324,8 @@ describe('MusicService', () => {
     expect(service['songsSubject'].getValue().length).toBe(1);
   });
 
-  it('debería cubrir loadAllSongs catchError', () => {
-    spyOn(service as any, '_loadAllSongsFromBackend').and.throwError('fail');
-    (service as any).loadAllSongs(); // debería atrapar el error
+  it('debería cubrir loadCatalogue catchError', () => {
+    spyOn(service, 'loadMoreSongs').and.returnValue(throwError(() => new Error('fail')));
+    (service as any).__originalLoadCatalogue.call(service); // debería atrapar el error
   });
-});
+});
\ No newline at end of file
@@ -1,8 +1,8 @@
 import { Injectable } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { HttpClient, HttpParams } from '@angular/common/http';
 import { map, tap, catchError, switchMap } from 'rxjs/operators';
-import { BehaviorSubject, Observable, of, throwError } from 'rxjs';
-import { Song } from '../shared/interfaces/song.interface';
+import { BehaviorSubject, Observable, Subject, forkJoin, of, throwError } from 'rxjs';
+import { Song, SongFacets, SongSearch, SongsPage } from '../shared/interfaces/song.interface';
 import { environment } from '../../environments/environment';
 
 @Injectable({
@@ -10,6 +10,7 @@ import { environment } from '../../environments/environment';
 })
 export class MusicService {
   private readonly apiUrl = 'https://itunes.apple.com';
+  private readonly backendPageSize = 100;
   private readonly songsSubject = new BehaviorSubject<Song[]>([]);
   public songs$ = this.songsSubject.asObservable();
 
@@ -19,55 +20,117 @@ export class MusicService {
   private readonly allArtistsSubject = new BehaviorSubject<string[]>([]);
   public artists$ = this.allArtistsSubject.asObservable();
 
+  // Cursor de la siguiente página del catálogo: undefined antes de la primera, null tras la última
+  private catalogueCursor: string | null | undefined = undefined;
+  private readonly catalogueChangedSubject = new Subject<void>();
+  // Emite cuando se han importado canciones nuevas: las páginas repiten su búsqueda
+  public catalogueChanged$ = this.catalogueChangedSubject.asObservable();
+
   constructor(private readonly http: HttpClient) {
-    this.loadAllSongs();
-  }
-
-  private loadAllSongs(): void {
-    console.log('Iniciando carga de todas las canciones...');
-    // Paso 1: Cargar todas las canciones que ya están en el backend (Supabase)
-    this._loadAllSongsFromBackend().pipe(
-      tap(backendSongs => {
-        console.log(`Canciones cargadas inicialmente desde el backend: ${backendSongs.length}`);
-        // Actualizar el caché y los sujetos con las canciones existentes del backend
-        this.addSongsToCache(backendSongs);
-        this.updateGenresAndArtists(backendSongs);
-      }),
-      // Paso 2: Después de cargar las canciones del backend, proceder con las de iTunes
+    this.loadCatalogue();
+  }
+
+  private loadCatalogue(): void {
+    // Paso 1: la primera página del catálogo y los géneros y artistas de los filtros;
+    // el resto de páginas se piden cuando la interfaz las necesita (loadMoreSongs, findSongs)
+    this.loadMoreSongs().pipe(
+      switchMap(() => this.loadFacets()),
+      // Paso 2: canciones de iTunes, guardadas en el backend
       switchMap(() => {
         console.log('Procediendo a cargar canciones de iTunes...');
-        return this.loadItunesSongs().pipe(
-          tap(itunesSongsProcessed => {
-            console.log(`Canciones de iTunes procesadas y enviadas al backend: ${itunesSongsProcessed.length}`);
-          }),
-          // Paso 3: Después de que las canciones de iTunes se hayan procesado y guardado en el backend,
-          // volver a cargar TODAS las canciones del backend para asegurar que la UI tenga los datos más recientes.
-          switchMap(() => {
-            console.log('Volviendo a cargar todas las canciones del backend para sincronización final...');
-            return this._loadAllSongsFromBackend();
-          }),
-          tap(finalSongs => {
-            console.log(`Carga final de canciones (backend + iTunes): ${finalSongs.length}`);
-            // Actualizar el caché y los sujetos con la lista combinada final
-            this.addSongsToCache(finalSongs);
-            this.updateGenresAndArtists(finalSongs);
-          })
-        );
+        return this.loadItunesSongs();
+      }),
+      tap(itunesSongsProcessed => {
+        console.log(`Canciones de iTunes procesadas y enviadas al backend: ${itunesSongsProcessed.length}`);
+        this.addSongsToCache(itunesSongsProcessed);
       }),
+      // Paso 3: refrescar los filtros y avisar a las páginas, sin volver a descargar el catálogo
+      switchMap(() => this.loadFacets()),
+      tap(() => this.catalogueChangedSubject.next()),
       catchError(err => {
-        console.error('Error en la secuencia de carga de todas las canciones:', err);
-        return of(null); // Retorna un observable de null para completar el stream con gracia.
+        console.error('Error en la secuencia de carga del catálogo:', err);
+        return of(null);
       })
     ).subscribe();
   }
 
-  // Nuevo método para cargar TODAS las canciones del backend
-  private _loadAllSongsFromBackend(): Observable<Song[]> {
-    console.log('Realizando petición GET a:', `${environment.backendUrl}/songs`);
-    return this.http.get<Song[]>(`${environment.backendUrl}/songs`).pipe(
+  // Siguiente página del catálogo completo hacia el caché (songs$); [] si ya no quedan
+  loadMoreSongs(): Observable<Song[]> {
+    if (this.catalogueCursor === null) {
+      return of([]);
+    }
+    return this.findSongs({}, this.catalogueCursor).pipe(
+      tap(page => this.catalogueCursor = page.nextCursor),
+      map(page => page.items),
+      catchError(err => {
+        console.error('Error al cargar canciones desde el backend:', err);
+        return of([]);
+      })
+    );
+  }
+
+  hasMoreSongs(): boolean {
+    return this.catalogueCursor !== null;
+  }
+
+  // Una página de GET /songs?q=&artist=&genre=&year=; la búsqueda y los filtros los resuelve el backend
+  findSongs(search: SongSearch = {}, cursor?: string): Observable<SongsPage> {
+    let params = new HttpParams().set('limit', this.backendPageSize);
+    if (cursor) {
+      params = params.set('cursor', cursor);
+    }
+    if (search.q?.trim()) {
+      params = params.set('q', search.q.trim());
+    }
+    for (const artist of search.artists ?? []) {
+      params = params.append('artist', artist);
+    }
+    for (const genre of search.genres ?? []) {
+      params = params.append('genre', genre);
+    }
+    if (search.year) {
+      params = params.set('year', search.year);
+    }
+    return this.http.get<SongsPage>(`${environment.backendUrl}/songs`, { params }).pipe(
+      tap(page => this.appendSongsToCache(page.items))
+    );
+  }
+
+  // Canciones concretas (playlists, valoraciones, perfil): las del caché y el resto con GET /songs?ids=
+  getSongsByIds(trackIds: number[]): Observable<Song[]> {
+    const wanted = [...new Set(trackIds)];
+    const cached = new Map(this.songsSubject.getValue().map(song => [song.trackId, song] as const));
+    const missing = wanted.filter(trackId => !cached.has(trackId));
+    const requests: Observable<Song[]>[] = [];
+    for (let start = 0; start < missing.length; start += this.backendPageSize) {
+      const ids = missing.slice(start, start + this.backendPageSize);
+      const params = new HttpParams().set('ids', ids.join(',')).set('limit', ids.length);
+      requests.push(this.http.get<SongsPage>(`${environment.backendUrl}/songs`, { params }).pipe(map(page => page.items)));
+    }
+    const pages$: Observable<Song[][]> = requests.length ? forkJoin(requests) : of([]);
+    return pages$.pipe(
+      map(pages => pages.flat()),
+      tap(found => this.appendSongsToCache(found)),
+      catchError(err => {
+        console.error('Error al cargar canciones por id desde el backend:', err);
+        return of([]);
+      }),
+      map(found => {
+        const byId = new Map([...cached, ...found.map(song => [song.trackId, song] as const)]);
+        return wanted.map(trackId => byId.get(trackId)).filter((song): song is Song => song !== undefined);
+      })
+    );
+  }
+
+  private loadFacets(): Observable<SongFacets> {
+    return this.http.get<SongFacets>(`${environment.backendUrl}/songs/facets`).pipe(
+      tap(facets => {
+        this.allGenresSubject.next([...facets.genres].sort((a, b) => a.localeCompare(b)));
+        this.allArtistsSubject.next([...facets.artists].sort((a, b) => a.localeCompare(b)));
+      }),
       catchError(err => {
-        console.error('Error al cargar TODAS las canciones desde el backend:', err);
-        return of([]); // Retorna un array vacío en caso de error
+        console.error('Error al cargar géneros y artistas desde el backend:', err);
+        return of({ genres: [], artists: [] });
       })
     );
   }
@@ -114,7 +177,7 @@ export class MusicService {
     );
   }
 
-  // Este método ya no es usado directamente en loadAllSongs, pero se mantiene si lo usas en otro lado.
+  // Este método ya no es usado directamente en loadCatalogue, pero se mantiene si lo usas en otro lado.
   private loadUploadedSongs(): Observable<Song[]> {
     console.log('Cargando canciones subidas por el usuario...');
     return this.http.get<Song[]>(`${environment.backendUrl}/songs?isUserUpload=true`).pipe(
@@ -199,6 +262,15 @@ export class MusicService {
     console.log(`Canciones en caché después de la actualización: ${uniqueSongs.length}`);
   }
 
+  private appendSongsToCache(songsToAdd: Song[]): void {
+    const currentSongs = this.songsSubject.getValue();
+    const existingIds = new Set(currentSongs.map(s => s.trackId));
+    const newSongs = songsToAdd.filter(song => !existingIds.has(song.trackId));
+    if (newSongs.length > 0) {
+      this.songsSubject.next([...currentSongs, ...newSongs]);
+    }
+  }
+
   private mergeSongsWithoutDuplicates(existing: Song[], newSongs: Song[]): Song[] {
     const existingIds = new Set(existing.map(s => s.trackId));
     const filteredNew = newSongs.filter(song => !existingIds.has(song.trackId));
@@ -0,0 +1,27 @@
+// Usuario de una página de GET /users/:id/followers | /users/:id/following
+export interface FollowListItem {
+    id: string;
+    username: string;
+    email: string;
+    premium: boolean;
+    followersCount: number;
+    followingCount: number;
+    followedAt: string;
+}
+
+export interface FollowsPage {
+    items: FollowListItem[]; // del seguimiento más reciente al más antiguo
+    nextCursor: string | null; // null en la última página
+}
+
+// Respuesta de PUT /users/:id/follow
+export interface FollowToggleResult {
+    id: string;
+    username: string;
+    email: string;
+    premium: boolean;
+    followersCount: number;
+    followingCount: number;
+    targetEmail: string;
+    isFollowing: boolean;
+}
@@ -9,4 +9,24 @@ export interface Song {
   isUserUpload: boolean;
   collectionId: number;
   artistId: number;
-}
\ No newline at end of file
+}
+
+// Página de GET /songs?limit=&cursor= (nextCursor es null en la última)
+export interface SongsPage {
+  items: Song[];
+  nextCursor: string | null;
+}
+
+// Búsqueda de GET /songs: texto (título o artista) y filtros del menú
+export interface SongSearch {
+  q?: string;
+  artists?: string[];
+  genres?: string[];
+  year?: string;
+}
+
+// GET /songs/facets: opciones de los filtros sin descargar el catálogo
+export interface SongFacets {
+  genres: string[];
+  artists: string[];
+}
@@ -2,6 +2,6 @@ export interface UserProfile {
     username?: string | null;
     email?: string | null;
     premium?: boolean | null;
-    followers?: string[]| null;
-    following?: string[]| null;
+    followersCount?: number | null;
+    followingCount?: number | null;
 }
\ No newline at end of file
@@ -4,6 +4,6 @@ export interface User {
     email: string;
     password: string;
     premium?: boolean;
-    followers?: string[];
-    following?: string[];
+    followersCount?: number;
+    followingCount?: number;
 }